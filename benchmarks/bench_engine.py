@@ -0,0 +1,58 @@
+import time
+
+from harness import benchmark, percentiles
+
+
+@benchmark("recorder.on_move", (100_000,))
+def recorder_on_move(size):
+    """Cost of the mouse hook itself, fed synthetic move events without pynput."""
+    from core.recorder import Recorder
+
+    recorder = Recorder()
+    recorder._begin(record_movements=True)   # consumer thread, no OS listener
+    on_move = recorder._on_move
+
+    start = time.perf_counter()
+    for i in range(size):
+        on_move(i % 1920, (i * 3) % 1080)
+    elapsed = time.perf_counter() - start
+    entries = recorder.stop()
+    stats = recorder.stats()
+    return {
+        "events_per_s": round(size / elapsed),
+        "ns_per_event": round(elapsed / size * 1e9),
+        "hook_mean_us": stats["hook_mean_us"],
+        "hook_max_us": stats["hook_max_us"],
+        "dropped": stats["dropped"],
+        "entries": len(entries),
+    }
+
+
+@benchmark("player.jitter", (500,))
+def player_jitter(size):
+    """
+    Play `size` clicks 2ms apart against the in-memory backend and measure how
+    far each click's spacing strays from the schedule.
+    """
+    from core.backends import MemoryBackend
+    from core.player import Player
+    from core.script import ClickEntry, Script
+
+    interval = 0.002
+    script = Script("bench")
+    script.steps = [
+        ClickEntry(x=i, y=i, click_type="left", delay_before=interval, move_to=False)
+        for i in range(size)
+    ]
+    backend = MemoryBackend()
+    player = Player(backend)
+    player.start(script)
+    player.wait()
+
+    times = [t for t, _, _, _ in backend.events]
+    expected_ns = interval * 1e9
+    jitter_us = [abs((b - a) - expected_ns) / 1e3 for a, b in zip(times, times[1:])]
+    result = {f"jitter_{k}_us": round(v, 1) for k, v in percentiles(jitter_us).items()}
+    late = player.telemetry.summary()["late"]
+    result.update(steps=late["count"], mean_late_ms=late["mean_ms"], max_late_ms=late["max_ms"])
+    return result
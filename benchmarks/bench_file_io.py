@@ -0,0 +1,33 @@
+import os
+import tempfile
+
+from harness import benchmark, make_steps, timed
+
+SIZES = (1_000, 100_000, 1_000_000)
+FORMATS = {
+    "json": {"binary": False},
+    "binary": {"binary": True, "compress": True},
+    "binary_raw": {"binary": True, "compress": False},
+}
+
+
+def _save_load(size, fmt):
+    from core.script import Script
+    from utils.file_io import load_script, save_script
+
+    script = Script("bench")
+    script.steps = make_steps(size)
+    options = FORMATS[fmt]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.ghostclick")
+        save = timed(lambda: save_script(script, path, **options), repeat=2)
+        load = timed(lambda: load_script(path, mapped=False), repeat=2)
+        return {
+            "save_best_s": save["best_s"],
+            "load_best_s": load["best_s"],
+            "file_bytes": os.path.getsize(path),
+        }
+
+
+for _fmt in FORMATS:
+    benchmark(f"file_io.{_fmt}", SIZES)(lambda size, fmt=_fmt: _save_load(size, fmt))
@@ -0,0 +1,75 @@
+from harness import benchmark, make_steps, timed
+
+SIZES = (1_000, 100_000, 1_000_000)
+
+
+@benchmark("script.to_dict", SIZES)
+def script_to_dict(size):
+    from core.script import Script
+
+    script = Script("bench")
+    script.steps = make_steps(size)
+    result = timed(script.to_dict)
+    result["steps_per_s"] = round(size / result["best_s"])
+    return result
+
+
+@benchmark("script.from_dict", SIZES)
+def script_from_dict(size):
+    from core.script import Script
+
+    script = Script("bench")
+    script.steps = make_steps(size)
+    data = script.to_dict()
+    result = timed(lambda: Script.from_dict(data))
+    result["steps_per_s"] = round(size / result["best_s"])
+    return result
+
+
+@benchmark("script.snapshot", SIZES)
+def script_snapshot(size):
+    from core.script import Script
+
+    script = Script("bench")
+    script.steps = make_steps(size)
+    return timed(script.snapshot, repeat=5)
+
+
+@benchmark("script.undo_redo", (1_000, 100_000))
+def script_undo_redo(size):
+    """Edit near the middle of a script of `size` steps, then undo and redo it all."""
+    from core.script import ClickEntry, Script
+
+    edits = 200
+
+    def setup():
+        script = Script("bench")
+        script.steps = make_steps(size)
+        for n in range(edits):
+            script.add_step(ClickEntry(x=n), index=size // 2)
+        return script
+
+    def undo_redo(script):
+        while script.undo():
+            pass
+        while script.redo():
+            pass
+
+    result = timed(undo_redo, setup=setup)
+    result["ops_per_s"] = round(2 * edits / result["best_s"])
+    return result
+
+
+@benchmark("click_list.group_steps", SIZES)
+def group_steps(size):
+    # ClickList only builds start indices with group_starts; group_steps is
+    # the entry-list version it replaced
+    from core.pathing import group_starts, group_steps
+
+    steps = make_steps(size)
+    grouped = timed(lambda: group_steps(steps))
+    starts = timed(lambda: group_starts(e.click_type for e in steps))
+    return {
+        "group_steps_best_s": grouped["best_s"],
+        "group_starts_best_s": starts["best_s"],
+    }
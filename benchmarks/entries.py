@@ -0,0 +1,121 @@
+# ClickEntry memory / throughput benchmark: the old @dataclass entry vs the
+# current slotted one.
+#
+#   python benchmarks/entries.py                 # 200k entries
+#   python benchmarks/entries.py --count 1000000 --json
+#
+# Memory is measured with tracemalloc while building a list of entries that
+# looks like a recording (mostly moves, a few labelled clicks).
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+from dataclasses import dataclass, asdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.script import ClickEntry  # noqa: E402
+
+
+@dataclass
+class LegacyClickEntry:
+    """ClickEntry as it was before it became slotted, kept for comparison."""
+    x: int = 0
+    y: int = 0
+    click_type: str = "left"
+    delay_before: float = 0.5
+    return_cursor: bool = False
+    label: str = ""
+    move_to: bool = True
+    path: array | None = None
+    easing: str = "linear"
+
+    def to_dict(self):
+        data = asdict(self)
+        if self.path is None:
+            del data["path"]
+            del data["easing"]
+        else:
+            data["path"] = self.path.tolist()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        filtered = {k: v for k, v in data.items() if k in known_fields}
+        if filtered.get("path") is not None:
+            filtered["path"] = array("d", filtered["path"])
+        return cls(**filtered)
+
+
+def sample_dicts(count: int) -> list[dict]:
+    out = []
+    for i in range(count):
+        click_type = "left" if i % 20 == 0 else "move"
+        out.append({
+            "x": i % 1920, "y": (i * 7) % 1080,
+            "click_type": click_type,
+            # labels come from json.loads, so equal labels are distinct strings
+            "label": "".join(["step", " ", "label"]) if i % 50 == 0 else "",
+            "delay_before": 0.008, "return_cursor": False, "move_to": True,
+        })
+    return out
+
+
+def measure(cls, dicts: list[dict]) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    entries = [cls.from_dict(d) for d in dicts]
+    from_dict_s = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for e in entries:
+        e.to_dict()
+    to_dict_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for d in dicts:
+        cls(d["x"], d["y"], d["click_type"], d["delay_before"])
+    construct_s = time.perf_counter() - start
+
+    n = len(dicts)
+    return {
+        "bytes_per_entry": round(current / n, 1),
+        "from_dict_per_s": round(n / from_dict_s),
+        "to_dict_per_s": round(n / to_dict_s),
+        "construct_per_s": round(n / construct_s),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ClickEntry memory/throughput benchmark")
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    dicts = sample_dicts(args.count)
+    result = {
+        "count": args.count,
+        "legacy": measure(LegacyClickEntry, dicts),
+        "slotted": measure(ClickEntry, dicts),
+    }
+    legacy, slotted = result["legacy"], result["slotted"]
+    result["ratio"] = {key: round(slotted[key] / legacy[key], 2) for key in legacy}
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"{args.count:,} entries")
+    print(f"  {'':18}{'legacy':>12}{'slotted':>12}{'ratio':>8}")
+    for key in legacy:
+        print(f"  {key:18}{legacy[key]:>12,}{slotted[key]:>12,}{result['ratio'][key]:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Tiny asv-style harness shared by the bench_*.py modules. A benchmark is a
+# function registered with @benchmark; it is called once per size and returns
+# a flat dict of metrics (seconds, rates, bytes...). run.py collects them.
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+REGISTRY: dict[str, tuple] = {}     # name -> (function, default sizes)
+
+
+def benchmark(name: str, sizes=(None,)):
+    def register(fn):
+        REGISTRY[name] = (fn, tuple(sizes))
+        return fn
+    return register
+
+
+def timed(fn, repeat: int = 3, setup=None) -> dict:
+    """Best and median wall time of fn() over repeat runs; setup() runs untimed before each."""
+    times = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        fn(arg) if setup else fn()
+        times.append(time.perf_counter() - start)
+    return {"best_s": min(times), "median_s": statistics.median(times)}
+
+
+def percentiles(values, points=(50, 95, 99)) -> dict:
+    """pNN and max of a list of numbers (nearest-rank)."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    out = {}
+    for p in points:
+        rank = max(0, min(len(ordered) - 1, round(p / 100 * len(ordered)) - 1))
+        out[f"p{p}"] = ordered[rank]
+    out["max"] = ordered[-1]
+    return out
+
+
+def make_steps(count: int, move_ratio: int = 20):
+    """Synthetic recording: mostly moves with a click every move_ratio steps."""
+    from core.script import ClickEntry
+
+    steps = []
+    for i in range(count):
+        click_type = "left" if i % move_ratio == 0 else "move"
+        steps.append(ClickEntry(
+            x=i % 1920, y=(i * 7) % 1080, click_type=click_type,
+            delay_before=0.008, label="step" if i % 500 == 0 else "",
+        ))
+    return steps
@@ -0,0 +1,99 @@
+# Benchmark suite for the engine hot paths.
+#
+#   python benchmarks/run.py                          # everything, JSON to stdout
+#   python benchmarks/run.py --only file_io --sizes 1000,100000
+#   python benchmarks/run.py -o before.json           # save results for later
+#   python benchmarks/run.py --compare before.json    # ratios vs a saved run
+#
+# Each bench_*.py module registers functions with harness.benchmark; every
+# function runs once per size and returns flat metrics.
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+import time
+
+import harness
+
+MODULES = ("bench_script", "bench_file_io", "bench_engine")
+
+
+def git_revision() -> str:
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=harness.ROOT, capture_output=True, text=True, timeout=10,
+        )
+        return proc.stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+def run(only: list[str], sizes: set[int] | None) -> dict:
+    for module in MODULES:
+        importlib.import_module(module)
+
+    results = {}
+    for name, (fn, default_sizes) in harness.REGISTRY.items():
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        for size in default_sizes:
+            if sizes is not None and size is not None and size not in sizes:
+                continue
+            key = name if size is None else f"{name}[{size}]"
+            print(f"running {key}", file=sys.stderr, flush=True)
+            try:
+                results[key] = fn(size)
+            except Exception as e:   # one broken benchmark shouldn't lose the rest
+                results[key] = {"error": f"{type(e).__name__}: {e}"}
+    return results
+
+
+def compare(current: dict, baseline: dict) -> dict:
+    """current / baseline for every numeric metric both runs have."""
+    ratios = {}
+    for key, metrics in current.items():
+        old = baseline.get(key, {})
+        for metric, value in metrics.items():
+            before = old.get(metric)
+            if isinstance(value, (int, float)) and isinstance(before, (int, float)) and before:
+                ratios.setdefault(key, {})[metric] = round(value / before, 3)
+    return ratios
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GhostClick engine benchmarks")
+    parser.add_argument("--only", default="", help="comma-separated benchmark name prefixes")
+    parser.add_argument("--sizes", default="", help="comma-separated step counts to run")
+    parser.add_argument("-o", "--output", help="write JSON here instead of stdout")
+    parser.add_argument("--compare", help="JSON from an earlier run to compare against")
+    args = parser.parse_args()
+
+    only = [p for p in args.only.split(",") if p]
+    sizes = {int(s) for s in args.sizes.split(",") if s} or None
+
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": run(only, sizes),
+    }
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["baseline_revision"] = baseline.get("revision")
+        report["ratio"] = compare(report["results"], baseline.get("results", {}))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Startup benchmark for the GUI entry point.
+#
+#   python benchmarks/startup.py            # import-time breakdown + window-visible time
+#   python benchmarks/startup.py --json     # same, machine readable
+#
+# Import cost comes from `python -X importtime`; the window-visible time comes
+# from running main.py with GHOSTCLICK_STARTUP_PROBE set, which makes it print
+# how long it took to map the window and then exit.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(target: str) -> dict[str, int]:
+    """Cumulative import time in microseconds per top-level package."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import failed")
+
+    totals: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        # "import time:   self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            cumulative = int(parts[1])
+        except ValueError:
+            continue
+        name = parts[2]
+        # only count top-level imports (no leading indentation) to avoid double counting
+        if name.startswith(" ") and not name.startswith("  "):
+            totals[name.strip()] = cumulative
+    return totals
+
+
+def window_visible_ms(runs: int) -> list[float]:
+    env = dict(os.environ, GHOSTCLICK_STARTUP_PROBE="1")
+    results = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "main.py"], cwd=ROOT, env=env,
+            capture_output=True, text=True, timeout=60,
+        )
+        for line in proc.stdout.splitlines():
+            if line.startswith("window-visible-ms"):
+                results.append(float(line.split()[1]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GhostClick startup benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target", default="ui.app_window",
+                        help="module whose import cost is measured")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    result = {"target": args.target}
+    try:
+        totals = import_times(args.target)
+        result["import_us"] = dict(sorted(totals.items(), key=lambda kv: -kv[1])[:args.top])
+        result["import_total_ms"] = sum(totals.values()) / 1000
+    except RuntimeError as e:
+        result["import_error"] = str(e)
+
+    visible = window_visible_ms(args.runs)
+    if visible:
+        result["window_visible_ms"] = {
+            "median": statistics.median(visible),
+            "min": min(visible),
+            "runs": len(visible),
+        }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    if "import_error" in result:
+        print(f"import {args.target}: {result['import_error']}")
+    else:
+        print(f"import {args.target}: {result['import_total_ms']:.1f} ms")
+        for name, us in result["import_us"].items():
+            print(f"  {us / 1000:8.1f} ms  {name}")
+    if visible:
+        w = result["window_visible_ms"]
+        print(f"window visible: median {w['median']:.1f} ms, min {w['min']:.1f} ms ({w['runs']} runs)")
+    else:
+        print("window visible: no measurement (needs a display)")
+
+
+if __name__ == "__main__":
+    main()
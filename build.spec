@@ -3,6 +3,12 @@
 import os
 
 block_cipher = None
+
+# GHOSTCLICK_ONEDIR=1 builds dist/GhostClick/ (exe + files next to it) instead of
+# a single exe. One-file builds unpack everything to a temp dir on every launch,
+# so the onedir variant starts noticeably faster.
+onedir = os.environ.get('GHOSTCLICK_ONEDIR', '') not in ('', '0')
+
 base_dir = os.path.dirname(os.path.abspath(SPEC))
 icon_path = os.path.join(base_dir, 'assets', 'icon.ico')
 
@@ -32,20 +38,12 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
+exe_options = dict(
     name='GhostClick',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -54,3 +52,34 @@ exe = EXE(
     entitlements_file=None,
     icon=icon_path if os.path.exists(icon_path) else None,
 )
+
+if onedir:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        **exe_options,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        strip=False,
+        upx=True,
+        upx_exclude=[],
+        name='GhostClick',
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        [],
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        **exe_options,
+    )
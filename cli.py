@@ -0,0 +1,383 @@
+# Headless command-line runner. Uses only core/ and utils/file_io so it never
+# pulls in customtkinter and works without a window (or a display, with --dry-run).
+import argparse
+import os
+import sys
+import time
+
+EXIT_OK = 0
+EXIT_PLAYBACK_ERROR = 1
+EXIT_LOAD_ERROR = 2
+EXIT_OUT_OF_BOUNDS = 3
+EXIT_INTERRUPTED = 130
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(prog="ghostclick", description="GhostClick headless runner")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="play a .ghostclick script without the GUI")
+    run.add_argument("script", help="path to a .ghostclick file")
+    run.add_argument("--repeat", type=int, default=None,
+                     help="number of loops, 0 = forever (default: the script's own setting)")
+    run.add_argument("--speed", type=float, default=1.0, help="speed multiplier (default 1.0)")
+    run.add_argument("--repeat-delay", type=float, default=0.0,
+                     help="seconds to wait between loops")
+    run.add_argument("--dry-run", action="store_true",
+                     help="walk the timeline without clicking (uses the in-memory backend)")
+    run.add_argument("--backend", choices=["pyautogui", "pynput", "memory"], default=None,
+                     help="input backend (default: pyautogui, or memory with --dry-run)")
+    run.add_argument("--quiet", action="store_true", help="only print the final summary")
+    run.add_argument("--ignore-timeline", action="store_true",
+                     help="time steps by their delays even if the script has a recorded timeline")
+    run.add_argument("--telemetry", metavar="PATH",
+                     help="write per-step timing to PATH (.csv, or .json with histograms)")
+    run.set_defaults(func=cmd_run)
+
+    convert = sub.add_parser("convert", help="convert a script between JSON and binary")
+    convert.add_argument("src", help="source .ghostclick file (either format)")
+    convert.add_argument("dst", help="destination .ghostclick file")
+    convert.add_argument("--to", choices=["binary", "json"], default="binary",
+                         help="output format (default: binary)")
+    convert.add_argument("--no-compress", action="store_true",
+                         help="store binary sections uncompressed")
+    convert.set_defaults(func=cmd_convert)
+
+    schedule = sub.add_parser("schedule", help="add, list or remove stored scheduled jobs")
+    schedule.add_argument("--store", default=None, help="job database (default: ~/.ghostclick/schedules.db)")
+    jobs = schedule.add_subparsers(dest="action", required=True)
+    add = jobs.add_parser("add", help="schedule a script (replaces a job with the same name)")
+    add.add_argument("name", help="job name")
+    add.add_argument("script", help="path to a .ghostclick file")
+    add.add_argument("when", nargs="+",
+                     help="'YYYY-MM-DD HH:MM[:SS]', 'every 15m' or a cron expression")
+    add.add_argument("--speed", type=float, default=1.0, help="speed multiplier (default 1.0)")
+    add.add_argument("--repeat", type=int, default=None,
+                     help="loops per run, 0 = forever (default: the script's own setting)")
+    add.add_argument("--misfire-grace", type=int, default=None, metavar="SECONDS",
+                     help="how late a run may still start (default 60)")
+    add.add_argument("--no-coalesce", action="store_true",
+                     help="after downtime, replay every missed run instead of just one")
+    jobs.add_parser("list", help="show stored jobs")
+    remove = jobs.add_parser("remove", help="delete a stored job")
+    remove.add_argument("name", help="job name")
+    schedule.set_defaults(func=cmd_schedule)
+
+    daemon = sub.add_parser("daemon", help="run stored scheduled jobs until interrupted")
+    daemon.add_argument("--store", default=None, help="job database (default: ~/.ghostclick/schedules.db)")
+    daemon.add_argument("--dry-run", action="store_true",
+                        help="walk each timeline without clicking (uses the in-memory backend)")
+    daemon.add_argument("--backend", choices=["pyautogui", "pynput", "memory"], default=None,
+                        help="input backend (default: pyautogui, or memory with --dry-run)")
+    daemon.set_defaults(func=cmd_daemon)
+
+    simulate = sub.add_parser("simulate", help="run a script instantly on a virtual clock and report its timeline")
+    simulate.add_argument("script", help="path to a .ghostclick file")
+    simulate.add_argument("--iterations", type=int, default=None,
+                          help="loops to simulate (default: the script's repeat count, 1 if it loops forever)")
+    simulate.add_argument("--speed", type=float, default=1.0, help="speed multiplier (default 1.0)")
+    simulate.add_argument("--repeat-delay", type=float, default=0.0,
+                          help="seconds between loops (default 0)")
+    simulate.add_argument("--screen", default=None, metavar="WxH",
+                          help="screen size to check against (default: pyautogui.size(), or 1920x1080)")
+    simulate.add_argument("--ignore-timeline", action="store_true",
+                          help="use per-step delays even if the script has a recorded timeline")
+    simulate.add_argument("--report", metavar="PATH",
+                          help="write every simulated action to PATH (.csv or .json)")
+    simulate.set_defaults(func=cmd_simulate)
+
+    return parser
+
+
+def cmd_run(args, started: float) -> int:
+    from core.player import Player
+    from utils.file_io import load_script
+
+    try:
+        script = load_script(args.script)
+    except Exception as e:
+        print(f"error: failed to load {args.script}: {e}", file=sys.stderr)
+        return EXIT_LOAD_ERROR
+
+    if not script.steps:
+        print(f"error: {args.script} has no steps", file=sys.stderr)
+        return EXIT_LOAD_ERROR
+
+    if args.repeat is not None:
+        script.repeat_count = max(0, args.repeat)
+    if args.speed <= 0:
+        print("error: --speed must be positive", file=sys.stderr)
+        return EXIT_LOAD_ERROR
+
+    backend = args.backend or ("memory" if args.dry_run else "pyautogui")
+    try:
+        player = Player(backend=backend)
+        player.backend   # build it now so a missing dependency fails before playback
+    except Exception as e:
+        print(f"error: could not start {backend} backend: {e}", file=sys.stderr)
+        return EXIT_PLAYBACK_ERROR
+
+    player.speed_multiplier = args.speed
+    player.repeat_delay = max(0.0, args.repeat_delay)
+    player.use_timeline = not args.ignore_timeline
+
+    n_steps = len(script.steps)
+    total_loops = script.repeat_count
+    loops_text = "forever" if total_loops == 0 else str(total_loops)
+    state = {"iteration": 0, "first_step": None, "error": None}
+
+    def on_step(index):
+        if state["first_step"] is None:
+            state["first_step"] = time.perf_counter()
+        if index == 0:
+            state["iteration"] += 1
+            if not args.quiet:
+                print(f"loop {state['iteration']}/{loops_text}", flush=True)
+
+    def on_error(msg):
+        state["error"] = msg
+
+    player.on_step_change = on_step
+    player.on_error = on_error
+
+    if not args.quiet:
+        mode = "dry run" if args.dry_run else backend
+        if player.use_timeline and script.timeline is not None:
+            mode += ", recorded timeline"
+        print(f"{script.name}: {n_steps} steps, {loops_text} loop(s), {args.speed:g}x ({mode})")
+
+    run_started = time.perf_counter()
+    player.start(script, dry_run=args.dry_run)
+    try:
+        while not player.wait(0.2):
+            pass
+    except KeyboardInterrupt:
+        player.stop()
+        player.wait()
+        print("interrupted", file=sys.stderr)
+        return EXIT_INTERRUPTED
+    elapsed = time.perf_counter() - run_started
+
+    timing = player.telemetry.summary()
+    if state["first_step"] is not None:
+        print(f"startup to first step: {(state['first_step'] - started) * 1000:.1f} ms")
+    # late = wait overshoot plus the backend call, the same figure the histogram lines use
+    print(
+        f"ran {timing['steps']} steps in {elapsed:.3f}s  "
+        f"(late: mean {timing['late']['mean_ms']:.3f} ms, max {timing['late']['max_ms']:.3f} ms)"
+    )
+    for name in ("late", "overshoot", "backend"):
+        h = timing[name]
+        if h["count"]:
+            print(
+                f"  {name:<9} p50 {h['p50_ms']:.3f}  p95 {h['p95_ms']:.3f}  "
+                f"p99 {h['p99_ms']:.3f}  max {h['max_ms']:.3f} ms"
+            )
+    if args.telemetry:
+        try:
+            player.telemetry.export(args.telemetry)
+            print(f"telemetry written to {args.telemetry}")
+        except OSError as e:
+            print(f"error: could not write telemetry: {e}", file=sys.stderr)
+
+    if state["error"]:
+        print(f"error: {state['error']}", file=sys.stderr)
+        return EXIT_PLAYBACK_ERROR
+    return EXIT_OK
+
+
+def cmd_convert(args, started: float) -> int:
+    from utils.file_io import convert_script
+
+    try:
+        dst = convert_script(
+            args.src, args.dst,
+            binary=args.to == "binary", compress=not args.no_compress,
+        )
+    except Exception as e:
+        print(f"error: failed to convert {args.src}: {e}", file=sys.stderr)
+        return EXIT_LOAD_ERROR
+
+    before, after = os.path.getsize(args.src), os.path.getsize(dst)
+    print(f"wrote {dst} ({before:,} -> {after:,} bytes, {before / max(1, after):.1f}x)")
+    return EXIT_OK
+
+
+def _format_time(timestamp: float | None) -> str:
+    from datetime import datetime
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S") if timestamp else "-"
+
+
+def cmd_schedule(args, started: float) -> int:
+    from core.scheduler import DEFAULT_MISFIRE_GRACE, ScheduledJob, ScriptScheduler, parse_when
+
+    scheduler = ScriptScheduler(args.store)
+    try:
+        if args.action == "add":
+            if args.speed <= 0:
+                print("error: --speed must be positive", file=sys.stderr)
+                return EXIT_LOAD_ERROR
+            if not os.path.isfile(args.script):
+                print(f"error: {args.script} does not exist", file=sys.stderr)
+                return EXIT_LOAD_ERROR
+            try:
+                trigger = parse_when(" ".join(args.when))
+            except ValueError as e:
+                print(f"error: {e}", file=sys.stderr)
+                return EXIT_LOAD_ERROR
+            job = ScheduledJob(
+                args.name, os.path.abspath(args.script), trigger,
+                speed=args.speed,
+                repeat=None if args.repeat is None else max(0, args.repeat),
+                misfire_grace=DEFAULT_MISFIRE_GRACE if args.misfire_grace is None
+                else max(1, args.misfire_grace),
+                coalesce=not args.no_coalesce,
+            )
+            scheduler.store.put(job.to_row())
+            print(f"scheduled {job.name}: {job.when}")
+        elif args.action == "remove":
+            if not scheduler.store.delete(args.name):
+                print(f"error: no job named {args.name!r}", file=sys.stderr)
+                return EXIT_LOAD_ERROR
+            print(f"removed {args.name}")
+        else:
+            jobs = scheduler.stored_jobs()
+            if not jobs:
+                print("no scheduled jobs")
+            for job in jobs:
+                print(
+                    f"{job.name:<16} {job.when:<28} next {_format_time(job.next_run)}  "
+                    f"last {_format_time(job.last_run)}  {job.script_path}"
+                )
+    except Exception as e:
+        print(f"error: job store unavailable: {e}", file=sys.stderr)
+        return EXIT_LOAD_ERROR
+    return EXIT_OK
+
+
+def cmd_daemon(args, started: float) -> int:
+    from core.player import Player
+    from core.scheduler import ScriptScheduler
+
+    backend = args.backend or ("memory" if args.dry_run else "pyautogui")
+    try:
+        player = Player(backend=backend)
+        player.backend
+    except Exception as e:
+        print(f"error: could not start {backend} backend: {e}", file=sys.stderr)
+        return EXIT_PLAYBACK_ERROR
+
+    def log(message, file=sys.stdout):
+        print(f"{_format_time(time.time())}  {message}", file=file, flush=True)
+
+    errors = []
+    player.on_error = errors.append
+
+    def on_run(job, script):
+        # the scheduler hands over runs one at a time, so the one Player is free
+        if job.repeat is not None:
+            script.repeat_count = job.repeat
+        player.speed_multiplier = job.speed
+        errors.clear()
+        log(f"{job.name}: running {script.name} ({len(script.steps)} steps)")
+        player.start(script, dry_run=args.dry_run)
+        player.wait()
+        if errors:
+            log(f"{job.name}: error: {errors[0]}", file=sys.stderr)
+        else:
+            stats = player.telemetry.summary()["late"]
+            log(f"{job.name}: done, {stats['count']} steps, late p99 {stats['p99_ms']:.3f} ms")
+
+    scheduler = ScriptScheduler(args.store)
+    scheduler.on_run = on_run
+    scheduler.on_error = lambda name, msg: log(f"{name}: error: {msg}", file=sys.stderr)
+    try:
+        scheduler.start()
+    except Exception as e:
+        print(f"error: could not start scheduler: {e}", file=sys.stderr)
+        return EXIT_LOAD_ERROR
+
+    if not scheduler.holds_lease:
+        log("another GhostClick instance is running the schedule; waiting for it to stop")
+    for job in scheduler.stored_jobs():
+        log(f"{job.name}: {job.when}, next {_format_time(job.next_run)}")
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        player.stop()
+        player.wait()
+        scheduler.shutdown()
+        log("stopped")
+    return EXIT_OK
+
+
+def cmd_simulate(args, started: float) -> int:
+    from core.simulation import simulate
+    from utils.file_io import load_script
+
+    try:
+        script = load_script(args.script)
+    except Exception as e:
+        print(f"error: failed to load {args.script}: {e}", file=sys.stderr)
+        return EXIT_LOAD_ERROR
+
+    if not script.steps:
+        print(f"error: {args.script} has no steps", file=sys.stderr)
+        return EXIT_LOAD_ERROR
+    if args.speed <= 0:
+        print("error: --speed must be positive", file=sys.stderr)
+        return EXIT_LOAD_ERROR
+    screen = None
+    if args.screen:
+        try:
+            width, height = (int(v) for v in args.screen.lower().split("x"))
+            screen = (width, height)
+        except ValueError:
+            print(f"error: --screen must look like 1920x1080, not {args.screen!r}", file=sys.stderr)
+            return EXIT_LOAD_ERROR
+
+    report = simulate(
+        script, iterations=args.iterations, speed=args.speed,
+        repeat_delay=args.repeat_delay, screen=screen,
+        use_timeline=not args.ignore_timeline,
+    )
+    summary = report.summary()
+    span = summary["iteration_s"]
+    print(
+        f"{script.name}: {summary['iterations']} loop(s), {summary['actions']} actions on "
+        f"{report.screen[0]}x{report.screen[1]} in {summary['wall_s'] * 1000:.1f} ms"
+        + (f" ({summary['iterations_per_s']:,} loops/s)" if summary["iterations_per_s"] else "")
+    )
+    print(
+        f"virtual time {summary['virtual_duration_s']:.3f}s  "
+        f"(per loop: min {span['min']:.3f}s, max {span['max']:.3f}s)"
+    )
+    for entry in summary["out_of_bounds"]:
+        print(
+            f"  step {entry['step'] + 1}: {entry['action']} at ({entry['x']}, {entry['y']}) is off-screen "
+            f"({entry['count']}x, first in loop {entry['first_iteration'] + 1})"
+        )
+    if args.report:
+        try:
+            report.export(args.report)
+            print(f"report written to {args.report}")
+        except OSError as e:
+            print(f"error: could not write report: {e}", file=sys.stderr)
+
+    if report.errors:
+        print(f"error: {report.errors[0]}", file=sys.stderr)
+        return EXIT_PLAYBACK_ERROR
+    if report.out_of_bounds:
+        return EXIT_OUT_OF_BOUNDS
+    return EXIT_OK
+
+
+def main(argv=None, started: float | None = None) -> int:
+    started = time.perf_counter() if started is None else started
+    args = _build_parser().parse_args(argv)
+    return args.func(args, started)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
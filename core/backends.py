@@ -0,0 +1,175 @@
+import time
+from typing import Protocol
+
+
+class FailSafeTriggered(Exception):
+    """Raised by a backend when its emergency abort fires (e.g. mouse in corner)."""
+
+
+class InputBackend(Protocol):
+    def move(self, x: int, y: int, duration: float = 0.0): ...
+    def click(self, x: int, y: int): ...
+    def double_click(self, x: int, y: int): ...
+    def triple_click(self, x: int, y: int): ...
+    def right_click(self, x: int, y: int): ...
+    def position(self) -> tuple[int, int]: ...
+
+
+class PyAutoGUIBackend:
+    """Default backend. Imports pyautogui on construction so core/ stays importable headless."""
+
+    def __init__(self):
+        import pyautogui
+        # keep pyautogui's failsafe on — moving to top-left corner aborts
+        pyautogui.FAILSAFE = True
+        pyautogui.PAUSE = 0
+        self._pg = pyautogui
+
+    def _call(self, fn, *args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except self._pg.FailSafeException as e:
+            raise FailSafeTriggered(str(e)) from e
+
+    def move(self, x, y, duration=0.0):
+        self._call(self._pg.moveTo, x, y, duration=duration)
+
+    def click(self, x, y):
+        self._call(self._pg.click, x, y)
+
+    def double_click(self, x, y):
+        self._call(self._pg.doubleClick, x, y)
+
+    def triple_click(self, x, y):
+        self._call(self._pg.tripleClick, x, y)
+
+    def right_click(self, x, y):
+        self._call(self._pg.rightClick, x, y)
+
+    def position(self):
+        x, y = self._pg.position()
+        return int(x), int(y)
+
+
+class PynputBackend:
+    """
+    Drives the cursor through pynput's Controller, skipping pyautogui's per-call
+    overhead. pynput has no failsafe of its own, so pyautogui's is copied: the
+    cursor sitting in a FAILSAFE_POINTS corner before an action aborts playback.
+    """
+
+    MOVE_STEP_INTERVAL = 0.01   # seconds between interpolated points for timed moves
+    FAILSAFE_POINTS = ((0, 0),)
+
+    def __init__(self):
+        from pynput import mouse
+        self._button = mouse.Button
+        self._mouse = mouse.Controller()
+        # set by the Player; a timed move it interrupts (stop, pause, seek) jumps to the end
+        self.wake_event = None
+
+    def _check_failsafe(self):
+        if self.position() in self.FAILSAFE_POINTS:
+            raise FailSafeTriggered("mouse moved to a corner")
+
+    def move(self, x, y, duration=0.0):
+        self._check_failsafe()
+        if duration > 0:
+            sx, sy = self._mouse.position
+            steps = max(1, int(duration / self.MOVE_STEP_INTERVAL))
+            for n in range(1, steps):
+                t = n / steps
+                self._mouse.position = (round(sx + (x - sx) * t), round(sy + (y - sy) * t))
+                if self.wake_event is None:
+                    time.sleep(self.MOVE_STEP_INTERVAL)
+                elif self.wake_event.wait(self.MOVE_STEP_INTERVAL):
+                    break
+                self._check_failsafe()
+        self._mouse.position = (x, y)
+
+    def _click(self, x, y, button, count: int):
+        self._check_failsafe()
+        self._mouse.position = (x, y)
+        self._mouse.click(button, count)
+
+    def click(self, x, y):
+        self._click(x, y, self._button.left, 1)
+
+    def double_click(self, x, y):
+        self._click(x, y, self._button.left, 2)
+
+    def triple_click(self, x, y):
+        self._click(x, y, self._button.left, 3)
+
+    def right_click(self, x, y):
+        self._click(x, y, self._button.right, 1)
+
+    def position(self):
+        x, y = self._mouse.position
+        return int(x), int(y)
+
+
+class MemoryBackend:
+    """
+    Records every action into a list instead of touching the OS.
+    Used for headless runs, CI verification and measuring engine throughput.
+    """
+
+    def __init__(self, width: int = 1920, height: int = 1080, clock=None):
+        self.size = (width, height)
+        self.events: list[tuple[int, str, int, int]] = []   # (t_ns, action, x, y)
+        self._x = 0
+        self._y = 0
+        self._clock = clock or time.perf_counter_ns     # ns timestamps for events
+
+    def _record(self, action, x, y):
+        self._x, self._y = x, y
+        self.events.append((self._clock(), action, x, y))
+
+    def move(self, x, y, duration=0.0):
+        self._record("move", x, y)
+
+    def click(self, x, y):
+        self._record("left", x, y)
+
+    def double_click(self, x, y):
+        self._record("double", x, y)
+
+    def triple_click(self, x, y):
+        self._record("triple", x, y)
+
+    def right_click(self, x, y):
+        self._record("right", x, y)
+
+    def position(self):
+        return self._x, self._y
+
+    def clear(self):
+        self.events.clear()
+
+    def throughput(self) -> float:
+        """Actions per second between the first and last recorded event."""
+        if len(self.events) < 2:
+            return 0.0
+        span = self.events[-1][0] - self.events[0][0]
+        return (len(self.events) - 1) / (span / 1e9) if span else float("inf")
+
+
+BACKENDS = {
+    "pyautogui": PyAutoGUIBackend,
+    "pynput": PynputBackend,
+    "memory": MemoryBackend,
+}
+
+
+def make_backend(backend: "str | InputBackend | None" = None) -> InputBackend:
+    """Accepts a backend instance, a name from BACKENDS, or None for pyautogui."""
+    if backend is None:
+        backend = "pyautogui"
+    if isinstance(backend, str):
+        try:
+            cls = BACKENDS[backend]
+        except KeyError:
+            raise ValueError(f"Unknown input backend: {backend}") from None
+        return cls()
+    return backend
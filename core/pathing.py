@@ -0,0 +1,192 @@
+import math
+from array import array
+from bisect import bisect_right
+
+from core.script import ClickEntry
+
+DEFAULT_TOLERANCE = 2.0          # max pixels a dropped sample may sit off the simplified path
+DEFAULT_TIME_TOLERANCE = 0.05    # max seconds a dropped sample's timing may drift
+
+# easing curves for path playback: map progress 0..1 to progress 0..1
+EASINGS = {
+    "linear": lambda p: p,
+    "ease_in": lambda p: p * p,
+    "ease_out": lambda p: 1 - (1 - p) * (1 - p),
+    "ease_in_out": lambda p: p * p * (3 - 2 * p),
+}
+
+
+def group_steps(steps: list[ClickEntry]):
+    """Group consecutive move entries. Returns list of (start_index, [entries])."""
+    groups = []
+    i = 0
+    while i < len(steps):
+        if steps[i].click_type == "move":
+            start = i
+            while i < len(steps) and steps[i].click_type == "move":
+                i += 1
+            groups.append((start, steps[start:i]))
+        else:
+            groups.append((i, [steps[i]]))
+            i += 1
+    return groups
+
+
+def group_starts(click_types) -> array:
+    """
+    First step index of each display group, from an iterable of click types.
+    Same grouping as group_steps, but without holding any entries.
+    """
+    starts = array("q")
+    prev_move = False
+    for i, click_type in enumerate(click_types):
+        is_move = click_type == "move"
+        if not (is_move and prev_move):
+            starts.append(i)
+        prev_move = is_move
+    return starts
+
+
+def moves_to_path(entries: list[ClickEntry], easing: str = "linear") -> ClickEntry:
+    """
+    Pack a run of move steps into one "path" step. The first move's delay
+    becomes the step's delay; the rest become per-point dt values.
+    """
+    first, last = entries[0], entries[-1]
+    path = array("d")
+    for n, e in enumerate(entries):
+        path.extend((e.x, e.y, 0.0 if n == 0 else e.delay_before))
+    labels = [e.label for e in entries if e.label]
+    return ClickEntry(
+        x=last.x, y=last.y, click_type="path",
+        delay_before=first.delay_before,
+        label=labels[0] if labels else "",
+        move_to=False,
+        path=path, easing=easing,
+    )
+
+
+def point_at(xs, ys, ts, t_ns: int) -> tuple[int, int]:
+    """Linearly interpolated cursor position t_ns into a compiled path."""
+    if t_ns <= ts[0]:
+        return xs[0], ys[0]
+    if t_ns >= ts[-1]:
+        return xs[-1], ys[-1]
+    i = bisect_right(ts, t_ns)
+    t0, t1 = ts[i - 1], ts[i]
+    frac = (t_ns - t0) / (t1 - t0) if t1 > t0 else 1.0
+    return (
+        round(xs[i - 1] + (xs[i] - xs[i - 1]) * frac),
+        round(ys[i - 1] + (ys[i] - ys[i - 1]) * frac),
+    )
+
+
+def _segment_error(px, py, pt, ax, ay, at, bx, by, bt, fallback_frac):
+    """Distance of p from segment a-b, and how far its time is from the linear estimate."""
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        frac = fallback_frac
+        dist = math.hypot(px - ax, py - ay)
+    else:
+        frac = ((px - ax) * dx + (py - ay) * dy) / length_sq
+        frac = min(1.0, max(0.0, frac))
+        dist = math.hypot(px - (ax + frac * dx), py - (ay + frac * dy))
+    expected_t = at + (bt - at) * frac
+    return dist, abs(pt - expected_t)
+
+
+def rdp_indices(xs, ys, ts, tolerance=DEFAULT_TOLERANCE,
+                time_tolerance=DEFAULT_TIME_TOLERANCE, keep=()) -> list[int]:
+    """
+    Ramer–Douglas–Peucker over (x, y) with an extra timing check: a sample is
+    also kept if its timestamp is further than time_tolerance from where a
+    constant-speed move along the simplified segment would put it.
+    Iterative so long recordings don't hit the recursion limit.
+    """
+    n = len(xs)
+    if n <= 2:
+        return list(range(n))
+
+    kept = [False] * n
+    kept[0] = kept[-1] = True
+    for i in keep:
+        kept[i] = True
+
+    # split at forced keeps first so each span is simplified independently
+    anchors = [i for i in range(n) if kept[i]]
+    stack = list(zip(anchors, anchors[1:]))
+    tol = tolerance if tolerance > 0 else 1e-9
+    ttol = time_tolerance if time_tolerance > 0 else float("inf")
+
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        worst, worst_i = 1.0, -1
+        for i in range(a + 1, b):
+            dist, tdev = _segment_error(
+                xs[i], ys[i], ts[i], xs[a], ys[a], ts[a], xs[b], ys[b], ts[b],
+                (i - a) / (b - a),
+            )
+            score = max(dist / tol, tdev / ttol)
+            if score > worst:
+                worst, worst_i = score, i
+        if worst_i >= 0:
+            kept[worst_i] = True
+            stack.append((a, worst_i))
+            stack.append((worst_i, b))
+
+    return [i for i in range(n) if kept[i]]
+
+
+def _simplify_run(run: list[ClickEntry], tolerance, time_tolerance) -> tuple[list, list[int]]:
+    xs = [e.x for e in run]
+    ys = [e.y for e in run]
+    ts = []
+    t = 0.0
+    for e in run:
+        t += e.delay_before
+        ts.append(t)
+
+    # labelled or return-cursor moves were placed on purpose — never drop them
+    keep = [i for i, e in enumerate(run) if e.label or e.return_cursor]
+    indices = rdp_indices(xs, ys, ts, tolerance, time_tolerance, keep)
+
+    # fold the delays of dropped samples into the next kept one so the
+    # overall timing of the path is unchanged
+    out = []
+    prev_t = 0.0
+    for i in indices:
+        out.append(run[i].replace(delay_before=round(ts[i] - prev_t, 6)))
+        prev_t = ts[i]
+    return out, indices
+
+
+def simplify_moves(steps: list[ClickEntry], tolerance=DEFAULT_TOLERANCE,
+                   time_tolerance=DEFAULT_TIME_TOLERANCE) -> tuple[list[ClickEntry], dict, array]:
+    """
+    Simplify every run of consecutive "move" steps. Returns the new step list,
+    a report with before/after counts, compression ratio and duration change,
+    and the index in steps of every step that survived.
+    """
+    out: list[ClickEntry] = []
+    kept = array("q")
+    for start, run in group_steps(steps):
+        if len(run) > 2 and run[0].click_type == "move":
+            simplified, indices = _simplify_run(run, tolerance, time_tolerance)
+            out.extend(simplified)
+            kept.extend(start + i for i in indices)
+        else:
+            out.extend(run)
+            kept.extend(range(start, start + len(run)))
+
+    before = sum(e.delay_before for e in steps)
+    after = sum(e.delay_before for e in out)
+    report = {
+        "before": len(steps),
+        "after": len(out),
+        "ratio": len(steps) / len(out) if out else 1.0,
+        "duration_delta": after - before,
+    }
+    return out, report, kept
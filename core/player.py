@@ -1,27 +1,56 @@
-import time
 import threading
-import pyautogui
-from core.script import Script, ClickEntry
+from core.backends import FailSafeTriggered, InputBackend, make_backend
+from core.pathing import EASINGS, point_at
+from core.script import Script, FLAG_MOVE_TO, FLAG_RETURN, OP_PATH
+from core.telemetry import PlaybackTelemetry
+from core.timing import Timeline, wait_until, now_ns
 
-# keep pyautogui's failsafe on — moving to top-left corner aborts
-pyautogui.FAILSAFE = True
-pyautogui.PAUSE = 0
+# shortest loop an endless run may take, so a script with no delays can't spin a core
+MIN_LOOP_NS = 1_000_000
 
 
 class Player:
-    def __init__(self):
+    def __init__(self, backend: "str | InputBackend | None" = None):
+        # "pyautogui" (default), "pynput", "memory" or any InputBackend instance;
+        # built on first use so constructing a Player doesn't import pyautogui
+        self._backend_spec = backend
+        self._backend: InputBackend | None = None
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
+        # waits end early on this for stop, pause and seek alike
+        self._wake_event = threading.Event()
+        self._resume_event = threading.Event()   # cleared while paused
+        self._control_lock = threading.Lock()
+        self._paused_at: int | None = None       # clock time pause() was called
+        self._seek_to: tuple | None = None       # (step, seconds) waiting to be applied
         self._current_step = -1
+        self._iteration = 0
         self._running = False
         self.speed_multiplier = 1.0
         self.repeat_delay = 0.0
+        self.path_rate = 240.0            # cursor updates per second for "path" steps
+        self.use_timeline = True          # follow a script's recorded timeline when it has one
+        # None = real time; a VirtualClock (core.simulation) makes waits return instantly
+        self.clock = None
+        self._now = now_ns
+        self._wait_until = wait_until
+        self._timeline: Timeline | None = None
+        self.telemetry = PlaybackTelemetry()   # full timing trace + histograms for the last run
 
         # callbacks the UI can hook into
         self.on_step_change = None     # called with (step_index,)
         self.on_playback_done = None   # called with no args when finished
         self.on_error = None           # called with (error_message,)
 
+    @property
+    def backend(self) -> InputBackend:
+        if self._backend is None:
+            self._backend = make_backend(self._backend_spec)
+            if hasattr(self._backend, "wake_event"):
+                # lets a backend's timed move end early on stop, pause or seek
+                self._backend.wake_event = self._wake_event
+        return self._backend
+
     @property
     def is_running(self):
         return self._running
@@ -30,13 +59,43 @@ class Player:
     def current_step(self):
         return self._current_step
 
-    def start(self, script: Script, dry_run: bool = False):
-        if self._running:
-            return
+    @property
+    def iteration(self):
+        """Loop being played, counting from 0."""
+        return self._iteration
+
+    @property
+    def is_paused(self):
+        return self._paused_at is not None
+
+    @property
+    def elapsed_ns(self) -> int | None:
+        """
+        ns of the run played so far, or None when idle. Time spent paused
+        doesn't count, and a seek moves it.
+        """
+        timeline = self._timeline
+        if not self._running or timeline is None:
+            return None
+        paused_at = self._paused_at
+        return (self._now() if paused_at is None else paused_at) - timeline.start_ns
 
+    def _claim(self) -> bool:
+        if self._running:
+            return False
         self._stop_event.clear()
+        self._wake_event.clear()
+        self._resume_event.set()
+        self._paused_at = None
+        self._seek_to = None
         self._running = True
         self._current_step = -1
+        self._iteration = 0
+        return True
+
+    def start(self, script: Script, dry_run: bool = False):
+        if not self._claim():
+            return
 
         self._thread = threading.Thread(
             target=self._run_loop,
@@ -45,20 +104,101 @@ class Player:
         )
         self._thread.start()
 
+    def run(self, script: Script, dry_run: bool = False, repeat: int | None = None):
+        """
+        Play on the calling thread and return when done. repeat overrides the
+        script's repeat count. Used for simulation, where nothing really waits.
+        """
+        if self._claim():
+            self._run_loop(script, dry_run, repeat)
+
     def stop(self):
         self._stop_event.set()
+        self._wake_event.set()
+        self._resume_event.set()
+
+    def pause(self):
+        """
+        Hold playback before the next step, or where the cursor is if a path
+        is moving. resume() carries on from there on the same timeline.
+        """
+        with self._control_lock:
+            if not self._running or self._paused_at is not None:
+                return
+            self._paused_at = self._now()
+            self._resume_event.clear()
+            self._wake_event.set()
+
+    def resume(self):
+        with self._control_lock:
+            paused_at = self._paused_at
+            if paused_at is None:
+                return
+            timeline = self._timeline
+            if timeline is not None:
+                # every deadline still ahead moves back by the time spent paused
+                timeline.shift(self._now() - paused_at)
+            self._paused_at = None
+            self._resume_event.set()
+
+    def seek(self, step: int | None = None, seconds: float | None = None):
+        """
+        Jump within the current loop, to a step or to a time (at playback
+        speed) from the loop's start. Later steps keep their spacing. Works
+        while paused too; the jump happens on resume.
+        """
+        if (step is None) == (seconds is None):
+            raise ValueError("seek needs exactly one of step or seconds")
+        with self._control_lock:
+            if not self._running:
+                return
+            self._seek_to = (step, seconds)
+            self._wake_event.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until playback finishes. Returns True if it is no longer running."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return not self._running
 
-    def _run_loop(self, script: Script, dry_run: bool):
+    def _run_loop(self, script: Script, dry_run: bool, repeat: int | None = None):
+        clock = self.clock
+        self._now = clock.now_ns if clock is not None else now_ns
+        self._wait_until = clock.wait_until if clock is not None else wait_until
+        now, wait = self._now, self._wait_until
         try:
-            repeat = script.repeat_count
+            repeat = script.repeat_count if repeat is None else repeat
             infinite = repeat == 0
             iteration = 0
 
+            # compile once per run: flat arrays with pre-scaled absolute offsets
+            plan = script.compile(self.speed_multiplier, self.use_timeline)
+            if not len(plan):
+                return
+            dispatch = self._dispatch_table()
+
+            repeat_delay = max(0.0, self.repeat_delay)
+            if infinite and plan.duration_ns + repeat_delay * 1e9 < MIN_LOOP_NS:
+                repeat_delay = (MIN_LOOP_NS - plan.duration_ns) / 1e9
+
+            # every step is scheduled against one absolute timeline so overshoot
+            # and click time on one step don't push back all the following ones
+            timeline = Timeline(plan.offsets, repeat_delay, plan.duration_ns)
+            timeline.start(now())
+            self._timeline = timeline
+            telemetry = self.telemetry
+            telemetry.reset(timeline.start_ns)
+
+            first = 0   # step the current loop starts from; later than 0 after a seek
             while infinite or iteration < repeat:
                 if self._stop_event.is_set():
                     break
 
-                for i, step in enumerate(script.steps):
+                base = timeline.iteration_base(iteration)
+                self._iteration = iteration
+                interrupted = False
+                for i, (offset, x, y, op, flags) in enumerate(plan.columns(first), first):
                     if self._stop_event.is_set():
                         break
 
@@ -66,25 +206,39 @@ class Player:
                     if self.on_step_change:
                         self.on_step_change(i)
 
-                    delay = step.delay_before / self.speed_multiplier
-                    if delay > 0:
-                        # sleep in small chunks so we can respond to stop quickly
-                        self._interruptible_sleep(delay)
-
-                    if self._stop_event.is_set():
+                    deadline = base + offset
+                    if not wait(deadline, self._wake_event):
+                        if not self._stop_event.is_set():
+                            # paused or seeking: pick up again from wherever that leaves us
+                            first = self._interrupted(plan, timeline, iteration, i)
+                            interrupted = True
                         break
+                    woke = now()
 
-                    if not dry_run:
-                        self._execute_click(step)
+                    if dry_run:
+                        telemetry.record(iteration, i, deadline, woke, None)
+                        continue
+                    if op == OP_PATH:
+                        # a path's duration isn't backend latency, so only its start is timed
+                        telemetry.record(iteration, i, deadline, woke, None)
+                        if not self._play_path(plan.paths[i], deadline):
+                            if not self._stop_event.is_set():
+                                # a seek cut the path short
+                                first = self._interrupted(plan, timeline, iteration, i + 1)
+                                interrupted = True
+                            break
+                        # a pause during the path moved the timeline
+                        base = timeline.iteration_base(iteration)
+                    else:
+                        self._execute_op(dispatch[op], x, y, flags)
+                        telemetry.record(iteration, i, deadline, woke, now() - woke)
 
+                if interrupted:
+                    continue
                 iteration += 1
+                first = 0
 
-                # pause between loops (skip after the final iteration)
-                if self.repeat_delay > 0 and (infinite or iteration < repeat):
-                    if not self._stop_event.is_set():
-                        self._interruptible_sleep(self.repeat_delay)
-
-        except pyautogui.FailSafeException:
+        except FailSafeTriggered:
             if self.on_error:
                 self.on_error("Failsafe triggered — mouse was moved to corner.")
         except Exception as e:
@@ -93,32 +247,104 @@ class Player:
         finally:
             self._running = False
             self._current_step = -1
+            self._timeline = None
+            self._paused_at = None
             if self.on_playback_done:
                 self.on_playback_done()
 
-    def _execute_click(self, step: ClickEntry):
-        original_x, original_y = pyautogui.position()
-
-        if step.move_to:
-            pyautogui.moveTo(step.x, step.y, duration=0.05)
-
-        if step.click_type == "move":
-            pyautogui.moveTo(step.x, step.y, duration=0)
-        elif step.click_type == "left":
-            pyautogui.click(step.x, step.y)
-        elif step.click_type == "right":
-            pyautogui.rightClick(step.x, step.y)
-        elif step.click_type == "double":
-            pyautogui.doubleClick(step.x, step.y)
-
-        if step.return_cursor:
-            pyautogui.moveTo(original_x, original_y, duration=0.05)
-
-    def _interruptible_sleep(self, seconds: float):
-        """Sleep in 50ms chunks so stop requests aren't delayed."""
-        end = time.monotonic() + seconds
-        while time.monotonic() < end:
-            if self._stop_event.is_set():
-                return
-            remaining = end - time.monotonic()
-            time.sleep(min(0.05, max(0, remaining)))
+    def _interrupted(self, plan, timeline: Timeline, iteration: int, index: int) -> int:
+        """
+        Sit out a pause, then apply any pending seek. Returns the step to
+        carry on from.
+        """
+        seek = self._hold()
+        if seek is None:
+            return index
+
+        # looked up on the plan's own offsets, the ones the timeline schedules from
+        step, seconds = seek
+        if seconds is not None:
+            position = min(max(0, round(seconds * 1e9)), plan.duration_ns)
+            step = plan.step_at(position)
+        else:
+            step = min(max(0, step), len(plan) - 1)
+            position = plan.offset_at(step)
+        timeline.seek(iteration, position, self._now())
+        return step
+
+    def _hold(self, take_seek: bool = True):
+        """
+        Block while paused (resume() shifts the timeline by the pause's
+        length). Returns the pending seek, taking it unless take_seek is False.
+        """
+        while True:
+            self._resume_event.wait()
+            with self._control_lock:
+                # paused again between resume() and here: keep waiting
+                if self._paused_at is not None and not self._stop_event.is_set():
+                    continue
+                if not self._stop_event.is_set():
+                    self._wake_event.clear()
+                seek = self._seek_to
+                if take_seek:
+                    self._seek_to = None
+                return seek
+
+    def _dispatch_table(self):
+        """Backend calls indexed by compiled opcode (see core.script.OPCODES)."""
+        b = self.backend
+        # OP_PATH (5) is played by _play_path, never dispatched
+        return (None, b.move, b.click, b.right_click, b.double_click, None, b.triple_click)
+
+    def _play_path(self, path, start_ns: int) -> bool:
+        """
+        Replay a compiled path in one tight loop, sampling the interpolated
+        position at path_rate. A pause holds the cursor where it is and the
+        path carries on from there; returns False if stopped or a seek
+        interrupts it.
+        """
+        xs, ys, ts, easing = path
+        if not len(ts):
+            return True
+        ease = EASINGS.get(easing, EASINGS["linear"])
+        move = self.backend.move
+        total = ts[-1]
+        period = round(1e9 / max(1.0, self.path_rate))
+
+        frame = start_ns
+        while frame - start_ns < total:
+            progress = ease((frame - start_ns) / total)
+            move(*point_at(xs, ys, ts, round(progress * total)))
+            frame += period
+            # if the backend can't keep up, drop frames rather than fall behind
+            now = self._now()
+            if now > frame:
+                frame = now
+            if not self._wait_until(frame, self._wake_event):
+                if self._stop_event.is_set() or self._seek_to is not None:
+                    return False
+                timeline = self._timeline
+                before = timeline.start_ns
+                if self._hold(take_seek=False) is not None or self._stop_event.is_set():
+                    return False
+                # resume() moved the timeline on by the pause; the path moves with it
+                shift = timeline.start_ns - before
+                start_ns += shift
+                frame += shift
+
+        move(xs[-1], ys[-1])
+        return True
+
+    def _execute_op(self, action, x: int, y: int, flags: int):
+        backend = self.backend
+        if flags & FLAG_RETURN:
+            original_x, original_y = backend.position()
+
+        if flags & FLAG_MOVE_TO:
+            backend.move(x, y, duration=0.05)
+
+        if action is not None:
+            action(x, y)
+
+        if flags & FLAG_RETURN:
+            backend.move(original_x, original_y, duration=0.05)
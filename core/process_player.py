@@ -0,0 +1,307 @@
+import struct
+import threading
+
+from core.script import CompiledScript, Script
+from core.telemetry import PlaybackTelemetry
+from core.timing import now_ns
+
+# Status block the worker writes and the UI polls, all int64:
+# run id, state, step, iteration, loop-clock start (ns), paused at (ns, 0 = not paused).
+# perf_counter_ns is system-wide, so both processes read the same clock.
+STATUS = struct.Struct("<6q")
+STATE_IDLE = 0
+STATE_RUNNING = 1
+STATE_PAUSED = 2
+
+WORKER_START_TIMEOUT = 30.0   # seconds to wait for a spawned worker to say it's ready
+WORKER_QUIT_TIMEOUT = 2.0
+
+
+class _CompiledSource:
+    """Script stand-in inside the worker: the plan arrives already compiled (or mapped)."""
+
+    def __init__(self, plan: CompiledScript, repeat_count: int):
+        self.plan = plan
+        self.repeat_count = repeat_count
+
+    def compile(self, speed_multiplier: float = 1.0, use_timeline: bool = True) -> CompiledScript:
+        return self.plan
+
+
+def _worker_main(conn, shm_name: str, backend):
+    """Entry point of the playback process: plays whatever plan it is sent until told to quit."""
+    from multiprocessing import shared_memory
+
+    from core.player import Player
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buf = shm.buf
+    player = Player(backend)
+    state = {"run": 0, "error": None, "closed": False}
+    # held around every write to buf, so the block is never released under one
+    buf_lock = threading.Lock()
+
+    def write(status: int):
+        elapsed = player.elapsed_ns
+        now = now_ns()
+        start = now - elapsed if elapsed is not None else 0
+        with buf_lock:
+            if not state["closed"]:
+                STATUS.pack_into(buf, 0, state["run"], status, player.current_step, player.iteration,
+                                 start, now if status == STATE_PAUSED else 0)
+
+    def on_step(index):
+        write(STATE_PAUSED if player.is_paused else STATE_RUNNING)
+
+    def on_error(msg):
+        state["error"] = msg
+
+    def on_done():
+        with buf_lock:
+            if state["closed"]:
+                return
+            STATUS.pack_into(buf, 0, state["run"], STATE_IDLE, -1, 0, 0, 0)
+        conn.send(("done", state["run"], state["error"], player.telemetry))
+
+    player.on_step_change = on_step
+    player.on_error = on_error
+    player.on_playback_done = on_done
+    conn.send(("ready",))
+
+    # this thread only listens, so a stop reaches the player as soon as it is sent
+    try:
+        while True:
+            command, *args = conn.recv()
+            if command == "play":
+                run, plan, repeat, settings, dry_run = args
+                player.wait()
+                state["run"], state["error"] = run, None
+                for name, value in settings.items():
+                    setattr(player, name, value)
+                player.start(_CompiledSource(plan, repeat), dry_run=dry_run)
+            elif command == "stop":
+                player.stop()
+            elif command == "pause":
+                player.pause()
+                write(STATE_PAUSED)
+            elif command == "resume":
+                player.resume()
+                write(STATE_RUNNING)
+            elif command == "seek":
+                player.seek(*args)
+            elif command == "quit":
+                break
+    except (EOFError, OSError):
+        pass   # the app went away
+    finally:
+        player.stop()
+        player.wait(WORKER_QUIT_TIMEOUT)
+        # a run that outlived the wait finds the block closed instead of a released buffer
+        with buf_lock:
+            state["closed"] = True
+            player.on_step_change = player.on_playback_done = None
+            buf.release()
+        shm.close()
+
+
+class ProcessPlayer:
+    """
+    Player that runs playback in a separate worker process, so clicks keep
+    their timing however busy the Tk thread (and its GIL) gets. The script
+    is compiled here and sent over a pipe; the worker reports its position
+    through a small shared-memory block the UI polls (current_step,
+    elapsed_ns) instead of calling on_step_change. The worker is spawned
+    on first use and reused for every later run.
+    """
+
+    def __init__(self, backend: str | None = None):
+        # a backend name, not an instance: the worker builds its own
+        self._backend_spec = backend
+        self._process = None
+        self._conn = None
+        self._shm = None
+        self._listener: threading.Thread | None = None
+        self._send_lock = threading.Lock()
+        self._done = threading.Event()
+        self._done.set()
+        self._run = 0
+        self._running = False
+        self._paused = False
+        self.speed_multiplier = 1.0
+        self.repeat_delay = 0.0
+        self.path_rate = 240.0
+        self.use_timeline = True
+        self.telemetry = PlaybackTelemetry()   # copied back from the worker after each run
+
+        self.on_step_change = None     # never called: poll current_step instead
+        self.on_playback_done = None   # called with no args when finished (listener thread)
+        self.on_error = None           # called with (error_message,)
+
+    # --- worker lifecycle ---
+
+    @property
+    def worker_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def warm(self):
+        """Spawn the worker now rather than on the first start()."""
+        if self.worker_alive:
+            return
+        import multiprocessing
+        from multiprocessing import shared_memory
+
+        self._close_worker()
+        ctx = multiprocessing.get_context("spawn")
+        self._shm = shared_memory.SharedMemory(create=True, size=STATUS.size)
+        STATUS.pack_into(self._shm.buf, 0, 0, STATE_IDLE, -1, 0, 0, 0)
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_worker_main, args=(child_conn, self._shm.name, self._backend_spec),
+            name="ghostclick-player", daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        self._listener = threading.Thread(target=self._listen, args=(self._conn, self._process),
+                                          daemon=True)
+        self._listener.start()
+
+    def close(self):
+        """Stop any run and shut the worker down."""
+        if self._conn is not None:
+            self._send("quit")
+        self._close_worker()
+
+    def _close_worker(self):
+        process, self._process = self._process, None
+        if process is not None:
+            process.join(WORKER_QUIT_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join(WORKER_QUIT_TIMEOUT)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def _send(self, *message) -> bool:
+        try:
+            with self._send_lock:
+                self._conn.send(message)
+            return True
+        except (AttributeError, OSError):
+            return False
+
+    def _listen(self, conn, process):
+        exit_error = "Playback worker exited unexpectedly"
+        # a run sent before the worker is up just waits in the pipe, so start()
+        # never blocks on the spawn; a worker that doesn't come up is killed here
+        try:
+            if not conn.poll(WORKER_START_TIMEOUT):
+                exit_error = f"Playback worker did not start within {WORKER_START_TIMEOUT:g} s"
+                process.terminate()
+                process.join(WORKER_QUIT_TIMEOUT)
+        except (EOFError, OSError):
+            pass
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            if message[0] == "done":
+                _, run, error, telemetry = message
+                if run == self._run:
+                    self.telemetry = telemetry
+                    self._finish(error)
+        # the worker is gone; a run it was in the middle of is over too
+        if self._running:
+            self._finish(exit_error)
+
+    def _finish(self, error: str | None):
+        self._running = False
+        self._paused = False
+        self._done.set()
+        if error and self.on_error:
+            self.on_error(error)
+        if self.on_playback_done:
+            self.on_playback_done()
+
+    # --- Player interface ---
+
+    @property
+    def is_running(self):
+        return self._running
+
+    @property
+    def is_paused(self):
+        return self._paused
+
+    def _status(self) -> tuple | None:
+        shm = self._shm
+        if not self._running or shm is None:
+            return None
+        status = STATUS.unpack_from(shm.buf, 0)
+        # a block still describing the previous run doesn't count
+        return status if status[0] == self._run else None
+
+    @property
+    def current_step(self):
+        status = self._status()
+        return status[2] if status else -1
+
+    @property
+    def iteration(self):
+        status = self._status()
+        return status[3] if status else 0
+
+    @property
+    def elapsed_ns(self) -> int | None:
+        status = self._status()
+        if not status or not status[4]:
+            return None
+        paused_at = status[5]
+        return (paused_at or now_ns()) - status[4]
+
+    def start(self, script: Script, dry_run: bool = False):
+        if self._running:
+            return
+        # a mapped script's plan pickles as its file path; the worker maps the file itself
+        plan = script.compile(self.speed_multiplier, self.use_timeline)
+
+        self.warm()
+        self._run += 1
+        self._running = True
+        self._paused = False
+        self._done.clear()
+        settings = {
+            "speed_multiplier": self.speed_multiplier, "repeat_delay": self.repeat_delay,
+            "path_rate": self.path_rate, "use_timeline": self.use_timeline,
+        }
+        if not self._send("play", self._run, plan, script.repeat_count, settings, dry_run):
+            self._finish("Playback worker is not running")
+
+    def stop(self):
+        self._send("stop")
+
+    def pause(self):
+        if self._running and not self._paused:
+            self._paused = True
+            self._send("pause")
+
+    def resume(self):
+        if self._paused:
+            self._paused = False
+            self._send("resume")
+
+    def seek(self, step: int | None = None, seconds: float | None = None):
+        if (step is None) == (seconds is None):
+            raise ValueError("seek needs exactly one of step or seconds")
+        if self._running:
+            self._send("seek", step, seconds)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until playback finishes. Returns True if it is no longer running."""
+        self._done.wait(timeout)
+        return not self._running
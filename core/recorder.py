@@ -1,32 +1,72 @@
 import time
 import threading
-from pynput import mouse
+from array import array
+from core.pathing import simplify_moves
 from core.script import ClickEntry
+from utils.ring_buffer import EventRing
 
-DOUBLE_CLICK_THRESHOLD = 0.25   # seconds between clicks to count as double
+MULTI_CLICK_INTERVAL = 0.25     # max seconds between clicks of a double/triple click
+MULTI_CLICK_DISTANCE = 4        # max pixels the cursor may drift between those clicks
+MULTI_CLICK_GRACE = 0.02        # extra wait before expiring, for events still in the hook
 MOVE_MIN_INTERVAL = 0.05        # minimum seconds between recorded move samples
 MOVE_MIN_DISTANCE = 5           # minimum pixels between recorded move samples
+SIMPLIFY_TOLERANCE = 2.0        # pixels; 0 disables path simplification on stop
+SIMPLIFY_TIME_TOLERANCE = 0.05  # seconds a dropped sample's timing may drift
+RING_CAPACITY = 1 << 16         # raw hook events buffered between the hook and the consumer
+CONSUMER_INTERVAL = 0.005       # seconds between consumer passes over the ring
+
+# raw event kinds pushed by the hook
+EVENT_MOVE = 0
+EVENT_LEFT = 1
+EVENT_RIGHT = 2
+
+MULTI_CLICK_TYPES = {1: "left", 2: "double", 3: "triple"}
 
 
 class Recorder:
+    """
+    The pynput hook callbacks only timestamp the event and push it into a
+    preallocated ring; a consumer thread does throttling, double/triple-click
+    detection and ClickEntry construction off the OS hook.
+
+    Multi-clicks are resolved from event timestamps alone: a left click stays
+    pending until another click extends it, a different event arrives, or the
+    consumer notices its interval has run out. No timers or extra threads.
+    """
+
     def __init__(self):
-        self._listener: mouse.Listener | None = None
+        self._listener = None   # pynput mouse.Listener, imported on start()
         self._recording = False
         self._lock = threading.Lock()
         self._entries: list[ClickEntry] = []
-        self._last_time: float = 0.0
-        self._is_first_event = True
+        self._times = array("q")                # perf_counter_ns of each entry
+        self._last_commit_ns: int | None = None # delays are measured between entries
+        self._ring = EventRing(RING_CAPACITY)
+        self._consumer: threading.Thread | None = None
+        self._consumer_stop = threading.Event()
+
+        # hook cost, written only by the hook thread
+        self.hook_calls = 0
+        self.hook_total_ns = 0
+        self.hook_max_ns = 0
         self._record_movements = False
 
-        # for double-click detection
+        # for double/triple-click detection: x, y, t (first click), count, last (ns)
         self._pending_click: dict | None = None
-        self._pending_timer: threading.Timer | None = None
+        self.multi_click_interval = MULTI_CLICK_INTERVAL
+        self.multi_click_distance = MULTI_CLICK_DISTANCE
 
         # for movement sampling
         self._last_move_time: float = 0.0
         self._last_move_x: int = 0
         self._last_move_y: int = 0
 
+        self.simplify_tolerance = SIMPLIFY_TOLERANCE
+        self.simplify_time_tolerance = SIMPLIFY_TIME_TOLERANCE
+        self.last_simplify_report: dict | None = None
+        # start of each entry stop() returned, in ns from the first one
+        self.last_timeline: array | None = None
+
         self.on_click_captured = None   # called with (ClickEntry,) for live UI updates
 
     @property
@@ -38,27 +78,50 @@ class Recorder:
         with self._lock:
             return list(self._entries)
 
+    def stats(self) -> dict:
+        """Hook-side counters for the current or last recording."""
+        calls = self.hook_calls
+        return {
+            "captured": self._ring.head,
+            "dropped": self._ring.dropped,
+            "ring_peak": self._ring.peak,
+            "hook_mean_us": round(self.hook_total_ns / calls / 1e3, 2) if calls else 0.0,
+            "hook_max_us": round(self.hook_max_ns / 1e3, 2),
+        }
+
     def start(self, record_movements: bool = False):
         if self._recording:
             return
 
+        from pynput import mouse
+
+        self._begin(record_movements)
+
+        kwargs = {"on_click": self._on_click}
+        if record_movements:
+            kwargs["on_move"] = self._on_move
+        self._listener = mouse.Listener(**kwargs)
+        self._listener.start()
+
+    def _begin(self, record_movements: bool):
+        """Reset state and start the consumer; the hook can push from here on."""
         self._record_movements = record_movements
 
         with self._lock:
             self._entries.clear()
-        self._last_time = time.monotonic()
-        self._is_first_event = True
+            self._times = array("q")
+        self._last_commit_ns = None
         self._pending_click = None
         self._last_move_time = 0.0
         self._last_move_x = 0
         self._last_move_y = 0
-        self._recording = True
+        self._ring.reset()
+        self.hook_calls = self.hook_total_ns = self.hook_max_ns = 0
 
-        kwargs = {"on_click": self._on_click}
-        if record_movements:
-            kwargs["on_move"] = self._on_move
-        self._listener = mouse.Listener(**kwargs)
-        self._listener.start()
+        self._consumer_stop.clear()
+        self._consumer = threading.Thread(target=self._consume, daemon=True, name="recorder")
+        self._consumer.start()
+        self._recording = True
 
     def stop(self) -> list[ClickEntry]:
         if not self._recording:
@@ -66,26 +129,93 @@ class Recorder:
 
         self._recording = False
 
-        # discard the pending click — it's the Stop button press
-        if self._pending_timer:
-            self._pending_timer.cancel()
-        self._pending_click = None
-
         if self._listener:
             self._listener.stop()
             self._listener = None
 
+        # the consumer drains whatever the hook pushed before exiting
+        self._consumer_stop.set()
+        if self._consumer:
+            self._consumer.join()
+            self._consumer = None
+
+        # discard the pending click — it's the Stop button press
+        self._pending_click = None
+
         with self._lock:
             captured = list(self._entries)
+            times = self._times
             self._entries.clear()
+            self._times = array("q")
+
+        self.last_simplify_report = None
+        if self._record_movements and self.simplify_tolerance > 0:
+            captured, report, kept = simplify_moves(
+                captured, self.simplify_tolerance, self.simplify_time_tolerance,
+            )
+            times = array("q", (times[i] for i in kept))
+            self.last_simplify_report = report
+            # dropped samples' time was folded into the next kept step as a
+            # rounded sum; take it from the clock instead
+            prev = times[0] if times else 0
+            for i, t in enumerate(times):
+                delay = (t - prev) / 1e9
+                if captured[i].delay_before != delay:
+                    captured[i] = captured[i].replace(delay_before=delay)
+                prev = t
+
+        self.last_timeline = array("q", (t - times[0] for t in times)) if times else None
         return captured
 
+    # --- hook thread: timestamp and push, nothing else ---
+
     def _on_move(self, x, y):
-        if not self._recording or not self._record_movements:
+        if not self._recording:
             return
+        t = time.perf_counter_ns()
+        self._ring.push(t, int(x), int(y), EVENT_MOVE)
+        self._hook_done(t)
 
-        now = time.monotonic()
-        ix, iy = int(x), int(y)
+    def _on_click(self, x, y, button, pressed):
+        if not pressed or not self._recording:
+            return
+        t = time.perf_counter_ns()
+        # compare by name so the hook path doesn't need pynput imported here
+        name = getattr(button, "name", None)
+        if name == "left":
+            self._ring.push(t, int(x), int(y), EVENT_LEFT)
+        elif name == "right":
+            self._ring.push(t, int(x), int(y), EVENT_RIGHT)
+        self._hook_done(t)
+
+    def _hook_done(self, started_ns: int):
+        took = time.perf_counter_ns() - started_ns
+        self.hook_calls += 1
+        self.hook_total_ns += took
+        if took > self.hook_max_ns:
+            self.hook_max_ns = took
+
+    # --- consumer thread ---
+
+    def _consume(self):
+        while True:
+            stopping = self._consumer_stop.wait(CONSUMER_INTERVAL)
+            for t_ns, x, y, kind in self._ring.drain():
+                self._process(t_ns, x, y, kind)
+            if stopping:
+                return
+            self._expire_pending(time.perf_counter_ns())
+
+    def _process(self, t_ns: int, x: int, y: int, kind: int):
+        if kind == EVENT_MOVE:
+            self._process_move(t_ns, x, y)
+        else:
+            self._process_click(t_ns, x, y, kind)
+
+    def _process_move(self, t_ns: int, ix: int, iy: int):
+        if not self._record_movements:
+            return
+        now = t_ns / 1e9
 
         # throttle: skip if too soon or too close
         dt = now - self._last_move_time
@@ -95,76 +225,72 @@ class Recorder:
         if dt < MOVE_MIN_INTERVAL or (dx < MOVE_MIN_DISTANCE and dy < MOVE_MIN_DISTANCE):
             return
 
-        if self._is_first_event:
-            delay = 0.0
-            self._is_first_event = False
-        else:
-            delay = round(now - self._last_time, 3)
-        self._last_time = now
-
         self._last_move_time = now
         self._last_move_x = ix
         self._last_move_y = iy
 
-        self._commit_entry({"x": ix, "y": iy, "delay": delay}, "move")
+        # the cursor has left the click spot, so any pending click is complete
+        self._flush_pending()
+        self._commit_entry(t_ns, ix, iy, "move")
 
-    def _on_click(self, x, y, button, pressed):
-        if not pressed or not self._recording:
-            return
-
-        now = time.monotonic()
+    def _process_click(self, t_ns: int, x: int, y: int, kind: int):
+        # update move tracking so the next move is throttled from here
+        self._last_move_time = t_ns / 1e9
+        self._last_move_x = x
+        self._last_move_y = y
 
-        # first event gets delay=0 so playback doesn't stall on startup wait
-        if self._is_first_event:
-            delay = 0.0
-            self._is_first_event = False
+        if kind == EVENT_LEFT:
+            self._handle_left_click(t_ns, x, y)
         else:
-            delay = round(now - self._last_time, 3)
-        self._last_time = now
+            # flush pending left click before recording right click
+            self._flush_pending()
+            self._commit_entry(t_ns, x, y, "right")
+
+    def _handle_left_click(self, t_ns: int, x: int, y: int):
+        pending = self._pending_click
+        if (pending
+                and t_ns - pending["last"] <= self.multi_click_interval * 1e9
+                and abs(x - pending["x"]) <= self.multi_click_distance
+                and abs(y - pending["y"]) <= self.multi_click_distance):
+            # another click of the same burst; the step starts at the first one
+            pending["count"] += 1
+            pending["last"] = t_ns
+            if pending["count"] >= 3:
+                self._flush_pending()
+            return
 
-        # update move tracking so next move delay is correct
-        self._last_move_time = now
-        self._last_move_x = int(x)
-        self._last_move_y = int(y)
+        self._flush_pending()
+        # hold this click until we know whether another follows
+        self._pending_click = {"x": x, "y": y, "t": t_ns, "count": 1, "last": t_ns}
 
-        if button == mouse.Button.left:
-            self._handle_left_click(x, y, delay)
-        elif button == mouse.Button.right:
-            # flush pending left click before recording right click
+    def _expire_pending(self, now_ns: int):
+        pending = self._pending_click
+        if pending and now_ns - pending["last"] > (self.multi_click_interval + MULTI_CLICK_GRACE) * 1e9:
             self._flush_pending()
-            self._commit_entry({"x": int(x), "y": int(y), "delay": delay}, "right")
-
-    def _handle_left_click(self, x, y, delay):
-        if self._pending_click:
-            # second left click came in quickly — it's a double click
-            self._pending_timer.cancel()
-            # use the first click's delay (time since the action before it)
-            self._commit_entry(self._pending_click, "double")
-            self._pending_click = None
-        else:
-            # hold this click and wait briefly to see if another follows
-            self._pending_click = {"x": int(x), "y": int(y), "delay": delay}
-            self._pending_timer = threading.Timer(
-                DOUBLE_CLICK_THRESHOLD, self._flush_pending
-            )
-            self._pending_timer.daemon = True
-            self._pending_timer.start()
 
     def _flush_pending(self):
-        if self._pending_click:
-            self._commit_entry(self._pending_click, "left")
+        pending = self._pending_click
+        if pending:
             self._pending_click = None
-
-    def _commit_entry(self, data: dict, click_type: str):
+            self._commit_entry(pending["t"], pending["x"], pending["y"],
+                               MULTI_CLICK_TYPES[pending["count"]])
+
+    def _commit_entry(self, t_ns: int, x: int, y: int, click_type: str):
+        # steps are committed in time order, so the delay is exact down to the
+        # nanosecond; the first step gets 0 so playback doesn't stall on start
+        last = self._last_commit_ns
+        delay = 0.0 if last is None else (t_ns - last) / 1e9
+        self._last_commit_ns = t_ns
         entry = ClickEntry(
-            x=data["x"],
-            y=data["y"],
+            x=x,
+            y=y,
             click_type=click_type,
-            delay_before=data["delay"],
+            delay_before=delay,
             return_cursor=False,
         )
 
         with self._lock:
             self._entries.append(entry)
+            self._times.append(t_ns)
         if self.on_click_captured:
             self.on_click_captured(entry)
@@ -1,24 +1,189 @@
+import os
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.date import DateTrigger
+
+DEFAULT_MISFIRE_GRACE = 60     # seconds a run may start late before it is skipped
+PRELOAD_LEAD = 30.0            # load and compile a job's script this long before it fires
+SYNC_INTERVAL = 5.0            # re-read the job store and renew the lease this often
+LEASE_STALE = 3 * SYNC_INTERVAL
+MAX_CATCH_UP = 100             # most missed runs replayed for one job after downtime
+SYNC_JOB_ID = "__sync__"
+
+DATE_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M")
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def _local(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp).astimezone()
+
+
+def parse_when(text: str, now: float | None = None) -> dict:
+    """
+    Turn user input into a trigger spec:
+      "2026-05-01 09:30[:00]"  -> one run at that local time
+      "every 15m"              -> interval (s, m, h or d; bare numbers are seconds)
+      "cron */5 * * * *"       -> cron expression (the "cron" prefix is optional)
+    Raises ValueError with a readable message.
+    """
+    text = " ".join(text.split())
+    now = time.time() if now is None else now
+    low = text.lower()
+
+    if low.startswith("every "):
+        amount = low[6:].replace(" ", "")
+        unit = amount[-1:] if amount[-1:] in _UNITS else "s"
+        number = amount[:-1] if amount[-1:] in _UNITS else amount
+        try:
+            seconds = float(number) * _UNITS[unit]
+        except ValueError:
+            raise ValueError(f"can't read interval {text[6:]!r} (try 'every 15m')") from None
+        if seconds <= 0:
+            raise ValueError("interval must be positive")
+        # first run one interval from now; later runs stay on that phase across restarts
+        return {"type": "interval", "seconds": seconds, "start": now + seconds}
+
+    if low.startswith("cron ") or len(text.split()) == 5:
+        spec = {"type": "cron", "expr": text[5:] if low.startswith("cron ") else text}
+        make_trigger(spec)   # validates the expression
+        return spec
+
+    for fmt in DATE_FORMATS:
+        try:
+            run_at = datetime.strptime(text, fmt).timestamp()
+        except ValueError:
+            continue
+        if run_at <= now:
+            raise ValueError("scheduled time must be in the future")
+        return {"type": "date", "run_at": run_at}
+
+    raise ValueError(
+        f"can't read {text!r}: use YYYY-MM-DD HH:MM[:SS], 'every 15m' or a cron expression"
+    )
+
+
+def make_trigger(spec: dict):
+    """APScheduler trigger for a spec made by parse_when."""
+    kind = spec.get("type")
+    if kind == "date":
+        from apscheduler.triggers.date import DateTrigger
+        return DateTrigger(run_date=_local(spec["run_at"]))
+    if kind == "interval":
+        from apscheduler.triggers.interval import IntervalTrigger
+        return IntervalTrigger(seconds=spec["seconds"], start_date=_local(spec["start"]))
+    if kind == "cron":
+        from apscheduler.triggers.cron import CronTrigger
+        return CronTrigger.from_crontab(spec["expr"])
+    raise ValueError(f"unknown trigger type {kind!r}")
+
+
+def describe_trigger(spec: dict) -> str:
+    kind = spec.get("type")
+    if kind == "date":
+        return f"once at {_local(spec['run_at']):%Y-%m-%d %H:%M:%S}"
+    if kind == "interval":
+        seconds = spec["seconds"]
+        for unit in ("d", "h", "m"):
+            if seconds >= _UNITS[unit] and seconds % _UNITS[unit] == 0:
+                return f"every {seconds / _UNITS[unit]:g}{unit}"
+        return f"every {seconds:g}s"
+    if kind == "cron":
+        return f"cron {spec['expr']}"
+    return str(spec)
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    script_path: str
+    trigger: dict                 # spec from parse_when
+    speed: float = 1.0
+    repeat: int | None = None     # loops per run; None = the script's own repeat count
+    misfire_grace: int = DEFAULT_MISFIRE_GRACE
+    coalesce: bool = True         # after downtime, run once rather than once per missed fire
+    last_run: float | None = field(default=None, compare=False)
+    next_run: float | None = field(default=None, compare=False)
+
+    @property
+    def when(self) -> str:
+        return describe_trigger(self.trigger)
+
+    def to_row(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_row(cls, row: dict) -> "ScheduledJob":
+        return cls(**row)
 
 
 class ScriptScheduler:
-    def __init__(self):
-        self._scheduler = BackgroundScheduler()
-        self._scheduler.start()
+    """
+    Runs scripts on a timer. schedule() adds a one-shot, in-memory callback;
+    add_job() stores a named job bound to a script file in a SQLite JobStore.
+    After start(), stored jobs are armed in APScheduler and the store is
+    re-read every SYNC_INTERVAL, so jobs added from the CLI or another window
+    are picked up. A lease in the store makes sure only one process fires them.
+
+    Each job's script is loaded and compiled PRELOAD_LEAD seconds before it is
+    due, so a run starts straight on its first click. Runs missed while nothing
+    was running are replayed at start-up if they are still inside the job's
+    misfire grace (once, when the job coalesces).
+    """
+
+    def __init__(self, store_path: str | None = None):
+        # apscheduler is imported and its thread started on first use
+        self._scheduler = None
         self._jobs = {}
+        self._store_path = store_path      # None = utils.job_store.DEFAULT_STORE
+        self._store = None
+        self._owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._persistent = False           # start() called: stored jobs are armed here
+        self._leased = False
+        self._armed: dict[str, ScheduledJob] = {}
+        self._prepared: dict[str, tuple] = {}   # script path -> ((mtime, size), Script)
+        self._sync_lock = threading.Lock()
+        self._prepare_lock = threading.Lock()
+        self._run_lock = threading.Lock()    # one run at a time: there is only one mouse
+
+        # callbacks; both are called from scheduler threads
+        self.on_run = None      # called with (job, script) and should play it to the end
+        self.on_error = None    # called with (job_name, message)
+
+    @property
+    def store(self):
+        if self._store is None:
+            from utils.job_store import DEFAULT_STORE, JobStore
+            self._store = JobStore(self._store_path or DEFAULT_STORE)
+        return self._store
+
+    @property
+    def holds_lease(self) -> bool:
+        return self._leased
+
+    def _ensure_started(self):
+        if self._scheduler is None:
+            from apscheduler.schedulers.background import BackgroundScheduler
+            self._scheduler = BackgroundScheduler()
+            self._scheduler.start()
+        return self._scheduler
+
+    # --- one-shot jobs ---
 
     def schedule(self, job_id: str, run_at: datetime, callback, *args):
         """
         Schedule a one-shot job. The callback is what actually runs the script —
         typically something like player.start(script).
         """
+        from apscheduler.triggers.date import DateTrigger
+
         if job_id in self._jobs:
             self.cancel(job_id)
 
+        scheduler = self._ensure_started()
         trigger = DateTrigger(run_date=run_at)
-        job = self._scheduler.add_job(callback, trigger, args=args, id=job_id)
+        job = scheduler.add_job(callback, trigger, args=args, id=job_id)
         self._jobs[job_id] = job
         return job
 
@@ -44,6 +209,204 @@ class ScriptScheduler:
             for jid, job in self._jobs.items()
         }
 
+    # --- stored jobs ---
+
+    def start(self):
+        """Arm the stored jobs and keep following the store until shutdown()."""
+        if self._persistent:
+            return
+        self._persistent = True
+        scheduler = self._ensure_started()
+        scheduler.add_job(
+            self._sync, "interval", seconds=SYNC_INTERVAL, id=SYNC_JOB_ID,
+            coalesce=True, max_instances=1, replace_existing=True,
+        )
+        self._sync()
+
+    def add_job(self, job: ScheduledJob) -> ScheduledJob:
+        """Store (or redefine) a named job and arm it. Starts the scheduler if needed."""
+        make_trigger(job.trigger)   # fail here rather than on the scheduler thread
+        job.script_path = os.path.abspath(job.script_path)
+        job.next_run = None
+        self.store.put(job.to_row())
+        if self._persistent:
+            self._sync()
+        else:
+            self.start()
+        return job
+
+    def remove_job(self, name: str) -> bool:
+        removed = self.store.delete(name)
+        if self._persistent:
+            self._sync()
+        return removed
+
+    def stored_jobs(self) -> list[ScheduledJob]:
+        """Every stored job, with next_run taken from the live schedule when armed here."""
+        if self._store is None and not os.path.exists(self._store_path or self._default_store()):
+            return []   # don't create the database just to find it empty
+        jobs = [ScheduledJob.from_row(row) for row in self.store.rows()]
+        for job in jobs:
+            live = self._next_fire(job.name)
+            if live is not None:
+                job.next_run = live
+        return jobs
+
+    @staticmethod
+    def _default_store() -> str:
+        from utils.job_store import DEFAULT_STORE
+        return DEFAULT_STORE
+
+    def _next_fire(self, name: str) -> float | None:
+        if self._scheduler is None or name not in self._armed:
+            return None
+        ap_job = self._scheduler.get_job(name)
+        if ap_job is None or ap_job.next_run_time is None:
+            return None
+        return ap_job.next_run_time.timestamp()
+
+    def _sync(self):
+        with self._sync_lock:
+            try:
+                self._sync_locked(time.time())
+            except Exception as e:
+                self._report("scheduler", f"job store unavailable: {e}")
+
+    def _sync_locked(self, now: float):
+        store = self.store
+        self._leased = store.claim(self._owner, now, LEASE_STALE)
+        wanted = {}
+        if self._leased:
+            wanted = {row["name"]: ScheduledJob.from_row(row) for row in store.rows()}
+
+        for name, job in list(self._armed.items()):
+            if wanted.get(name) != job:
+                self._disarm(name)
+        for name, job in wanted.items():
+            if name not in self._armed:
+                try:
+                    self._arm(job, now)
+                except Exception as e:
+                    self._report(name, f"could not schedule: {e}")
+
+        for name, job in self._armed.items():
+            next_run = self._next_fire(name)
+            if next_run != job.next_run:
+                job.next_run = next_run
+                store.set_run_times(name, next_run)
+
+        # load what is due soon; forget scripts no armed job uses any more
+        paths = {job.script_path for job in self._armed.values()}
+        with self._prepare_lock:
+            for path in list(self._prepared):
+                if path not in paths:
+                    del self._prepared[path]
+        for job in list(self._armed.values()):
+            if job.next_run is not None and job.next_run - now <= PRELOAD_LEAD:
+                try:
+                    self._prepare(job)
+                except Exception:
+                    pass   # reported when the job actually fires
+
+    def _arm(self, job: ScheduledJob, now: float):
+        from apscheduler.triggers.date import DateTrigger
+
+        scheduler = self._ensure_started()
+        trigger = make_trigger(job.trigger)
+        missed = self._missed_runs(job, trigger, now)
+        if missed:
+            scheduler.add_job(
+                self._fire, DateTrigger(run_date=_local(now)), args=(job, missed),
+                id=f"{job.name}#catch-up", replace_existing=True, misfire_grace_time=None,
+            )
+        if job.trigger["type"] == "date" and job.trigger["run_at"] <= now:
+            # its one run has been caught up or is past saving
+            self.store.delete(job.name)
+            return
+        scheduler.add_job(
+            self._fire, trigger, args=(job,), id=job.name, replace_existing=True,
+            misfire_grace_time=max(1, int(job.misfire_grace)), coalesce=job.coalesce, max_instances=1,
+        )
+        self._armed[job.name] = job
+
+    def _disarm(self, name: str):
+        self._armed.pop(name, None)
+        for job_id in (name, f"{name}#catch-up"):
+            try:
+                self._scheduler.remove_job(job_id)
+            except Exception:
+                pass
+
+    @staticmethod
+    def _missed_runs(job: ScheduledJob, trigger, now: float) -> int:
+        """How many fire times passed while the job wasn't armed and are still within grace."""
+        if job.next_run is None:
+            return 0   # new or redefined job: nothing was due yet
+        earliest = max(job.next_run, now - job.misfire_grace)
+        if job.last_run is not None:
+            earliest = max(earliest, job.last_run + 1e-3)
+        count = 0
+        fire = trigger.get_next_fire_time(None, _local(earliest))
+        while fire is not None and fire.timestamp() <= now and count < MAX_CATCH_UP:
+            if fire.timestamp() >= earliest:
+                count += 1
+            fire = trigger.get_next_fire_time(fire, _local(now))
+        return min(count, 1) if job.coalesce else count
+
+    def _prepare(self, job: ScheduledJob):
+        """Loaded script for job, compiled at its speed; cached until the file changes."""
+        from utils.file_io import load_script
+
+        path = job.script_path
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        with self._prepare_lock:
+            cached = self._prepared.get(path)
+            if cached is not None and cached[0] == key:
+                script = cached[1]
+            else:
+                script = load_script(path)
+                self._prepared[path] = (key, script)
+            script.compile(job.speed)   # Script caches the plan until its steps change
+        return script
+
+    def _fire(self, job: ScheduledJob, runs: int = 1):
+        with self._run_lock:
+            for _ in range(runs):
+                started = time.time()
+                try:
+                    script = self._prepare(job)
+                except Exception as e:
+                    self._report(job.name, f"could not load {job.script_path}: {e}")
+                    return
+                if self.on_run:
+                    try:
+                        self.on_run(job, script)
+                    except Exception as e:
+                        self._report(job.name, str(e))
+                job.last_run = started
+        try:
+            if job.trigger["type"] == "date":
+                self.store.delete(job.name)
+            else:
+                self.store.set_run_times(job.name, self._next_fire(job.name), last_run=job.last_run)
+        except Exception as e:
+            self._report(job.name, f"could not update job store: {e}")
+
+    def _report(self, name: str, message: str):
+        if self.on_error:
+            self.on_error(name, message)
+
     def shutdown(self):
         self.cancel_all()
-        self._scheduler.shutdown(wait=False)
+        if self._scheduler is not None:
+            self._scheduler.shutdown(wait=False)
+            self._scheduler = None
+        if self._leased:
+            try:
+                self.store.release(self._owner)
+            except Exception:
+                pass
+            self._leased = False
+        self._armed.clear()
+        self._persistent = False
@@ -1,111 +1,560 @@
-from dataclasses import dataclass, asdict
-import copy
+import sys
+from array import array
+from bisect import bisect_left
+from collections import deque
+from operator import attrgetter
 
-MAX_UNDO_HISTORY = 50
+from core.timing import StepTimeIndex
+
+UNDO_MEMORY_BUDGET = 32 * 1024 * 1024   # bytes of history kept across undo + redo
+ENTRY_HISTORY_BYTES = 400               # rough cost of one ClickEntry held by the history
+
+# opcodes used by compiled plans — index into the player's dispatch table
+OP_NONE = 0
+OP_MOVE = 1
+OP_LEFT = 2
+OP_RIGHT = 3
+OP_DOUBLE = 4
+OP_PATH = 5
+OP_TRIPLE = 6
+OPCODES = {
+    "move": OP_MOVE, "left": OP_LEFT, "right": OP_RIGHT, "double": OP_DOUBLE,
+    "path": OP_PATH, "triple": OP_TRIPLE,
+}
+
+# per-step flag bits in compiled plans
+FLAG_MOVE_TO = 1
+FLAG_RETURN = 2
+
+
+class ReadOnlyScriptError(RuntimeError):
+    pass
+
+
+# click types are stored on entries as small ints; the table is fixed, so an
+# unknown name (a corrupt or newer file) is an error rather than a new code
+CLICK_TYPES = ["left", "right", "double", "move", "path", "triple"]
+_TYPE_CODES = {name: code for code, name in enumerate(CLICK_TYPES)}
+_TYPE_OPS = [OPCODES[name] for name in CLICK_TYPES]
+_TYPE_PATH = _TYPE_CODES["path"]
+
+_ACTION_NAMES = {
+    "left": "L-Click", "right": "R-Click",
+    "double": "Dbl-Click", "triple": "Tpl-Click", "move": "Move", "path": "Path",
+}
 
 
-@dataclass
 class ClickEntry:
-    x: int = 0
-    y: int = 0
-    click_type: str = "left"          # "left", "right", "double", "move"
-    delay_before: float = 0.5
-    return_cursor: bool = False
-    label: str = ""
-    move_to: bool = True
+    """
+    One script step. Slotted so million-step scripts don't pay for a __dict__
+    per entry; labels and easings are interned and the click type is a code.
+    Entries are immutable (scripts and undo history share them) — use replace().
+    """
+
+    __slots__ = ("_x", "_y", "_type", "_delay", "_return", "_label",
+                 "_move_to", "_path", "_easing")
+
+    def __init__(self, x: int = 0, y: int = 0, click_type: str = "left",
+                 delay_before: float = 0.5, return_cursor: bool = False, label: str = "",
+                 move_to: bool = True, path: array | None = None, easing: str = "linear"):
+        self._x = x
+        self._y = y
+        try:
+            self._type = _TYPE_CODES[click_type]   # "left", "right", "double", "triple", "move", "path"
+        except (KeyError, TypeError):
+            raise ValueError(f"unknown click type {click_type!r}") from None
+        self._delay = delay_before
+        self._return = return_cursor
+        self._label = sys.intern(label) if label else ""
+        self._move_to = move_to
+        self._path = path         # "path" only: flat (x, y, dt) triples, x/y is the end point
+        self._easing = easing if easing == "linear" else sys.intern(easing)  # see core.pathing.EASINGS
+
+    # read-only views of the slots, so assigning a field raises AttributeError
+    x = property(attrgetter("_x"))
+    y = property(attrgetter("_y"))
+    delay_before = property(attrgetter("_delay"))
+    return_cursor = property(attrgetter("_return"))
+    label = property(attrgetter("_label"))
+    move_to = property(attrgetter("_move_to"))
+    path = property(attrgetter("_path"))
+    easing = property(attrgetter("_easing"))
+    type_code = property(attrgetter("_type"))
+
+    @property
+    def click_type(self) -> str:
+        return CLICK_TYPES[self._type]
+
+    def replace(self, **changes) -> "ClickEntry":
+        """Copy with some fields changed (the path array is shared, not copied)."""
+        fields = {
+            "x": self._x, "y": self._y, "click_type": CLICK_TYPES[self._type],
+            "delay_before": self._delay, "return_cursor": self._return,
+            "label": self._label, "move_to": self._move_to, "path": self._path,
+            "easing": self._easing,
+        }
+        fields.update(changes)
+        return ClickEntry(**fields)
+
+    def _fields(self) -> tuple:
+        return (self._x, self._y, self._type, self._delay, self._return,
+                self._label, self._move_to, self._path, self._easing)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (
+            f"ClickEntry(x={self.x!r}, y={self.y!r}, click_type={self.click_type!r}, "
+            f"delay_before={self.delay_before!r}, return_cursor={self.return_cursor!r}, "
+            f"label={self.label!r}, move_to={self.move_to!r}, path={self.path!r}, "
+            f"easing={self.easing!r})"
+        )
+
+    def __getstate__(self):
+        # the click type by name, as __init__ takes it
+        return (self._x, self._y, self.click_type, self._delay, self._return,
+                self._label, self._move_to, self._path, self._easing)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
 
     def to_dict(self):
-        return asdict(self)
+        data = {
+            "x": self._x,
+            "y": self._y,
+            "click_type": CLICK_TYPES[self._type],
+            "delay_before": self._delay,
+            "return_cursor": self._return,
+            "label": self._label,
+            "move_to": self._move_to,
+        }
+        # plain steps stay identical to the original file format
+        if self._path is not None:
+            data["path"] = self._path.tolist()
+            data["easing"] = self._easing
+        return data
 
     @classmethod
     def from_dict(cls, data: dict):
-        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in known_fields}
-        return cls(**filtered)
+        get = data.get
+        path = get("path")
+        return cls(
+            get("x", 0), get("y", 0), get("click_type", "left"),
+            get("delay_before", 0.5), get("return_cursor", False), get("label", ""),
+            get("move_to", True),
+            array("d", path) if path is not None else None,
+            get("easing", "linear"),
+        )
+
+    @property
+    def path_duration(self) -> float:
+        """Seconds the path takes from its first to its last point."""
+        return sum(self.path[2::3]) if self.path is not None else 0.0
 
     def describe(self):
         """One-liner summary for display in the step list."""
         tag = f"[{self.label}] " if self.label else ""
-        action = {
-            "left": "L-Click", "right": "R-Click",
-            "double": "Dbl-Click", "move": "Move",
-        }.get(self.click_type, self.click_type)
+        action = _ACTION_NAMES.get(self.click_type, self.click_type)
         ret = " (return)" if self.return_cursor else ""
         return f"{tag}{action} @ ({self.x}, {self.y}) — {self.delay_before:.2f}s{ret}"
 
 
+def step_cost_ns(entry: ClickEntry) -> int:
+    """ns one step takes at 1x: its delay, then a path's own length."""
+    delay = round(max(0.0, entry._delay) * 1e9)
+    if entry._type == _TYPE_PATH and entry._path:
+        return delay + round(sum(max(0.0, dt) for dt in entry._path[2::3]) * 1e9)
+    return delay
+
+
+def build_time_index(steps) -> StepTimeIndex:
+    return StepTimeIndex([step_cost_ns(entry) for entry in steps])
+
+
+def _copy_array(typecode: str, view) -> array:
+    copy = array(typecode)
+    copy.frombytes(view.tobytes())
+    return copy
+
+
+class CompiledScript:
+    """
+    Flat, read-only execution plan. Each step is one slot in parallel typed
+    arrays, with delays already scaled and accumulated into absolute offsets.
+    """
+
+    __slots__ = ("xs", "ys", "ops", "offsets", "flags", "paths", "duration_ns",
+                 "speed_multiplier")
+
+    def __init__(self, xs: array, ys: array, ops: array, offsets: array, flags: array,
+                 paths: dict, duration_ns: int, speed_multiplier: float):
+        self.xs = memoryview(xs).toreadonly()
+        self.ys = memoryview(ys).toreadonly()
+        self.ops = memoryview(ops).toreadonly()
+        self.offsets = memoryview(offsets).toreadonly()   # ns from iteration start
+        self.flags = memoryview(flags).toreadonly()
+        # step index -> (xs, ys, cumulative ns, easing) for OP_PATH steps
+        self.paths = paths
+        self.duration_ns = duration_ns                    # includes a trailing path
+        self.speed_multiplier = speed_multiplier
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __reduce__(self):
+        # memoryviews don't pickle; ship copies of the arrays (e.g. to a playback worker)
+        return (CompiledScript, (
+            _copy_array("i", self.xs), _copy_array("i", self.ys), _copy_array("B", self.ops),
+            _copy_array("q", self.offsets), _copy_array("B", self.flags),
+            self.paths, self.duration_ns, self.speed_multiplier,
+        ))
+
+    def columns(self, start: int = 0):
+        """Per-step (offset_ns, x, y, op, flags) tuples in playback order, from step start."""
+        return zip(self.offsets[start:], self.xs[start:], self.ys[start:],
+                   self.ops[start:], self.flags[start:])
+
+    def offset_at(self, index: int) -> int:
+        return self.offsets[index]
+
+    def step_at(self, position_ns: int) -> int:
+        """First step not yet due position_ns into a loop; len(self) if every step is."""
+        return bisect_left(self.offsets, position_ns)
+
+    def nbytes(self) -> int:
+        columns = [self.xs, self.ys, self.ops, self.offsets, self.flags]
+        total = sum(col.nbytes for col in columns)
+        for pxs, pys, pts, _ in self.paths.values():
+            total += pxs.itemsize * len(pxs) + pys.itemsize * len(pys) + pts.itemsize * len(pts)
+        return total
+
+
+def compile_path(raw, speed: float):
+    """Flat (x, y, dt) path data -> (xs, ys, cumulative ns, elapsed seconds)."""
+    pxs, pys, pts = array("i"), array("i"), array("q")
+    elapsed = 0.0
+    for j in range(0, len(raw) - 2, 3):
+        elapsed += max(0.0, raw[j + 2]) / speed
+        pxs.append(int(raw[j]))
+        pys.append(int(raw[j + 1]))
+        pts.append(round(elapsed * 1e9))
+    return pxs, pys, pts, elapsed
+
+
+def compile_steps(steps: list[ClickEntry], speed_multiplier: float = 1.0,
+                  timeline=None) -> CompiledScript:
+    """
+    timeline, if given, holds each step's recorded start in ns; steps are then
+    placed on it directly instead of by summing their rounded delays.
+    """
+    speed = speed_multiplier if speed_multiplier > 0 else 1.0
+    xs = array("i")
+    ys = array("i")
+    ops = array("B")
+    offsets = array("q")
+    flags = array("B")
+    paths = {}
+
+    total = 0.0
+    for i, step in enumerate(steps):
+        if timeline is not None:
+            offsets.append(round(timeline[i] / speed))
+            total = timeline[i] / speed / 1e9
+        else:
+            total += max(0.0, step._delay) / speed
+            offsets.append(round(total * 1e9))
+        # slots read directly: this runs once per step on every compile
+        xs.append(int(step._x))
+        ys.append(int(step._y))
+        ops.append(_TYPE_OPS[step._type])
+        flags.append(
+            (FLAG_MOVE_TO if step._move_to else 0)
+            | (FLAG_RETURN if step._return else 0)
+        )
+
+        if step._type == _TYPE_PATH and step._path:
+            pxs, pys, pts, elapsed = compile_path(step._path, speed)
+            paths[i] = (pxs, pys, pts, step._easing)
+            # the next step's delay counts from the end of the path, not its start
+            total += elapsed
+
+    return CompiledScript(xs, ys, ops, offsets, flags, paths, round(total * 1e9), speed)
+
+
 class Script:
+    read_only = False
+
     def __init__(self, name: str = "Untitled"):
         self.name = name
         self.version = "1.0"
         self.repeat_count = 1          # 0 = infinite
         self.steps: list[ClickEntry] = []
-        self._undo_stack: list[list[ClickEntry]] = []
-        self._redo_stack: list[list[ClickEntry]] = []
+        # each change is (index, removed, inserted, cost): the slice
+        # steps[index:index + len(removed)] was replaced by inserted
+        self._undo_stack: deque[tuple] = deque()
+        self._redo_stack: list[tuple] = []
+        self._history_bytes = 0
+        self._revision = 0
+        self._compiled: tuple | None = None   # (key, CompiledScript)
+        self._timeline: array | None = None   # see timeline
+        self._timeline_revision = -1
+        self._time_index: StepTimeIndex | None = None   # see time_index
+        self._time_index_key = None
+
+    @property
+    def revision(self) -> int:
+        """Bumped on every change, including undo/redo."""
+        return self._revision
+
+    @property
+    def timeline(self) -> array | None:
+        """
+        Recorded start of every step in ns from the first one, kept from a
+        recording so playback can follow the original timing exactly. None
+        once the steps are edited (undo included) — delays still apply then.
+        """
+        timeline = self._timeline
+        if (timeline is None or self._timeline_revision != self._revision
+                or len(timeline) != len(self.steps)):
+            return None
+        return timeline
+
+    def attach_timeline(self, offsets):
+        """Set the recorded timeline for the current steps (one offset per step)."""
+        if len(offsets) != len(self.steps):
+            raise ValueError(f"timeline has {len(offsets)} entries for {len(self.steps)} steps")
+        self._timeline = offsets if isinstance(offsets, (array, memoryview)) else array("q", offsets)
+        self._timeline_revision = self._revision
+
+    def snapshot(self) -> "Script":
+        """
+        Cheap copy for saving off the UI thread. Entries are never mutated in
+        place, so sharing them is safe; only the list itself is copied.
+        """
+        if self.read_only:
+            return self
+        copy = Script(self.name)
+        copy.version = self.version
+        copy.repeat_count = self.repeat_count
+        copy.steps = list(self.steps)
+        copy._revision = self._revision
+        if self.timeline is not None:
+            copy.attach_timeline(self._timeline)
+        return copy
 
     # --- undo/redo helpers ---
 
-    def _snapshot(self):
-        self._undo_stack.append([copy.deepcopy(s) for s in self.steps])
-        if len(self._undo_stack) > MAX_UNDO_HISTORY:
-            self._undo_stack.pop(0)
+    @staticmethod
+    def _change_cost(removed, inserted) -> int:
+        cost = 64
+        for entry in (*removed, *inserted):
+            cost += ENTRY_HISTORY_BYTES
+            if entry.path is not None:
+                cost += entry.path.itemsize * len(entry.path)
+        return cost
+
+    def _splice(self, index: int, remove: int, inserted: list[ClickEntry]):
+        """
+        Replace steps[index:index + remove] with inserted and record the diff.
+        Entries are never mutated in place, so history holds references, not copies.
+        """
+        if self.read_only:
+            raise ReadOnlyScriptError(f"'{self.name}' is opened read-only")
+        removed = self.steps[index:index + remove]
+        self.steps[index:index + remove] = inserted
+        self._revision += 1
+        self._reindex(index, len(removed), inserted)
+
+        for change in self._redo_stack:
+            self._history_bytes -= change[3]
         self._redo_stack.clear()
 
+        cost = self._change_cost(removed, inserted)
+        self._undo_stack.append((index, removed, list(inserted), cost))
+        self._history_bytes += cost
+        # evict oldest changes once over budget, but always keep the latest one
+        while self._history_bytes > UNDO_MEMORY_BUDGET and len(self._undo_stack) > 1:
+            self._history_bytes -= self._undo_stack.popleft()[3]
+
     def undo(self) -> bool:
         if not self._undo_stack:
             return False
-        self._redo_stack.append([copy.deepcopy(s) for s in self.steps])
-        self.steps = self._undo_stack.pop()
+        change = self._undo_stack.pop()
+        index, removed, inserted, _ = change
+        self.steps[index:index + len(inserted)] = removed
+        self._redo_stack.append(change)
+        self._revision += 1
+        self._reindex(index, len(inserted), removed)
         return True
 
     def redo(self) -> bool:
         if not self._redo_stack:
             return False
-        self._undo_stack.append([copy.deepcopy(s) for s in self.steps])
-        self.steps = self._redo_stack.pop()
+        change = self._redo_stack.pop()
+        index, removed, inserted, _ = change
+        self.steps[index:index + len(removed)] = inserted
+        self._undo_stack.append(change)
+        self._revision += 1
+        self._reindex(index, len(removed), inserted)
         return True
 
+    # --- time index ---
+
+    def _time_key(self) -> tuple:
+        return (self._revision, id(self.steps), len(self.steps))
+
+    def _reindex(self, index: int, removed: int, inserted: list[ClickEntry]):
+        """
+        Carry the time index across a splice that was just applied. Edits in
+        place and changes at the end are patched in O(log n) per step; an
+        insert or delete in the middle shifts every later step, so the index
+        is dropped and rebuilt on the next query instead.
+        """
+        times = self._time_index
+        if times is None:
+            return
+        before = (self._revision - 1, id(self.steps), len(self.steps) - len(inserted) + removed)
+        if self._time_index_key != before:
+            self._time_index = None
+            return
+        if removed == len(inserted):
+            for offset, entry in enumerate(inserted):
+                times.set(index + offset, step_cost_ns(entry))
+        elif index + removed == len(times):
+            times.truncate(index)
+            for entry in inserted:
+                times.append(step_cost_ns(entry))
+        else:
+            self._time_index = None
+            return
+        self._time_index_key = self._time_key()
+
+    @property
+    def time_index(self) -> StepTimeIndex:
+        """Cumulative step times at 1x (for group totals), kept up to date as the steps change."""
+        key = self._time_key()
+        if self._time_index is None or self._time_index_key != key:
+            self._time_index = build_time_index(self.steps)
+            self._time_index_key = key
+        return self._time_index
+
     # --- step manipulation ---
 
     def add_step(self, entry: ClickEntry, index: int | None = None):
-        self._snapshot()
-        if index is not None:
-            self.steps.insert(index, entry)
-        else:
-            self.steps.append(entry)
+        if index is None:
+            index = len(self.steps)
+        self._splice(index, 0, [entry])
+
+    def add_steps(self, entries: list[ClickEntry], index: int | None = None):
+        """Insert several steps as a single undoable change."""
+        if not entries:
+            return
+        if index is None:
+            index = len(self.steps)
+        self._splice(index, 0, entries)
+
+    def add_recorded_steps(self, entries: list[ClickEntry], offsets):
+        """
+        Append a recording as one undoable change, along with its timestamps
+        (ns from its first step). The steps already here keep their recorded
+        starts, or the ones their delays give, so the whole script stays on
+        one timeline.
+        """
+        if not entries:
+            return
+        plan = self.compile(1.0)
+        timeline = array("q", plan.offsets)
+        base = plan.duration_ns
+        timeline.extend(base + t for t in offsets)
+        self.add_steps(entries)
+        self.attach_timeline(timeline)
 
     def edit_step(self, index: int, entry: ClickEntry):
         if 0 <= index < len(self.steps):
-            self._snapshot()
-            self.steps[index] = entry
+            self._splice(index, 1, [entry])
 
     def delete_step(self, index: int):
         if 0 <= index < len(self.steps):
-            self._snapshot()
-            self.steps.pop(index)
+            self._splice(index, 1, [])
 
     def move_step(self, index: int, direction: int):
         """Move a step up (direction=-1) or down (direction=1)."""
         target = index + direction
         if 0 <= index < len(self.steps) and 0 <= target < len(self.steps):
-            self._snapshot()
-            self.steps[index], self.steps[target] = self.steps[target], self.steps[index]
+            lo = min(index, target)
+            self._splice(lo, 2, [self.steps[lo + 1], self.steps[lo]])
             return target
         return index
 
     def clear(self):
-        self._snapshot()
-        self.steps.clear()
+        self._splice(0, len(self.steps), [])
+
+    def _replace_all(self, steps: list[ClickEntry]):
+        self._splice(0, len(self.steps), steps)
+
+    def simplify_moves(self, tolerance: float = 2.0, time_tolerance: float = 0.05) -> dict:
+        """
+        Thin out recorded mouse paths (see core.pathing). Undoable; returns the
+        compression report. Nothing is changed if no move samples can be dropped.
+        """
+        from core.pathing import simplify_moves
+
+        simplified, report, _ = simplify_moves(self.steps, tolerance, time_tolerance)
+        if report["after"] < report["before"]:
+            self._replace_all(simplified)
+        return report
+
+    def convert_moves_to_paths(self, min_moves: int = 2) -> int:
+        """
+        Collapse every run of consecutive move steps into one "path" step.
+        Undoable; returns how many path steps were created.
+        """
+        from core.pathing import group_steps, moves_to_path
+
+        converted = []
+        created = 0
+        for _, entries in group_steps(self.steps):
+            if len(entries) >= min_moves and entries[0].click_type == "move":
+                converted.append(moves_to_path(entries))
+                created += 1
+            else:
+                converted.extend(entries)
+        if created:
+            self._replace_all(converted)
+        return created
+
+    # --- playback ---
+
+    def compile(self, speed_multiplier: float = 1.0, use_timeline: bool = True) -> CompiledScript:
+        """
+        Build (or reuse) the flat execution plan the player iterates. Steps
+        follow the recorded timeline when there is one and use_timeline is set.
+        """
+        timeline = self.timeline if use_timeline else None
+        key = (self._revision, id(self.steps), len(self.steps), speed_multiplier,
+               timeline is not None)
+        if self._compiled is None or self._compiled[0] != key:
+            self._compiled = (key, compile_steps(self.steps, speed_multiplier, timeline))
+        return self._compiled[1]
 
     # --- serialization ---
 
     def to_dict(self):
-        return {
+        data = {
             "version": self.version,
             "name": self.name,
             "repeat_count": self.repeat_count,
             "steps": [s.to_dict() for s in self.steps],
         }
+        timeline = self.timeline
+        if timeline is not None:
+            data["timeline_ns"] = timeline.tolist()
+        return data
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -113,4 +562,7 @@ class Script:
         script.version = data.get("version", "1.0")
         script.repeat_count = data.get("repeat_count", 1)
         script.steps = [ClickEntry.from_dict(s) for s in data.get("steps", [])]
+        timeline = data.get("timeline_ns")
+        if timeline is not None and len(timeline) == len(script.steps):
+            script.attach_timeline(timeline)
         return script
@@ -0,0 +1,194 @@
+import csv
+import json
+import time
+
+from core.backends import MemoryBackend
+from core.player import Player
+from core.script import Script
+
+DEFAULT_SCREEN = (1920, 1080)   # used when pyautogui can't tell us (no display)
+MAX_REPORT_ROWS = 200_000       # per-action rows kept for export; counts cover every action
+SIM_PATH_RATE = 60.0            # path frames per virtual second; bounds are checked per frame
+
+
+def screen_size() -> tuple[int, int]:
+    """pyautogui.size(), or DEFAULT_SCREEN where there is no display to ask."""
+    try:
+        import pyautogui
+        width, height = pyautogui.size()
+        return int(width), int(height)
+    except Exception:
+        return DEFAULT_SCREEN
+
+
+class VirtualClock:
+    """Stands in for perf_counter in the Player: time only moves when something waits."""
+
+    def __init__(self, start_ns: int = 0):
+        self.now = start_ns
+
+    def now_ns(self) -> int:
+        return self.now
+
+    def wait_until(self, deadline_ns: int, stop_event) -> bool:
+        if deadline_ns > self.now:
+            self.now = deadline_ns
+        return not stop_event.is_set()
+
+
+class SimulationReport:
+    """
+    What a simulated run did, in virtual time: every action with its step,
+    when each iteration started and ended, and which steps put the cursor
+    outside the screen.
+    """
+
+    CSV_COLUMNS = ("iteration", "step", "t_ms", "action", "x", "y", "in_bounds")
+
+    def __init__(self, screen: tuple[int, int], max_rows: int = MAX_REPORT_ROWS):
+        self.screen = screen
+        self.max_rows = max_rows
+        self.rows: list[tuple] = []          # (iteration, step, t_ns, action, x, y, in_bounds)
+        self.rows_dropped = 0
+        self.actions = 0
+        self.iterations: list[list[int]] = []   # [start_ns, end_ns] per iteration
+        # step -> [first iteration, action, x, y, times seen]
+        self.out_of_bounds: dict[int, list] = {}
+        self.errors: list[str] = []
+        self.duration_ns = 0
+        self.wall_s = 0.0
+
+    def summary(self) -> dict:
+        spans = [end - start for start, end in self.iterations]
+        count = len(self.iterations)
+        return {
+            "iterations": count,
+            "actions": self.actions,
+            "screen": list(self.screen),
+            "virtual_duration_s": self.duration_ns / 1e9,
+            "iteration_s": {
+                "min": min(spans) / 1e9 if spans else 0.0,
+                "max": max(spans) / 1e9 if spans else 0.0,
+            },
+            "wall_s": round(self.wall_s, 6),
+            "iterations_per_s": round(count / self.wall_s) if self.wall_s else None,
+            "out_of_bounds": [
+                {"step": step, "first_iteration": it, "action": action, "x": x, "y": y, "count": n}
+                for step, (it, action, x, y, n) in sorted(self.out_of_bounds.items())
+            ],
+            "errors": self.errors,
+            "rows_dropped": self.rows_dropped,
+        }
+
+    def iteration_durations(self) -> list[float]:
+        """Seconds from each iteration's first scheduled step to its last action."""
+        return [(end - start) / 1e9 for start, end in self.iterations]
+
+    def export_rows(self):
+        for it, step, t_ns, action, x, y, ok in self.rows:
+            yield it, step, t_ns / 1e6, action, x, y, ok
+
+    def to_csv(self, filepath: str):
+        with open(filepath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.CSV_COLUMNS)
+            for row in self.export_rows():
+                writer.writerow(row)
+
+    def to_json(self, filepath: str):
+        data = {
+            "summary": self.summary(),
+            "iteration_s": self.iteration_durations(),
+            "actions": [dict(zip(self.CSV_COLUMNS, row)) for row in self.export_rows()],
+        }
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def export(self, filepath: str):
+        """Write CSV or JSON depending on the file extension."""
+        if filepath.lower().endswith(".json"):
+            self.to_json(filepath)
+        else:
+            self.to_csv(filepath)
+
+
+class SimulationBackend(MemoryBackend):
+    """
+    MemoryBackend on a virtual clock that writes each action into a report,
+    tagged with the step that issued it and checked against the screen.
+    """
+
+    def __init__(self, clock: VirtualClock, report: SimulationReport):
+        width, height = report.screen
+        super().__init__(width, height, clock=clock.now_ns)
+        self._report = report
+        self.iteration = -1
+        self.step = -1
+
+    def enter_step(self, index: int):
+        """Player.on_step_change hook: called before each step waits for its deadline."""
+        if index == 0:
+            self.iteration += 1
+        self.step = index
+
+    def begin_iteration(self, start_ns: int):
+        self._report.iterations.append([start_ns, start_ns])
+
+    def _record(self, action, x, y):
+        self._x, self._y = x, y
+        report = self._report
+        t = self._clock()
+        width, height = self.size
+        ok = 0 <= x < width and 0 <= y < height
+        report.actions += 1
+        if report.iterations:
+            report.iterations[-1][1] = t
+        if not ok:
+            seen = report.out_of_bounds.get(self.step)
+            if seen is None:
+                report.out_of_bounds[self.step] = [self.iteration, action, x, y, 1]
+            else:
+                seen[4] += 1
+        if len(report.rows) < report.max_rows:
+            report.rows.append((self.iteration, self.step, t, action, x, y, ok))
+        else:
+            report.rows_dropped += 1
+
+
+def simulate(script: Script, iterations: int | None = None, speed: float = 1.0,
+             repeat_delay: float = 0.0, screen: tuple[int, int] | None = None,
+             use_timeline: bool = True, max_rows: int = MAX_REPORT_ROWS) -> SimulationReport:
+    """
+    Run script through the real Player against a virtual clock and a fake
+    backend, so hours of playback finish in milliseconds. iterations
+    defaults to the script's repeat count (1 if it loops forever).
+    """
+    if iterations is None:
+        iterations = script.repeat_count or 1
+    report = SimulationReport(screen or screen_size(), max_rows)
+    clock = VirtualClock()
+    backend = SimulationBackend(clock, report)
+
+    player = Player(backend)
+    player.clock = clock
+    player.speed_multiplier = speed
+    player.repeat_delay = repeat_delay
+    player.path_rate = SIM_PATH_RATE
+    player.use_timeline = use_timeline
+    player.on_error = report.errors.append
+
+    plan = script.compile(speed, player.use_timeline)
+    period = plan.duration_ns + round(max(0.0, repeat_delay) * 1e9)
+
+    def on_step(index):
+        if index == 0:
+            backend.begin_iteration((backend.iteration + 1) * period)
+        backend.enter_step(index)
+
+    player.on_step_change = on_step
+
+    started = time.perf_counter()
+    player.run(script, repeat=max(1, iterations))
+    report.wall_s = time.perf_counter() - started
+    report.duration_ns = clock.now
+    return report
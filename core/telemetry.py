@@ -0,0 +1,159 @@
+import csv
+import json
+from array import array
+
+SUB_BUCKET_BITS = 5        # 32 linear buckets per power of two: values within ~3%
+MAX_TRACKABLE_NS = 1 << 40  # ~18 minutes; anything slower lands in the last bucket
+MAX_TRACE_STEPS = 200_000   # per-step rows kept for export; histograms see every step
+
+_SUB = 1 << SUB_BUCKET_BITS
+
+
+def _bucket(value: int) -> int:
+    if value < 2 * _SUB:
+        return max(0, value)
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return shift * _SUB + (value >> shift)
+
+
+def _bucket_high(index: int) -> int:
+    """Largest value that falls in bucket index."""
+    if index < 2 * _SUB:
+        return index
+    shift = index // _SUB - 1
+    mantissa = index - shift * _SUB
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of nanosecond durations. Buckets are linear inside
+    each power of two, so relative error is bounded at every scale while the
+    whole thing stays a fixed ~10KB no matter how many values are recorded.
+    """
+
+    def __init__(self):
+        self.counts = array("q", bytes(8 * (_bucket(MAX_TRACKABLE_NS) + 1)))
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value_ns: int):
+        value_ns = max(0, min(value_ns, MAX_TRACKABLE_NS))
+        self.counts[_bucket(value_ns)] += 1
+        self.count += 1
+        self.total += value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+
+    def percentile(self, p: float) -> int:
+        """Value at or below which p percent of recordings fall (bucket upper bound)."""
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(_bucket_high(index), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """p50/p95/p99/max and mean, in milliseconds."""
+        ms = lambda ns: round(ns / 1e6, 3)
+        return {
+            "count": self.count,
+            "mean_ms": ms(self.total / self.count) if self.count else 0.0,
+            "p50_ms": ms(self.percentile(50)),
+            "p95_ms": ms(self.percentile(95)),
+            "p99_ms": ms(self.percentile(99)),
+            "max_ms": ms(self.max),
+        }
+
+
+class PlaybackTelemetry:
+    """
+    Per-run timing record filled in by the Player: when each step was due,
+    when the wait actually returned (sleep overshoot), how long the backend
+    call took, and how late the action had finished overall.
+    """
+
+    CSV_COLUMNS = ("iteration", "step", "scheduled_ms", "actual_ms",
+                   "overshoot_ms", "backend_ms", "late_ms")
+
+    def __init__(self, max_trace: int = MAX_TRACE_STEPS):
+        self.max_trace = max_trace
+        self.reset()
+
+    def reset(self, start_ns: int = 0):
+        self.start_ns = start_ns
+        self.overshoot = LatencyHistogram()
+        self.backend = LatencyHistogram()
+        self.late = LatencyHistogram()
+        # trace columns, times relative to start_ns; backend -1 = not measured
+        self._iterations = array("i")
+        self._steps = array("q")
+        self._scheduled = array("q")
+        self._actual = array("q")
+        self._backend = array("q")
+        self.trace_dropped = 0
+
+    def record(self, iteration: int, index: int, scheduled_ns: int, actual_ns: int,
+               backend_ns: int | None):
+        overshoot = actual_ns - scheduled_ns
+        self.overshoot.record(overshoot)
+        if backend_ns is not None:
+            self.backend.record(backend_ns)
+        self.late.record(overshoot + (backend_ns or 0))
+
+        if len(self._steps) >= self.max_trace:
+            self.trace_dropped += 1
+            return
+        self._iterations.append(iteration)
+        self._steps.append(index)
+        self._scheduled.append(scheduled_ns - self.start_ns)
+        self._actual.append(actual_ns - self.start_ns)
+        self._backend.append(-1 if backend_ns is None else backend_ns)
+
+    def summary(self) -> dict:
+        return {
+            "steps": self.overshoot.count,
+            "trace_dropped": self.trace_dropped,
+            "late": self.late.summary(),
+            "overshoot": self.overshoot.summary(),
+            "backend": self.backend.summary(),
+        }
+
+    def rows(self):
+        """One tuple per traced step, matching CSV_COLUMNS (times in ms)."""
+        for it, step, sched, actual, backend in zip(
+            self._iterations, self._steps, self._scheduled, self._actual, self._backend,
+        ):
+            backend_ms = backend / 1e6 if backend >= 0 else None
+            yield (
+                it, step, sched / 1e6, actual / 1e6, (actual - sched) / 1e6,
+                backend_ms, (actual - sched + max(0, backend)) / 1e6,
+            )
+
+    def to_csv(self, filepath: str):
+        with open(filepath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.CSV_COLUMNS)
+            for row in self.rows():
+                writer.writerow("" if v is None else (f"{v:.4f}" if isinstance(v, float) else v)
+                                for v in row)
+
+    def to_json(self, filepath: str):
+        data = {
+            "summary": self.summary(),
+            "steps": [dict(zip(self.CSV_COLUMNS, row)) for row in self.rows()],
+        }
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def export(self, filepath: str):
+        """Write CSV or JSON depending on the file extension."""
+        if filepath.lower().endswith(".json"):
+            self.to_json(filepath)
+        else:
+            self.to_csv(filepath)
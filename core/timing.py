@@ -0,0 +1,120 @@
+import sys
+import time
+from array import array
+
+# Event.wait() can only be trusted to the OS timer resolution, so the last
+# stretch before a deadline is spun. Windows timers tick every ~15.6ms.
+SPIN_THRESHOLD_NS = 16_000_000 if sys.platform == "win32" else 2_000_000
+
+
+def now_ns() -> int:
+    return time.perf_counter_ns()
+
+
+def wait_until(deadline_ns: int, stop_event) -> bool:
+    """
+    Block until the perf_counter deadline using a coarse wait followed by a
+    short spin. Returns False as soon as stop_event is set.
+    """
+    remaining = deadline_ns - time.perf_counter_ns()
+    if remaining > SPIN_THRESHOLD_NS:
+        if stop_event.wait((remaining - SPIN_THRESHOLD_NS) / 1e9):
+            return False
+
+    while time.perf_counter_ns() < deadline_ns:
+        if stop_event.is_set():
+            return False
+        # sleep(0) yields the GIL so the UI thread isn't starved while we spin
+        time.sleep(0)
+
+    return not stop_event.is_set()
+
+
+class Timeline:
+    """
+    Absolute schedule for a script run. Offsets are cumulative, speed-scaled
+    step delays in integer nanoseconds (see Script.compile), so repeated loops
+    never accumulate rounding or sleep error.
+    """
+
+    def __init__(self, offsets, repeat_delay: float = 0.0, iteration_ns: int | None = None):
+        self.offsets = offsets
+        if iteration_ns is None:
+            iteration_ns = offsets[-1] if len(offsets) else 0
+        self.iteration_ns = iteration_ns
+        self.repeat_delay_ns = round(max(0.0, repeat_delay) * 1e9)
+        self.start_ns = 0
+
+    def start(self, start_ns: int | None = None):
+        self.start_ns = now_ns() if start_ns is None else start_ns
+
+    def iteration_base(self, iteration: int) -> int:
+        return self.start_ns + iteration * (self.iteration_ns + self.repeat_delay_ns)
+
+    def deadline(self, iteration: int, index: int) -> int:
+        return self.iteration_base(iteration) + self.offsets[index]
+
+    def shift(self, delta_ns: int):
+        """Push every remaining deadline back, e.g. by the time spent paused."""
+        self.start_ns += delta_ns
+
+    def seek(self, iteration: int, position_ns: int, now: int):
+        """Re-anchor so that now is position_ns into loop iteration."""
+        self.start_ns = now - position_ns - iteration * (self.iteration_ns + self.repeat_delay_ns)
+
+
+class StepTimeIndex:
+    """
+    Fenwick tree over each step's time cost in ns: its delay_before plus, for
+    a path, the path's own length. Gives the time taken by any run of steps
+    in O(log n). Changing a step in place is O(log n), and so is adding or
+    removing steps at the end; an insert or delete in the middle needs a
+    rebuild, which is O(n).
+    """
+
+    def __init__(self, costs=()):
+        self._costs = array("q", costs)
+        tree = array("q", [0])
+        tree.extend(self._costs)                 # 1-based: tree[i] covers a run ending at step i - 1
+        n = len(tree) - 1
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def __len__(self):
+        return len(self._costs)
+
+    def prefix(self, count: int) -> int:
+        """ns taken by the first count steps, paths included."""
+        tree = self._tree
+        total = 0
+        while count > 0:
+            total += tree[count]
+            count &= count - 1
+        return total
+
+    def span_ns(self, start: int, end: int) -> int:
+        """ns taken by steps[start:end]."""
+        return self.prefix(end) - self.prefix(start)
+
+    def set(self, index: int, cost_ns: int):
+        diff = cost_ns - self._costs[index]
+        self._costs[index] = cost_ns
+        tree = self._tree
+        i = index + 1
+        while i < len(tree):
+            tree[i] += diff
+            i += i & -i
+
+    def append(self, cost_ns: int):
+        n = len(self._costs) + 1
+        # node n covers steps n - lowbit(n) .. n - 1
+        self._tree.append(cost_ns + self.prefix(n - 1) - self.prefix(n - (n & -n)))
+        self._costs.append(cost_ns)
+
+    def truncate(self, count: int):
+        """Drop every step from index count on."""
+        del self._costs[count:]
+        del self._tree[count + 1:]
@@ -1,9 +1,21 @@
+import os
 import sys
-import customtkinter as ctk
-from ui.app_window import GhostClickApp
+import time
+
+_STARTED = time.perf_counter()
+
+CLI_COMMANDS = {"run", "convert", "schedule", "daemon", "simulate"}
 
 
 def main():
+    # headless subcommands never touch the GUI stack
+    if len(sys.argv) > 1 and sys.argv[1] in CLI_COMMANDS:
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:], started=_STARTED))
+
+    import customtkinter as ctk
+    from ui.app_window import GhostClickApp
+
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
 
@@ -13,8 +25,24 @@ def main():
         script_path = sys.argv[1]
 
     app = GhostClickApp(script_path=script_path)
+    if os.environ.get("GHOSTCLICK_STARTUP_PROBE"):
+        _probe_startup(app)
     app.mainloop()
 
 
+def _probe_startup(app):
+    """Print the time until the window is first mapped, then quit (see benchmarks/startup.py)."""
+    def _mapped(event=None):
+        if event is not None and event.widget is not app:
+            return
+        print(f"window-visible-ms {(time.perf_counter() - _STARTED) * 1000:.1f}", flush=True)
+        app.after(0, app.destroy)
+    app.bind("<Map>", _mapped, add="+")
+
+
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):
+        # lets the exe double as the isolated playback worker (core.process_player)
+        import multiprocessing
+        multiprocessing.freeze_support()
     main()
@@ -1,18 +1,18 @@
 import os
 import sys
+import threading
+import time
 from tkinter import filedialog
 from datetime import datetime
 
 import customtkinter as ctk
-import keyboard
-import pyautogui
 
 from core.script import Script, ClickEntry
 from core.player import Player
 from core.recorder import Recorder
-from core.scheduler import ScriptScheduler
+from core.scheduler import ScheduledJob, ScriptScheduler, parse_when
 from ui.click_list import ClickList
-from ui.dialogs import show_info, show_warning, show_error, ask_yes_no
+from ui.dialogs import ScheduleDialog, show_info, show_warning, show_error, ask_yes_no, ask_restore
 from ui.settings_panel import SettingsPanel
 from ui.theme import (
     BG_BASE, BG_SURFACE, BG_ELEVATED, BG_INPUT, BORDER, BORDER_FOCUS,
@@ -22,7 +22,24 @@ from ui.theme import (
     TEXT, TEXT_SEC, TEXT_DIM, FAMILY,
     RADIUS_SM, RADIUS_MD, RADIUS_LG,
 )
-from utils.file_io import save_script, load_script, GHOSTCLICK_EXT
+from utils.events import EventChannel
+from utils.autosave import AutosaveService, discard_journal, find_journals
+from utils.binary_format import is_binary_file
+from utils.file_io import load_script, GHOSTCLICK_EXT
+
+UI_FRAME_MS = 16    # worker-thread events are applied at most once per frame (~60 Hz)
+HOTKEY_INIT_DELAY_MS = 100
+RECOVERY_DELAY_MS = 300     # offer crash recovery once the window is on screen
+SCHEDULE_RESTORE_MS = 1000  # re-arm stored scheduled jobs after startup has settled
+PROGRESS_TICK_MS = 200      # playback progress bars / time left refresh rate
+SCHEDULE_RETRY_MS = 250     # how often a due scheduled run checks whether the app is free yet
+
+
+def _format_eta(seconds: float) -> str:
+    seconds = max(0, int(seconds + 0.5))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours}:{minutes:02}:{seconds:02}" if hours else f"{minutes}:{seconds:02}"
 
 
 class GhostClickApp(ctk.CTk):
@@ -41,17 +58,48 @@ class GhostClickApp(ctk.CTk):
         # core objects
         self.script = Script()
         self.player = Player()
+        self._thread_player = self.player
+        self._process_player = None     # ProcessPlayer, made when "separate process" is first used
+        self._polled_step = -1
         self.recorder = Recorder()
         self.scheduler = ScriptScheduler()
+        self.scheduler.on_run = self._on_scheduled_run
+        self.scheduler.on_error = lambda name, msg: self._events.post(
+            "call", lambda: self._set_status(f"Scheduled job \u201c{name}\u201d: {msg}"))
+        self._scheduled_run = None      # (job name, step count, highlight rows) while one plays
+        self._scheduled_done = None     # Event the scheduler thread waits on until that run ends
+        self._scheduled_waits = set()   # every such Event still pending, released on close
+        self._playback_ended = 0.0      # time.monotonic() of the last run's end, for repeat_delay
+        self._closing = False
         self._current_file: str | None = None
+        self._current_binary = False     # re-save in the format the file was opened in
+        self._saved_revision = self.script.revision
+        # all writes to disk happen on the autosave worker, never on the Tk thread
+        self.autosave = AutosaveService()
+        self.autosave.on_error = lambda msg: self._events.post("call", lambda: self._set_status(msg))
         self._hotkey_hook = None
         self._quick_add_hook = None
         self._play_stop_hook = None
+        self._pause_hook = None
         self._editing_index: int | None = None
 
-        screen_w, screen_h = pyautogui.size()
-        self._screen_w = screen_w
-        self._screen_h = screen_h
+        # every callback from player/recorder/hotkey threads goes through this
+        # channel; one after() pump on the Tk thread drains it each frame
+        self._events = EventChannel(coalesce=("step",), batch=("recorded",))
+        self._event_handlers = {
+            "step": self._apply_step_change,
+            "done": self._apply_playback_done,
+            "error": self._apply_playback_error,
+            "recorded": self._apply_recorded,
+            "coords": lambda xy: self._fill_coords(*xy),
+            "quick_add": self._append_quick_step,
+            "call": lambda fn: fn(),
+        }
+        self._pump_id = None
+
+        # ask Tk rather than pyautogui so startup doesn't have to import it
+        self._screen_w = self.winfo_screenwidth()
+        self._screen_h = self.winfo_screenheight()
 
         self.player.on_step_change = self._on_step_change
         self.player.on_playback_done = self._on_playback_done
@@ -59,16 +107,22 @@ class GhostClickApp(ctk.CTk):
 
         self._build_layout()
         self._bind_shortcuts()
-        self._register_hotkey()
+        # global hotkeys pull in the keyboard hook — do it once the window is up
+        self.after(HOTKEY_INIT_DELAY_MS, self._register_hotkey)
 
         # wire file association button from settings panel
         self.settings.assoc_btn.configure(command=self._register_association)
         self.settings.on_hotkey_change = self._register_hotkey
+        self.settings.on_isolated_change = self._on_isolated_change
+        self.settings.on_export_timing = self._export_timing
 
         if script_path and os.path.isfile(script_path):
             self._load_from_path(script_path)
+        self.after(RECOVERY_DELAY_MS, self._offer_recovery)
+        self.after(SCHEDULE_RESTORE_MS, self._restore_schedules)
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._pump_events()
 
     # ═══════════════════════════════════════════════════════════
     #  LAYOUT
@@ -138,6 +192,16 @@ class GhostClickApp(ctk.CTk):
         )
         self.stop_btn.pack(side="left", padx=(0, 6))
 
+        self.pause_btn = ctk.CTkButton(
+            left, text="Pause", width=80, height=36,
+            fg_color=NEUTRAL, hover_color=NEUTRAL_HOVER, text_color=TEXT_SEC,
+            font=ctk.CTkFont(family=FAMILY, size=13),
+            corner_radius=RADIUS_MD,
+            command=self._toggle_pause,
+            state="disabled",
+        )
+        self.pause_btn.pack(side="left", padx=(0, 6))
+
         self.record_btn = ctk.CTkButton(
             left, text="Record", width=92, height=36,
             fg_color=AMBER, hover_color=AMBER_HOVER, text_color="#1a1a1a",
@@ -183,6 +247,30 @@ class GhostClickApp(ctk.CTk):
         )
         self.status_label.pack(side="right")
 
+        # playback progress, shown only while playing: this loop on top, the
+        # whole run below, then the time left
+        self.progress_box = ctk.CTkFrame(right, fg_color="transparent")
+        bars = ctk.CTkFrame(self.progress_box, fg_color="transparent")
+        bars.pack(side="left")
+        self.loop_bar = ctk.CTkProgressBar(
+            bars, width=110, height=5, corner_radius=2,
+            fg_color=BORDER, progress_color=ACCENT,
+        )
+        self.loop_bar.pack(pady=(0, 3))
+        self.run_bar = ctk.CTkProgressBar(
+            bars, width=110, height=5, corner_radius=2,
+            fg_color=BORDER, progress_color=TEXT_SEC,
+        )
+        self.run_bar.pack()
+        self.eta_label = ctk.CTkLabel(
+            self.progress_box, text="",
+            font=ctk.CTkFont(family=FAMILY, size=11),
+            text_color=TEXT_DIM,
+        )
+        self.eta_label.pack(side="left", padx=(8, 0))
+        self._progress = None       # (loop seconds, repeat delay, loops) while playing
+        self._progress_job = None
+
         sep_r = ctk.CTkFrame(right, fg_color=BORDER, width=1, height=18)
         sep_r.pack(side="right", padx=10)
 
@@ -274,7 +362,7 @@ class GhostClickApp(ctk.CTk):
         self._form_label(r1, "Action")
         self.click_type_var = ctk.StringVar(value="Left Click")
         self.click_type_menu = ctk.CTkOptionMenu(
-            r1, values=["Left Click", "Right Click", "Double Click", "Move"],
+            r1, values=["Left Click", "Right Click", "Double Click", "Triple Click", "Move"],
             variable=self.click_type_var, width=130, height=34,
             fg_color=BG_INPUT, button_color=BORDER, button_hover_color=BG_ELEVATED,
             text_color=TEXT, dropdown_fg_color=BG_ELEVATED,
@@ -370,6 +458,8 @@ class GhostClickApp(ctk.CTk):
     # ═══════════════════════════════════════════════════════════
 
     def _set_editing_enabled(self, enabled: bool):
+        if self.script.read_only:
+            enabled = False
         state = "normal" if enabled else "disabled"
         for btn in self._edit_buttons:
             btn.configure(state=state)
@@ -377,11 +467,24 @@ class GhostClickApp(ctk.CTk):
     def _set_status(self, text: str):
         self.status_label.configure(text=text)
 
+    def _refresh_list(self):
+        script = self.script
+        # indexing a mapped script would decode every step in the file
+        times = None if script.read_only else script.time_index
+        self.click_list.refresh(script.steps, times)
+
+    def _blocked_read_only(self) -> bool:
+        """Refuse an edit on a memory-mapped script, saying why."""
+        if self.script.read_only:
+            self._set_status("Large recording is open read-only \u2014 Save As to edit a copy")
+            return True
+        return False
+
     def _update_step_count(self):
         n = len(self.script.steps)
         self.step_count_label.configure(text=f"{n} step{'s' if n != 1 else ''}")
         # sync selection-dependent buttons
-        has_sel = self.click_list.selected_index >= 0
+        has_sel = self.click_list.selected_index >= 0 and not self.script.read_only
         state = "normal" if has_sel else "disabled"
         for btn in self._selection_buttons:
             btn.configure(state=state)
@@ -392,7 +495,7 @@ class GhostClickApp(ctk.CTk):
 
     _ACTION_TO_INTERNAL = {
         "Left Click": "left", "Right Click": "right",
-        "Double Click": "double", "Move": "move",
+        "Double Click": "double", "Triple Click": "triple", "Move": "move",
     }
     _INTERNAL_TO_ACTION = {v: k for k, v in _ACTION_TO_INTERNAL.items()}
 
@@ -458,17 +561,25 @@ class GhostClickApp(ctk.CTk):
     # ═══════════════════════════════════════════════════════════
 
     def _add_step(self):
+        if self._blocked_read_only():
+            return
         entry = self._entry_from_form()
         if entry:
             self.script.add_step(entry)
-            self.click_list.refresh(self.script.steps)
+            self._refresh_list()
             self._update_title()
             self._update_step_count()
 
     def _start_edit(self, index: int):
         if self.player.is_running:
             return
+        if self._blocked_read_only():
+            return
         if 0 <= index < len(self.script.steps):
+            if self.script.steps[index].click_type == "path":
+                # the form has no way to edit path points — editing would flatten it
+                self._set_status("Path steps can't be edited in the form")
+                return
             self._editing_index = index
             self._populate_form(self.script.steps[index])
             self.form_title.configure(text=f"Editing Step {index + 1}")
@@ -477,11 +588,13 @@ class GhostClickApp(ctk.CTk):
             self.cancel_edit_btn.pack(side="left", padx=(0, 5))
 
     def _update_step(self):
+        if self._blocked_read_only():
+            return
         if self._editing_index is not None:
             entry = self._entry_from_form()
             if entry:
                 self.script.edit_step(self._editing_index, entry)
-                self.click_list.refresh(self.script.steps)
+                self._refresh_list()
                 self._cancel_edit()
                 self._update_title()
 
@@ -494,28 +607,34 @@ class GhostClickApp(ctk.CTk):
         self._clear_form()
 
     def _delete_step(self):
+        if self._blocked_read_only():
+            return
         idx = self.click_list.selected_index
         if idx >= 0:
             self.script.delete_step(idx)
-            self.click_list.refresh(self.script.steps)
+            self._refresh_list()
             self._update_title()
             self._update_step_count()
 
     def _delete_all_steps(self):
+        if self._blocked_read_only():
+            return
         if not self.script.steps:
             return
         if not ask_yes_no(self, "Delete All", f"Delete all {len(self.script.steps)} steps?"):
             return
         self.script.clear()
-        self.click_list.refresh(self.script.steps)
+        self._refresh_list()
         self._update_title()
         self._update_step_count()
 
     def _move_step(self, direction: int):
+        if self._blocked_read_only():
+            return
         idx = self.click_list.selected_index
         if idx >= 0:
             new_idx = self.script.move_step(idx, direction)
-            self.click_list.refresh(self.script.steps)
+            self._refresh_list()
             self.click_list.select(new_idx)
             self._update_title()
 
@@ -523,7 +642,7 @@ class GhostClickApp(ctk.CTk):
         if self.player.is_running:
             return
         if self.script.undo():
-            self.click_list.refresh(self.script.steps)
+            self._refresh_list()
             self._update_title()
             self._update_step_count()
 
@@ -531,7 +650,7 @@ class GhostClickApp(ctk.CTk):
         if self.player.is_running:
             return
         if self.script.redo():
-            self.click_list.refresh(self.script.steps)
+            self._refresh_list()
             self._update_title()
             self._update_step_count()
 
@@ -558,44 +677,164 @@ class GhostClickApp(ctk.CTk):
             self._cancel_edit()
 
         self.script.repeat_count = self.settings.repeat_count
+        self._select_player()
         self.player.speed_multiplier = self.settings.speed_multiplier
+        self._begin_playback(self.script, "Playing...")
+
+    def _select_player(self):
+        """Play in this process or in the worker process, as the sidebar says."""
+        if not self.settings.isolated_playback:
+            self.player = self._thread_player
+            return
+        if self._process_player is None:
+            from core.process_player import ProcessPlayer
+
+            self._process_player = ProcessPlayer()
+            self._process_player.on_playback_done = self._on_playback_done
+            self._process_player.on_error = self._on_playback_error
+        self.player = self._process_player
+        self._polled_step = -1
+
+    def _on_isolated_change(self):
+        # spawn the worker now so the first isolated run doesn't wait for it
+        if self.settings.isolated_playback and not self.player.is_running:
+            self._select_player()
+            self.player.warm()
+
+    def _begin_playback(self, script: Script, status: str):
         self.player.repeat_delay = self.settings.repeat_delay
 
         self.start_btn.configure(state="disabled", fg_color=NEUTRAL, text_color=TEXT_DIM)
         self.stop_btn.configure(state="normal", fg_color=RED, hover_color=RED_HOVER, text_color="#ffffff")
+        self.pause_btn.configure(state="normal", text="Pause", text_color=TEXT)
         self.record_btn.configure(state="disabled", fg_color=NEUTRAL, text_color=TEXT_DIM)
         self._set_editing_enabled(False)
-        self._set_status("Playing...")
-
-        self.player.start(self.script, dry_run=self.settings.dry_run)
+        self._set_status(status)
+        self._show_progress(script)
+
+        self.player.start(script, dry_run=self.settings.dry_run)
+
+    def _show_progress(self, script: Script):
+        loops = script.repeat_count
+        # the plan the player is about to compile (and cache), so the bars follow its timeline
+        plan = script.compile(self.player.speed_multiplier, self.player.use_timeline)
+        self._progress = (plan.duration_ns / 1e9,
+                          max(0.0, self.player.repeat_delay), loops)
+        self.loop_bar.set(0)
+        self.run_bar.set(0)
+        if loops == 1 or loops == 0:
+            # one bar says it all: a single loop, or a run with no end
+            self.run_bar.pack_forget()
+        else:
+            self.run_bar.pack()
+        self.eta_label.configure(text="")
+        self.progress_box.pack(side="right", padx=(0, 10), after=self.status_label)
+        if self._progress_job is not None:
+            self.after_cancel(self._progress_job)
+        self._progress_job = self.after(PROGRESS_TICK_MS, self._tick_progress)
+
+    def _tick_progress(self):
+        self._progress_job = None
+        if self._progress is None:
+            return
+        self._progress_job = self.after(PROGRESS_TICK_MS, self._tick_progress)
+        elapsed_ns = self.player.elapsed_ns
+        if elapsed_ns is None:
+            return
+        loop_s, delay_s, loops = self._progress
+        # the player keeps to an absolute timeline, so the clock says where it is
+        elapsed = max(0.0, elapsed_ns / 1e9)
+        period = loop_s + delay_s
+        iteration = int(elapsed // period) if period > 0 else 0
+        if loops:
+            iteration = min(iteration, loops - 1)
+        into = elapsed - iteration * period
+        self.loop_bar.set(min(1.0, into / loop_s) if loop_s > 0 else 1.0)
+        loop_left = max(0.0, loop_s - into)
+
+        if loops == 0:
+            text = f"loop {iteration + 1} \u00b7 {_format_eta(loop_left)} left"
+        else:
+            total = loops * loop_s + (loops - 1) * delay_s
+            self.run_bar.set(min(1.0, elapsed / total) if total > 0 else 1.0)
+            text = f"{_format_eta(total - elapsed)} left"
+            if loops > 1:
+                text = f"loop {iteration + 1}/{loops} \u00b7 {text}"
+        self.eta_label.configure(text=text)
+
+    def _hide_progress(self):
+        self._progress = None
+        if self._progress_job is not None:
+            self.after_cancel(self._progress_job)
+            self._progress_job = None
+        self.progress_box.pack_forget()
 
     def _stop_playback(self):
         self.player.stop()
 
+    def _toggle_pause(self):
+        player = self.player
+        if not player.is_running:
+            return
+        if player.is_paused:
+            player.resume()
+            self.pause_btn.configure(text="Pause")
+            self._set_status("Playing...")
+        else:
+            player.pause()
+            self.pause_btn.configure(text="Resume")
+            self._set_status(f"Paused at step {player.current_step + 1}")
+
     def _on_step_change(self, index: int):
-        self.after(0, lambda: self.click_list.refresh_with_highlight(self.script.steps, index))
-        self.after(0, lambda: self._set_status(f"Step {index + 1} / {len(self.script.steps)}"))
+        # called from the player thread for every step — the channel keeps
+        # only the latest index until the next pump
+        self._events.post("step", index)
+
+    def _apply_step_change(self, index: int):
+        if not self.player.is_running or self.player.is_paused:
+            return
+        if self._scheduled_run is not None:
+            name, total, same = self._scheduled_run
+            if same:
+                self.click_list.highlight_step(index)
+            self._set_status(f"{name}: step {index + 1} / {total}")
+            return
+        self.click_list.highlight_step(index)
+        self._set_status(f"Step {index + 1} / {len(self.script.steps)}")
 
     def _on_playback_done(self):
-        def _reset():
-            self.start_btn.configure(
-                state="normal", fg_color=GREEN, hover_color=GREEN_HOVER, text_color="#ffffff",
-            )
-            self.stop_btn.configure(
-                state="disabled",
-                fg_color=NEUTRAL, hover_color=NEUTRAL_HOVER, text_color=TEXT_SEC,
-            )
-            self.record_btn.configure(
-                state="normal", fg_color=AMBER, hover_color=AMBER_HOVER, text_color="#1a1a1a",
-            )
-            self._set_editing_enabled(True)
-            self.click_list.refresh(self.script.steps)
-            self._set_status("Ready")
-        self.after(0, _reset)
+        self._events.post("done")
+
+    def _apply_playback_done(self, _=None):
+        self._scheduled_run = None
+        self._playback_ended = time.monotonic()
+        if self._scheduled_done is not None:
+            self._scheduled_done.set()
+            self._scheduled_done = None
+        self._hide_progress()
+        self.start_btn.configure(
+            state="normal", fg_color=GREEN, hover_color=GREEN_HOVER, text_color="#ffffff",
+        )
+        self.stop_btn.configure(
+            state="disabled",
+            fg_color=NEUTRAL, hover_color=NEUTRAL_HOVER, text_color=TEXT_SEC,
+        )
+        self.pause_btn.configure(state="disabled", text="Pause", text_color=TEXT_SEC)
+        self.record_btn.configure(
+            state="normal", fg_color=AMBER, hover_color=AMBER_HOVER, text_color="#1a1a1a",
+        )
+        self._set_editing_enabled(True)
+        self._refresh_list()
+        self.settings.show_timing(self.player.telemetry.summary())
+        self._set_status("Ready")
 
     def _on_playback_error(self, msg: str):
-        self.after(0, lambda: show_error(self, "Playback Error", msg))
-        self.after(0, lambda: self._set_status("Error"))
+        self._events.post("error", msg)
+
+    def _apply_playback_error(self, msg: str):
+        self._set_status("Error")
+        # the dialog runs a nested loop, so open it outside the pump
+        self.after_idle(lambda: show_error(self, "Playback Error", msg))
 
     # ═══════════════════════════════════════════════════════════
     #  RECORDING
@@ -619,15 +858,24 @@ class GhostClickApp(ctk.CTk):
 
             self.click_list.hide_recording()
             if entries:
-                for e in entries:
-                    self.script.add_step(e)
-                self.click_list.refresh(self.script.steps)
+                self.script.add_recorded_steps(entries, self.recorder.last_timeline)
+                self._refresh_list()
                 self._update_title()
                 self._update_step_count()
-                self._set_status(f"Recorded {len(entries)} steps")
+                report = self.recorder.last_simplify_report
+                if report and report["after"] < report["before"]:
+                    status = f"Recorded {len(entries)} steps (paths {report['ratio']:.1f}x smaller)"
+                else:
+                    status = f"Recorded {len(entries)} steps"
+                dropped = self.recorder.stats()["dropped"]
+                if dropped:
+                    status += f" \u2014 {dropped} input events dropped"
+                self._set_status(status)
             else:
-                self.click_list.refresh(self.script.steps)
+                self._refresh_list()
         else:
+            if self._blocked_read_only():
+                return
             if self._editing_index is not None:
                 self._cancel_edit()
 
@@ -648,14 +896,20 @@ class GhostClickApp(ctk.CTk):
             self.click_list.show_recording()
 
     def _on_click_captured(self, entry: ClickEntry):
-        """Called from recorder thread — schedule UI update on main thread."""
-        self.after(0, lambda: self.click_list.add_recording_step(entry))
+        """Called from recorder thread — queued and added in batches on the main thread."""
+        self._events.post("recorded", entry)
+
+    def _apply_recorded(self, entries: list[ClickEntry]):
+        if self.recorder.is_recording:
+            self.click_list.add_recording_steps(entries)
 
     # ═══════════════════════════════════════════════════════════
     #  HOTKEY
     # ═══════════════════════════════════════════════════════════
 
     def _register_hotkey(self):
+        import keyboard
+
         self._unregister_hotkey()
 
         # F6 — fill X/Y from cursor
@@ -679,8 +933,19 @@ class GhostClickApp(ctk.CTk):
         except Exception:
             pass
 
+        # F9 — pause / resume playback
+        try:
+            key = self.settings.pause_hotkey
+            self._pause_hook = keyboard.add_hotkey(key, self._toggle_pause_hotkey)
+        except Exception:
+            pass
+
     def _unregister_hotkey(self):
-        for attr in ("_hotkey_hook", "_quick_add_hook", "_play_stop_hook"):
+        if "keyboard" not in sys.modules:
+            return      # nothing was ever registered
+        import keyboard
+
+        for attr in ("_hotkey_hook", "_quick_add_hook", "_play_stop_hook", "_pause_hook"):
             hook = getattr(self, attr, None)
             if hook is not None:
                 try:
@@ -690,9 +955,11 @@ class GhostClickApp(ctk.CTk):
                 setattr(self, attr, None)
 
     def _capture_cursor_pos(self):
+        import pyautogui
+
         try:
             x, y = pyautogui.position()
-            self.after(0, lambda: self._fill_coords(x, y))
+            self._events.post("coords", (x, y))
         except Exception:
             pass
 
@@ -706,6 +973,8 @@ class GhostClickApp(ctk.CTk):
         """Capture cursor position and immediately add a left-click step."""
         if self.player.is_running or self.recorder.is_recording:
             return
+        import pyautogui
+
         try:
             x, y = pyautogui.position()
         except Exception:
@@ -716,11 +985,13 @@ class GhostClickApp(ctk.CTk):
             click_type="left",
             delay_before=0.5,
         )
-        self.after(0, lambda: self._append_quick_step(entry))
+        self._events.post("quick_add", entry)
 
     def _append_quick_step(self, entry: ClickEntry):
+        if self._blocked_read_only():
+            return
         self.script.add_step(entry)
-        self.click_list.refresh(self.script.steps)
+        self._refresh_list()
         self._update_title()
         self._update_step_count()
         self._set_status(f"Added step at ({entry.x}, {entry.y})")
@@ -728,20 +999,34 @@ class GhostClickApp(ctk.CTk):
     def _toggle_playback_hotkey(self):
         """Start playback if idle, stop if running."""
         if self.player.is_running:
-            self.after(0, self._stop_playback)
+            self._events.post("call", self._stop_playback)
         else:
-            self.after(0, self._start_playback)
+            self._events.post("call", self._start_playback)
+
+    def _toggle_pause_hotkey(self):
+        self._events.post("call", self._toggle_pause)
 
     # ═══════════════════════════════════════════════════════════
     #  FILE OPS
     # ═══════════════════════════════════════════════════════════
 
+    def _replace_script(self, script: Script):
+        old = self.script
+        self.script = script
+        # a mapped script holds its file open; the player may still be reading it
+        if (old.read_only and old is not script
+                and not self.player.is_running and not self.autosave.busy):
+            old.close()
+        self._set_editing_enabled(not script.read_only)
+        self._saved_revision = script.revision
+
     def _new_script(self):
         if self._editing_index is not None:
             self._cancel_edit()
-        self.script = Script()
+        self._replace_script(Script())
         self._current_file = None
-        self.click_list.refresh(self.script.steps)
+        self._current_binary = False
+        self._refresh_list()
         self._clear_form()
         self._update_title()
         self._update_step_count()
@@ -756,28 +1041,68 @@ class GhostClickApp(ctk.CTk):
 
     def _load_from_path(self, path: str):
         try:
-            self.script = load_script(path)
+            self._replace_script(load_script(path))
             self._current_file = path
+            self._current_binary = is_binary_file(path)
 
             if self._editing_index is not None:
                 self._cancel_edit()
 
-            self.click_list.refresh(self.script.steps)
+            self._refresh_list()
             self.settings.repeat_var.set(str(self.script.repeat_count))
             self._update_title()
             self._update_step_count()
+            if self.script.read_only:
+                self._set_status(f"Opened {len(self.script.steps):,} steps read-only (memory-mapped)")
         except Exception as e:
             show_error(self, "Load Error", f"Failed to load script:\n{e}")
 
     def _save_script(self):
-        if self._current_file:
-            self.script.repeat_count = self.settings.repeat_count
-            save_script(self.script, self._current_file)
-            self._update_title()
-            self._set_status("Saved")
+        # a mapped file can't be rewritten while it is mapped
+        if self._current_file and not self.script.read_only:
+            self._queue_save(self._current_file)
         else:
             self._save_script_as()
 
+    def _queue_save(self, path: str):
+        """Save a snapshot on the autosave worker; the result comes back via the event pump."""
+        self.script.repeat_count = self.settings.repeat_count
+        revision = self.script.revision
+        script = self.script
+
+        def done(saved_path, error):
+            self._events.post("call", lambda: self._apply_saved(script, revision, error, saved_path))
+
+        self.autosave.save(script, path, binary=self._current_binary, on_done=done)
+        self._set_status("Saving\u2026")
+
+    def _apply_saved(self, script: Script, revision: int, error: str | None,
+                     saved_path: str | None = None):
+        if error:
+            show_error(self, "Save Error", f"Failed to save script:\n{error}")
+            self._set_status("Save failed")
+            return
+        if script is self.script and script.read_only and saved_path:
+            # the copy is the editable one: switch the window over to it
+            try:
+                copy = load_script(saved_path, mapped=False)
+            except Exception as e:
+                show_error(self, "Load Error", f"Saved, but failed to open the copy:\n{e}")
+                self._set_status("Saved")
+                return
+            self._replace_script(copy)
+            self._current_file = saved_path
+            self._refresh_list()
+            self._update_title()
+            self._update_step_count()
+            self._set_editing_enabled(not self.player.is_running)
+            self._set_status(f"Saved \u2014 editing {os.path.basename(saved_path)}")
+            return
+        if script is self.script:
+            self._saved_revision = revision
+            self._update_title()
+        self._set_status("Saved")
+
     def _save_script_as(self):
         path = filedialog.asksaveasfilename(
             title="Save Script",
@@ -785,10 +1110,28 @@ class GhostClickApp(ctk.CTk):
             filetypes=[("GhostClick Scripts", f"*{GHOSTCLICK_EXT}")],
         )
         if path:
-            self.script.repeat_count = self.settings.repeat_count
-            self._current_file = save_script(self.script, path)
-            self._update_title()
-            self._set_status("Saved")
+            if self.script.read_only and os.path.abspath(path) == os.path.abspath(self.script.filepath):
+                show_warning(self, "Read-only", "Choose a different file for a copy of this recording.")
+                return
+            if not path.endswith(GHOSTCLICK_EXT):
+                path += GHOSTCLICK_EXT
+            self._current_file = path
+            self._queue_save(path)
+
+    def _export_timing(self):
+        if self.player.is_running:
+            return
+        path = filedialog.asksaveasfilename(
+            title="Export Playback Timing",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON", "*.json")],
+        )
+        if path:
+            try:
+                self.player.telemetry.export(path)
+                self._set_status(f"Timing exported to {os.path.basename(path)}")
+            except OSError as e:
+                show_error(self, "Export Error", f"Failed to export timing:\n{e}")
 
     def _register_association(self):
         from utils.file_io import register_file_association
@@ -802,36 +1145,88 @@ class GhostClickApp(ctk.CTk):
     # ═══════════════════════════════════════════════════════════
 
     def _schedule_dialog(self):
-        if not self.script.steps:
-            show_info(self, "Nothing to Schedule", "Add some steps first.")
+        path = self._current_file
+        clean = path is not None and self.script.revision == self._saved_revision
+        try:
+            jobs = self.scheduler.stored_jobs()
+        except Exception as e:
+            show_error(self, "Schedule", f"Could not open the job store:\n{e}")
             return
-
-        dialog = ctk.CTkInputDialog(
-            text="Run at (YYYY-MM-DD HH:MM:SS):",
-            title="Schedule Script",
+        default_name = os.path.splitext(os.path.basename(path))[0] if path else ""
+        ScheduleDialog(
+            self, jobs, default_name,
+            can_add=clean and bool(self.script.steps),
+            on_add=self._add_scheduled_job,
+            on_remove=self._remove_scheduled_job,
         )
-        result = dialog.get_input()
-        if not result:
-            return
 
+    def _add_scheduled_job(self, name: str, when: str):
         try:
-            run_at = datetime.strptime(result.strip(), "%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            show_warning(self, "Invalid Format", "Use YYYY-MM-DD HH:MM:SS format.")
-            return
+            trigger = parse_when(when)
+            self.scheduler.add_job(ScheduledJob(
+                name, self._current_file, trigger,
+                speed=self.settings.speed_multiplier,
+                repeat=self.settings.repeat_count,
+            ))
+            return None, self.scheduler.stored_jobs()
+        except Exception as e:
+            return str(e), None
 
-        if run_at <= datetime.now():
-            show_warning(self, "Past Time", "Scheduled time must be in the future.")
-            return
+    def _remove_scheduled_job(self, name: str):
+        self.scheduler.remove_job(name)
+        return self.scheduler.stored_jobs()
 
-        self.script.repeat_count = self.settings.repeat_count
-        self.player.speed_multiplier = self.settings.speed_multiplier
+    def _restore_schedules(self):
+        # only start the scheduler thread when there is something to run
+        try:
+            if self.scheduler.stored_jobs():
+                self.scheduler.start()
+        except Exception as e:
+            self._set_status(f"Scheduled jobs unavailable: {e}")
 
-        self.scheduler.schedule(
-            "main_schedule", run_at,
-            lambda: self.after(0, self._start_playback),
+    def _on_scheduled_run(self, job, script):
+        # scheduler thread; the run itself has to start on the Tk thread, but
+        # this only returns once it has finished, so the scheduler hands over
+        # catch-up runs and other jobs one at a time
+        if self._closing:
+            return
+        done = threading.Event()
+        self._scheduled_waits.add(done)
+        self._events.post("call", lambda: self._run_scheduled(job, script, done))
+        done.wait()
+        self._scheduled_waits.discard(done)
+
+    def _run_scheduled(self, job, script, done, waiting=False):
+        if self._closing:
+            done.set()
+            return
+        # a run due while the app is busy waits its turn rather than being dropped,
+        # and starts repeat_delay after the previous run like the loops of one run do
+        if self.player.is_running or self.recorder.is_recording:
+            delay_ms = SCHEDULE_RETRY_MS
+        else:
+            delay_ms = round((self._playback_ended + max(0.0, self.settings.repeat_delay)
+                              - time.monotonic()) * 1000)
+        if delay_ms > 0:
+            if not waiting:
+                self._set_status(f"Scheduled job \u201c{job.name}\u201d waiting...")
+            self.after(delay_ms, lambda: self._run_scheduled(job, script, done, True))
+            return
+        if self._editing_index is not None:
+            self._cancel_edit()
+        # the open file's rows can only be highlighted if it is the same, unedited file
+        same = (
+            self._current_file is not None
+            and os.path.normcase(os.path.abspath(self._current_file)) == os.path.normcase(job.script_path)
+            and self.script.revision == self._saved_revision
         )
-        show_info(self, "Scheduled", f"Script will run at {run_at}.")
+        if job.repeat is not None:
+            script.repeat_count = job.repeat
+        self._select_player()
+        self.player.speed_multiplier = job.speed
+        self._scheduled_run = (job.name, len(script.steps), same)
+        self._scheduled_done = done
+        self._begin_playback(script, f"Running scheduled job \u201c{job.name}\u201d...")
 
     def _cancel_schedule(self):
         self.scheduler.cancel_all()
@@ -850,12 +1245,83 @@ class GhostClickApp(ctk.CTk):
             display = name
         else:
             display = "Untitled"
-        self.title(f"GhostClick — {display}")
+        dirty = self.script.revision != self._saved_revision
+        self.title(f"GhostClick — {display}{' •' if dirty else ''}")
+        if dirty and not self.script.read_only:
+            self.autosave.autosave(self.script, self._current_file)
+
+    def _offer_recovery(self):
+        """Offer to restore the newest autosave journal left behind by a crash."""
+        journals = find_journals(self.autosave.directory)
+        if not journals:
+            return
+        path, meta = journals[0]
+        source = meta.get("autosave_source") or None
+        name = os.path.basename(source) if source else meta.get("name", "Untitled")
+        when = datetime.fromtimestamp(meta.get("autosaved_at", 0)).strftime("%Y-%m-%d %H:%M")
+        restore = ask_restore(
+            self, "Recover Unsaved Work",
+            f"GhostClick didn't close cleanly. Unsaved changes to {name} "
+            f"from {when} were found.\n\nRestore them?",
+        )
+        if restore is None:
+            return      # closed without choosing: keep the journal for next time
+        if restore:
+            try:
+                recovered = load_script(path, mapped=False)
+            except Exception as e:
+                show_error(self, "Recovery Error", f"Failed to read autosave:\n{e}")
+                return
+            if self._editing_index is not None:
+                self._cancel_edit()
+            self._replace_script(recovered)
+            self._saved_revision = -1     # recovered work is unsaved until saved again
+            self._current_file = source
+            self._current_binary = bool(source) and os.path.isfile(source) and is_binary_file(source)
+            self._refresh_list()
+            self.settings.repeat_var.set(str(self.script.repeat_count))
+            self._update_title()
+            self._update_step_count()
+            self._set_status("Recovered unsaved changes")
+        # only once it has been restored, or the user chose Discard
+        discard_journal(path)
+
+    def _pump_events(self):
+        """Apply everything worker threads posted since the last frame."""
+        # reschedule first so a handler that raises or opens a dialog can't stall the pump
+        self._pump_id = self.after(UI_FRAME_MS, self._pump_events)
+        for kind, payload in self._events.drain():
+            handler = self._event_handlers.get(kind)
+            if handler:
+                handler(payload)
+        # a worker process can't post events; its step is read from shared memory
+        player = self.player
+        if player is self._process_player and player.is_running:
+            step = player.current_step
+            if step != self._polled_step and step >= 0:
+                self._polled_step = step
+                self._apply_step_change(step)
+
+    @property
+    def event_stats(self) -> dict:
+        """Queue depth and posted/dropped/coalesced counters, for diagnostics."""
+        return self._events.stats()
 
     def _on_close(self):
+        # let a scheduler thread blocked on a scheduled run go before shutting it down
+        self._closing = True
+        for done in list(self._scheduled_waits):
+            done.set()
+        if self._pump_id is not None:
+            self.after_cancel(self._pump_id)
+            self._pump_id = None
         self.player.stop()
+        if self._process_player is not None:
+            self._process_player.close()
         if self.recorder.is_recording:
             self.recorder.stop()
         self._unregister_hotkey()
         self.scheduler.shutdown()
+        # finishes any save still being written, then removes this session's journal
+        self.autosave.close()
         self.destroy()
@@ -1,5 +1,10 @@
+from array import array
+from bisect import bisect_right
+
 import customtkinter as ctk
-from core.script import ClickEntry
+from core.pathing import group_starts
+from core.script import ClickEntry, step_cost_ns
+from core.timing import StepTimeIndex
 from ui.theme import (
     BG_SURFACE, BG_ELEVATED, ROW_BG, ROW_BG_ALT, ROW_SELECTED, ROW_ACTIVE,
     BORDER, ACCENT, ACCENT_HOVER, AMBER, AMBER_HOVER, RED, RED_HOVER,
@@ -7,214 +12,209 @@ from ui.theme import (
     RADIUS_SM, RADIUS_MD, RADIUS_LG,
 )
 
-
-class ClickListRow(ctk.CTkFrame):
-    """Single row representing one script step."""
-
-    def __init__(self, master, index: int, entry: ClickEntry, selected=False,
-                 active=False, on_select=None, **kwargs):
-        if active:
-            bg = ROW_ACTIVE
-        elif selected:
-            bg = ROW_SELECTED
-        else:
-            bg = ROW_BG_ALT if index % 2 else ROW_BG
-
-        super().__init__(master, fg_color=bg, corner_radius=RADIUS_SM, height=40, **kwargs)
-        self.grid_propagate(False)
-
-        self.index = index
-        self.entry = entry
-        self._on_select = on_select
-
-        self.grid_columnconfigure(2, weight=1)
-        self.grid_rowconfigure(0, weight=1)
-
-        # step number badge
-        num_frame = ctk.CTkFrame(self, fg_color=BORDER if not active else "#2a5e3e",
-                                 corner_radius=4, width=28, height=22)
-        num_frame.grid(row=0, column=0, padx=(10, 6), pady=9)
-        num_frame.grid_propagate(False)
-        num_frame.grid_columnconfigure(0, weight=1)
-        num_frame.grid_rowconfigure(0, weight=1)
-
-        num_label = ctk.CTkLabel(
-            num_frame, text=str(index + 1),
-            font=ctk.CTkFont(family=FAMILY, size=11, weight="bold"),
-            text_color=TEXT if active else TEXT_DIM,
-        )
-        num_label.grid(row=0, column=0)
-
-        # click type indicator
-        type_map = {"left": "L", "right": "R", "double": "D", "move": "M"}
-        type_colors = {
-            "left": ACCENT,
-            "right": "#c084fc",   # soft purple
-            "double": "#f59e0b",  # amber
-            "move": "#60a5fa",    # sky blue
-        }
-        type_char = type_map.get(entry.click_type, "?")
-        type_color = type_colors.get(entry.click_type, TEXT_DIM)
-
-        type_label = ctk.CTkLabel(
-            self, text=type_char, width=22,
-            font=ctk.CTkFont(family=FAMILY, size=12, weight="bold"),
-            text_color=type_color,
+ROW_HEIGHT = 40
+ROW_GAP = 3
+ROW_PITCH = ROW_HEIGHT + ROW_GAP
+WHEEL_ROWS = 3          # rows scrolled per mouse wheel notch
+
+TYPE_CHARS = {
+    "left": "L", "right": "R", "double": "D", "triple": "T", "move": "M", "path": "\u2248",
+}
+TYPE_COLORS = {
+    "left": ACCENT,
+    "right": "#c084fc",   # soft purple
+    "double": "#f59e0b",  # amber
+    "triple": "#fb923c",  # orange
+    "move": "#60a5fa",    # sky blue
+    "path": "#60a5fa",
+}
+ACTION_NAMES = {
+    "left": "Left Click", "right": "Right Click", "double": "Double Click",
+    "triple": "Triple Click", "move": "Move To",
+}
+
+
+def _is_move_group(entries: list[ClickEntry]) -> bool:
+    return len(entries) >= 2 and entries[0].click_type == "move"
+
+
+def _step_text(entry: ClickEntry) -> str:
+    label_text = entry.label if entry.label else ""
+    coord_text = f"({entry.x}, {entry.y})"
+    delay_text = f"{entry.delay_before:.2f}s"
+    ret_text = "  [return]" if entry.return_cursor else ""
+
+    if entry.click_type == "path" and entry.path is not None:
+        points = len(entry.path) // 3
+        return (
+            f"{label_text or 'Smooth path'}   {points} points   {delay_text}"
+            f" + {entry.path_duration:.2f}s   \u2192 {coord_text}"
         )
-        type_label.grid(row=0, column=1, padx=(0, 6), pady=9)
+    if label_text:
+        return f"{label_text}   {coord_text}   {delay_text}{ret_text}"
+    action = ACTION_NAMES.get(entry.click_type, entry.click_type)
+    return f"{action}   {coord_text}   {delay_text}{ret_text}"
 
-        # main description
-        label_text = entry.label if entry.label else ""
-        coord_text = f"({entry.x}, {entry.y})"
-        delay_text = f"{entry.delay_before:.2f}s"
-        ret_text = "  [return]" if entry.return_cursor else ""
 
-        if label_text:
-            display = f"{label_text}   {coord_text}   {delay_text}{ret_text}"
-        else:
-            action = {"left": "Left Click", "right": "Right Click", "double": "Double Click", "move": "Move To"}.get(
-                entry.click_type, entry.click_type
-            )
-            display = f"{action}   {coord_text}   {delay_text}{ret_text}"
+def _group_text(entries, total_time: float) -> str:
+    count = len(entries)
+    end = entries[-1]
+    moves = "move" if count == 1 else "moves"
+    return f"Mouse path   {count} {moves}   {total_time:.2f}s   \u2192 ({end.x}, {end.y})"
 
-        desc_label = ctk.CTkLabel(
-            self, text=display, anchor="w",
-            text_color=TEXT if (selected or active) else TEXT_SEC,
-            font=ctk.CTkFont(family=FAMILY, size=12),
-        )
-        desc_label.grid(row=0, column=2, padx=(0, 14), pady=9, sticky="ew")
 
-        # make the whole row clickable
-        for widget in [self, num_frame, num_label, type_label, desc_label]:
-            widget.bind("<Button-1>", self._clicked)
-            widget.bind("<Double-Button-1>", self._double_clicked)
+class StepRow(ctk.CTkFrame):
+    """
+    Recyclable row widget. ClickList keeps a small pool of these and rebinds
+    them to whichever steps (or collapsed move groups) are in view.
+    """
 
-    def _clicked(self, event=None):
-        if self._on_select:
-            self._on_select(self.index)
-
-    def _double_clicked(self, event=None):
-        if self._on_select:
-            self._on_select(self.index, edit=True)
-
-
-class MoveGroupRow(ctk.CTkFrame):
-    """Collapsed row representing a group of consecutive mouse move steps."""
-
-    def __init__(self, master, first_index: int, entries: list[ClickEntry],
-                 selected=False, active=False, on_select=None, **kwargs):
-        if active:
-            bg = ROW_ACTIVE
-        elif selected:
-            bg = ROW_SELECTED
-        else:
-            bg = ROW_BG_ALT if first_index % 2 else ROW_BG
-
-        super().__init__(master, fg_color=bg, corner_radius=RADIUS_SM, height=40, **kwargs)
+    def __init__(self, master, on_select=None, on_wheel=None, **kwargs):
+        super().__init__(master, fg_color=ROW_BG, corner_radius=RADIUS_SM,
+                         height=ROW_HEIGHT, **kwargs)
         self.grid_propagate(False)
 
-        self.index = first_index
-        self.group_size = len(entries)
-        self._entries = list(entries)
+        self.index = -1
+        self.group_size = 0
         self._on_select = on_select
+        self._shown: dict = {}      # last applied widget options, to skip no-op configures
 
         self.grid_columnconfigure(2, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
-        # step range badge
-        badge_text = self._badge_text()
-        badge_w = max(28, len(badge_text) * 7 + 12)
-        self._num_frame = ctk.CTkFrame(
-            self, fg_color=BORDER if not active else "#2a5e3e",
-            corner_radius=4, width=badge_w, height=22,
-        )
+        # step number / range badge
+        self._num_frame = ctk.CTkFrame(self, fg_color=BORDER, corner_radius=4, width=28, height=22)
         self._num_frame.grid(row=0, column=0, padx=(10, 6), pady=9)
         self._num_frame.grid_propagate(False)
         self._num_frame.grid_columnconfigure(0, weight=1)
         self._num_frame.grid_rowconfigure(0, weight=1)
 
         self._num_label = ctk.CTkLabel(
-            self._num_frame, text=badge_text,
-            font=ctk.CTkFont(family=FAMILY, size=10, weight="bold"),
-            text_color=TEXT if active else TEXT_DIM,
+            self._num_frame, text="",
+            font=ctk.CTkFont(family=FAMILY, size=11, weight="bold"),
+            text_color=TEXT_DIM,
         )
         self._num_label.grid(row=0, column=0)
 
-        # path indicator (wavy ≈ to distinguish from single "M")
-        type_label = ctk.CTkLabel(
-            self, text="\u2248", width=22,
-            font=ctk.CTkFont(family=FAMILY, size=14, weight="bold"),
-            text_color="#60a5fa",
+        # click type indicator (wavy ≈ for collapsed move groups and paths)
+        self._type_label = ctk.CTkLabel(
+            self, text="", width=22,
+            font=ctk.CTkFont(family=FAMILY, size=12, weight="bold"),
+            text_color=TEXT_DIM,
         )
-        type_label.grid(row=0, column=1, padx=(0, 6), pady=9)
+        self._type_label.grid(row=0, column=1, padx=(0, 6), pady=9)
 
-        # description
         self._desc_label = ctk.CTkLabel(
-            self, text=self._desc_text(), anchor="w",
-            text_color=TEXT if (selected or active) else TEXT_SEC,
+            self, text="", anchor="w",
+            text_color=TEXT_SEC,
             font=ctk.CTkFont(family=FAMILY, size=12),
         )
         self._desc_label.grid(row=0, column=2, padx=(0, 14), pady=9, sticky="ew")
 
-        # clickable
-        for widget in [self, self._num_frame, self._num_label, type_label, self._desc_label]:
+        # make the whole row clickable and scrollable
+        for widget in [self, self._num_frame, self._num_label, self._type_label, self._desc_label]:
             widget.bind("<Button-1>", self._clicked)
+            widget.bind("<Double-Button-1>", self._double_clicked)
+            if on_wheel:
+                for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                    widget.bind(seq, on_wheel)
 
-    def _badge_text(self):
-        if self.group_size > 1:
-            return f"{self.index + 1}\u2013{self.index + self.group_size}"
-        return str(self.index + 1)
-
-    def _desc_text(self):
-        count = len(self._entries)
-        total_time = sum(e.delay_before for e in self._entries)
-        end = self._entries[-1]
-        moves = "move" if count == 1 else "moves"
-        return f"Mouse path   {count} {moves}   {total_time:.2f}s   \u2192 ({end.x}, {end.y})"
-
-    def update_group(self, entries: list[ClickEntry]):
-        """Update with new entries (used during live recording)."""
-        self._entries = list(entries)
+    def _apply(self, key, widget, **options):
+        if self._shown.get(key) != options:
+            widget.configure(**options)
+            self._shown[key] = options
+
+    def show(self, index: int, entries, selected=False, active=False, total_time=0.0):
+        self.index = index
         self.group_size = len(entries)
-        self._desc_label.configure(text=self._desc_text())
-        new_badge = self._badge_text()
-        self._num_label.configure(text=new_badge)
-        badge_w = max(28, len(new_badge) * 7 + 12)
-        self._num_frame.configure(width=badge_w)
+        grouped = _is_move_group(entries)
+
+        if active:
+            bg = ROW_ACTIVE
+        elif selected:
+            bg = ROW_SELECTED
+        else:
+            bg = ROW_BG_ALT if index % 2 else ROW_BG
+        self._apply("row", self, fg_color=bg)
+
+        if grouped:
+            badge = f"{index + 1}\u2013{index + len(entries)}"
+            badge_w = max(28, len(badge) * 7 + 12)
+            self._apply("type", self._type_label, text="\u2248", text_color="#60a5fa")
+            desc = _group_text(entries, total_time)
+        else:
+            badge = str(index + 1)
+            badge_w = 28
+            entry = entries[0]
+            self._apply(
+                "type", self._type_label,
+                text=TYPE_CHARS.get(entry.click_type, "?"),
+                text_color=TYPE_COLORS.get(entry.click_type, TEXT_DIM),
+            )
+            desc = _step_text(entry)
+
+        self._apply("badge", self._num_frame,
+                    fg_color="#2a5e3e" if active else BORDER, width=badge_w)
+        self._apply("num", self._num_label, text=badge,
+                    text_color=TEXT if active else TEXT_DIM)
+        self._apply("desc", self._desc_label, text=desc,
+                    text_color=TEXT if (selected or active) else TEXT_SEC)
 
     def _clicked(self, event=None):
-        if self._on_select:
+        if self._on_select and self.index >= 0:
             self._on_select(self.index)
 
+    def _double_clicked(self, event=None):
+        # collapsed move groups have nothing meaningful to edit
+        if self._on_select and self.index >= 0:
+            self._on_select(self.index, edit=self.group_size == 1)
+
 
-class ClickList(ctk.CTkScrollableFrame):
-    """Scrollable list of all script steps with selection support."""
+class ClickList(ctk.CTkFrame):
+    """
+    Virtualized list of all script steps with selection support. Only a
+    viewport-sized pool of StepRow widgets exists; scrolling rebinds them.
+    """
 
     def __init__(self, master, **kwargs):
-        super().__init__(
-            master, fg_color=BG_SURFACE, corner_radius=RADIUS_LG,
-            scrollbar_button_color=BORDER,
-            scrollbar_button_hover_color=TEXT_DIM,
-            **kwargs,
-        )
+        super().__init__(master, fg_color=BG_SURFACE, corner_radius=RADIUS_LG, **kwargs)
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
 
-        self._rows: list[ClickListRow | MoveGroupRow] = []
-        self._current_steps: list[ClickEntry] = []
+        self._viewport = ctk.CTkFrame(self, fg_color="transparent", corner_radius=0)
+        self._viewport.grid(row=1, column=0, sticky="nsew", padx=(0, 2), pady=(3, 6))
+
+        self._scrollbar = ctk.CTkScrollbar(
+            self, command=self._on_scrollbar,
+            button_color=BORDER, button_hover_color=TEXT_DIM,
+        )
+        self._scrollbar.grid(row=1, column=1, sticky="ns", padx=(0, 4), pady=6)
+        self._scrollbar.grid_remove()
+
+        self._pool: list[StepRow] = []
+        self._placed = 0                    # how many pool rows are currently placed
+        self._top = 0                       # display row shown in the first slot
+        # any step sequence (a list, or a mapped view of a large file); display
+        # rows are described only by their first step index
+        self._current_steps = []
+        self._group_starts = array("q")
+        self._times: StepTimeIndex | None = None   # cumulative step times, for group totals
         self._selected_index = -1
         self._active_index = -1
         self._empty_frame: ctk.CTkFrame | None = None
         self._recording_frame: ctk.CTkFrame | None = None
         self._rec_dot_visible = True
-        self._rec_move_group: MoveGroupRow | None = None
-        self._rec_move_entries: list[ClickEntry] = []
+        self._rec_step_count = 0
 
         self.on_selection_change = None
         self.on_edit_request = None
         self.on_record_click = None
         self.on_add_click = None
 
-        # auto-hide scrollbar when content fits (add="+" preserves CTk's own resize handler)
-        self._parent_canvas.bind("<Configure>", lambda e: self.after_idle(self._auto_scrollbar), add="+")
+        self._viewport.bind("<Configure>", self._on_resize)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._viewport.bind(seq, self._on_wheel)
 
         # show empty state by default
         self.after(50, self._show_empty)
@@ -223,140 +223,192 @@ class ClickList(ctk.CTkScrollableFrame):
     def selected_index(self):
         return self._selected_index
 
-    def set_active_step(self, index: int):
+    def highlight_step(self, index: int):
+        """Move the playback highlight, recolouring only the rows that changed."""
+        old_row = self._row_of_step(self._active_index)
+        new_row = self._row_of_step(index)
         self._active_index = index
+        if old_row == new_row:
+            return
+
+        top = self._top
+        self._scroll_to_row(new_row)
+        if self._top != top:
+            # scrolled — every visible row shows different data anyway
+            self._render()
+            return
+        self._render_row(old_row)
+        self._render_row(new_row)
+
+    # ── data binding ──
 
-    @staticmethod
-    def _group_steps(steps: list[ClickEntry]):
-        """Group consecutive move entries. Returns list of (start_index, [entries])."""
-        groups = []
-        i = 0
-        while i < len(steps):
-            if steps[i].click_type == "move":
-                start = i
-                while i < len(steps) and steps[i].click_type == "move":
-                    i += 1
-                groups.append((start, steps[start:i]))
-            else:
-                groups.append((i, [steps[i]]))
-                i += 1
-        return groups
-
-    def load_steps(self, steps: list[ClickEntry], preserve_selection: bool = False):
+    def _set_steps(self, steps, times: StepTimeIndex | None = None):
+        self._current_steps = steps
+        self._times = times
+        # mapped step views can list click types without decoding whole entries
+        if hasattr(steps, "click_types"):
+            types = steps.click_types()
+        else:
+            types = (entry.click_type for entry in steps)
+        self._group_starts = group_starts(types)
+
+    def _row_of_step(self, index: int) -> int:
+        """Display row containing step index, or -1."""
+        if not 0 <= index < len(self._current_steps):
+            return -1
+        return bisect_right(self._group_starts, index) - 1
+
+    def _row_entries(self, row: int):
+        """(first step index, steps) for a display row; slices of a mapped view stay lazy."""
+        starts = self._group_starts
+        start = starts[row]
+        end = starts[row + 1] if row + 1 < len(starts) else len(self._current_steps)
+        return start, self._current_steps[start:end]
+
+    def _row_total(self, start: int, entries) -> float:
+        if len(entries) < 2:
+            return 0.0
+        if self._times is None:
+            # unindexed (a read-only mapped view): only visible groups are summed
+            return sum(e.delay_before for e in entries)
+        return self._times.span_ns(start, start + len(entries)) / 1e9
+
+    def load_steps(self, steps, preserve_selection: bool = False,
+                   times: StepTimeIndex | None = None):
+        """times is the steps' time index (Script.time_index), if there is one."""
         old_sel = self._selected_index if preserve_selection else -1
-        self._clear_rows()
         self._active_index = -1
         self._selected_index = old_sel
-        self._current_steps = list(steps)
+        self._set_steps(steps, times)
 
         if not steps:
             self._show_empty()
             self._selected_index = -1
-            return
-
-        self._hide_empty()
-        for start_idx, entries in self._group_steps(steps):
-            if len(entries) >= 2 and entries[0].click_type == "move":
-                selected = (
-                    old_sel >= 0
-                    and start_idx <= old_sel < start_idx + len(entries)
-                )
-                row = MoveGroupRow(
-                    self, start_idx, entries,
-                    selected=selected, active=False,
-                    on_select=self._handle_row_select,
-                )
-            else:
-                row = ClickListRow(
-                    self, start_idx, entries[0],
-                    selected=(start_idx == old_sel), active=False,
-                    on_select=self._handle_row_select,
-                )
-            row.pack(fill="x", padx=8, pady=(3, 0))
-            self._rows.append(row)
-
-        if not preserve_selection:
-            self._selected_index = -1
-        self.after_idle(self._auto_scrollbar)
-
-    def refresh(self, steps: list[ClickEntry]):
-        old_sel = self._selected_index
-        self.load_steps(steps, preserve_selection=True)
-        if 0 <= old_sel < len(steps):
-            self._selected_index = old_sel
-        elif steps:
-            self._selected_index = len(steps) - 1
         else:
+            self._hide_empty()
+        if not preserve_selection:
             self._selected_index = -1
+            self._top = 0
+        self._render()
 
-    def refresh_with_highlight(self, steps: list[ClickEntry], active_index: int):
-        old_sel = self._selected_index
-        self._active_index = active_index
-        self._clear_rows()
-        self._selected_index = old_sel
-        self._current_steps = list(steps)
-        self._hide_empty()
-
-        for start_idx, entries in self._group_steps(steps):
-            if len(entries) >= 2 and entries[0].click_type == "move":
-                is_active = (
-                    active_index >= 0
-                    and start_idx <= active_index < start_idx + len(entries)
-                )
-                is_selected = (
-                    old_sel >= 0
-                    and start_idx <= old_sel < start_idx + len(entries)
-                )
-                row = MoveGroupRow(
-                    self, start_idx, entries,
-                    selected=is_selected, active=is_active,
-                    on_select=self._handle_row_select,
-                )
-            else:
-                row = ClickListRow(
-                    self, start_idx, entries[0],
-                    selected=(start_idx == old_sel),
-                    active=(start_idx == active_index),
-                    on_select=self._handle_row_select,
-                )
-            row.pack(fill="x", padx=8, pady=(3, 0))
-            self._rows.append(row)
-        self.after_idle(self._auto_scrollbar)
+    def refresh(self, steps, times: StepTimeIndex | None = None):
+        # keep the selection if it still exists, else select the last step
+        if not 0 <= self._selected_index < len(steps):
+            self._selected_index = len(steps) - 1
+        self.load_steps(steps, preserve_selection=True, times=times)
 
     def select(self, index: int):
         self._selected_index = index
+        self._scroll_to_row(self._row_of_step(index))
+        self._render()
         if self.on_selection_change:
             self.on_selection_change(index)
 
-    def _auto_scrollbar(self):
-        """Hide scrollbar when content fits, show when it overflows."""
-        try:
-            canvas = self._parent_canvas
-            canvas.update_idletasks()
-            bbox = canvas.bbox("all")
-            if not bbox:
-                self._scrollbar.grid_remove()
-                return
-            content_h = bbox[3] - bbox[1]
-            visible_h = canvas.winfo_height()
-            if content_h <= visible_h:
-                self._scrollbar.grid_remove()
-            else:
-                self._scrollbar.grid()
-        except Exception:
-            pass
+    # ── virtualization ──
+
+    def _capacity(self) -> int:
+        """Rows that fit in the viewport, counting a partially visible last row."""
+        height = self._viewport.winfo_height()
+        return max(1, -(-height // ROW_PITCH))
+
+    def _full_rows(self) -> int:
+        return max(1, self._viewport.winfo_height() // ROW_PITCH)
 
-    def _clear_rows(self):
-        for row in self._rows:
-            row.destroy()
-        self._rows.clear()
+    def _on_resize(self, event=None):
+        needed = self._capacity()
+        while len(self._pool) < needed:
+            self._pool.append(StepRow(
+                self._viewport,
+                on_select=self._handle_row_select,
+                on_wheel=self._on_wheel,
+            ))
+        self._render()
+
+    def _clamp_top(self):
+        max_top = max(0, len(self._group_starts) - self._full_rows())
+        self._top = max(0, min(self._top, max_top))
+
+    def _scroll_to_row(self, row: int):
+        if row < 0:
+            return
+        visible = self._full_rows()
+        if row < self._top:
+            self._top = row
+        elif row >= self._top + visible:
+            self._top = row - visible + 1
+
+    def _render(self):
+        self._clamp_top()
+        sel_row = self._row_of_step(self._selected_index)
+        active_row = self._row_of_step(self._active_index)
+        count = min(self._capacity(), len(self._pool), len(self._group_starts) - self._top)
+        count = max(0, count)
+
+        for slot in range(count):
+            row_idx = self._top + slot
+            start, entries = self._row_entries(row_idx)
+            row = self._pool[slot]
+            row.show(start, entries, selected=row_idx == sel_row, active=row_idx == active_row,
+                     total_time=self._row_total(start, entries))
+            if slot >= self._placed:
+                row.place(x=8, y=slot * ROW_PITCH, relwidth=1.0, width=-16, height=ROW_HEIGHT)
+        for slot in range(count, self._placed):
+            self._pool[slot].place_forget()
+            self._pool[slot].index = -1
+        self._placed = count
+
+        self._update_scrollbar()
+
+    def _render_row(self, row_idx: int):
+        slot = row_idx - self._top
+        if row_idx < 0 or not 0 <= slot < self._placed:
+            return
+        start, entries = self._row_entries(row_idx)
+        self._pool[slot].show(
+            start, entries,
+            selected=row_idx == self._row_of_step(self._selected_index),
+            active=row_idx == self._row_of_step(self._active_index),
+            total_time=self._row_total(start, entries),
+        )
+
+    def _update_scrollbar(self):
+        total = len(self._group_starts)
+        visible = self._full_rows()
+        if total <= visible:
+            self._scrollbar.grid_remove()
+            return
+        self._scrollbar.grid()
+        self._scrollbar.set(self._top / total, min(1.0, (self._top + visible) / total))
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self._top = round(float(args[0]) * len(self._group_starts))
+        elif action == "scroll":
+            amount = int(args[0])
+            if len(args) > 1 and args[1] == "pages":
+                amount *= self._full_rows()
+            self._top += amount
+        self._render()
+
+    def _on_wheel(self, event):
+        # X11 reports wheel notches as buttons 4/5, Windows and macOS via delta
+        num = getattr(event, "num", None)
+        if num in (4, 5):
+            direction = -1 if num == 4 else 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self._top += direction * WHEEL_ROWS
+        self._render()
+        return "break"
+
+    # ── empty state ──
 
     def _show_empty(self):
-        if self._empty_frame:
+        if self._empty_frame or self._group_starts:
             return
 
-        # overlay on the canvas so it doesn't inflate scrollable content height
-        content = ctk.CTkFrame(self._parent_canvas, fg_color="transparent")
+        # overlay on the viewport so it sits above the (hidden) row pool
+        content = ctk.CTkFrame(self._viewport, fg_color="transparent")
         content.place(relx=0.5, rely=0.5, anchor="center")
 
         ctk.CTkLabel(
@@ -394,27 +446,30 @@ class ClickList(ctk.CTkScrollableFrame):
         ).pack(side="left")
 
         self._empty_frame = content
-        self.after_idle(self._auto_scrollbar)
 
     def _hide_empty(self):
         if self._empty_frame:
             self._empty_frame.destroy()
             self._empty_frame = None
 
+    # ── live recording ──
+
     def show_recording(self):
         """Show a recording banner at the top with live step rows below."""
         self._hide_empty()
-        self._clear_rows()
         self._rec_step_count = 0
-        self._rec_move_group = None
-        self._rec_move_entries = []
+        self._set_steps([], StepTimeIndex())
+        self._selected_index = -1
+        self._active_index = -1
+        self._top = 0
+        self._render()
 
         if self._recording_frame:
             return
 
         # compact banner
         banner = ctk.CTkFrame(self, fg_color="#2a1215", corner_radius=RADIUS_MD)
-        banner.pack(fill="x", padx=8, pady=(6, 4))
+        banner.grid(row=0, column=0, columnspan=2, sticky="ew", padx=8, pady=(6, 0))
 
         inner = ctk.CTkFrame(banner, fg_color="transparent")
         inner.pack(fill="x", padx=12, pady=8)
@@ -447,36 +502,11 @@ class ClickList(ctk.CTkScrollableFrame):
         self._recording_frame = banner
         self._rec_dot_visible = True
         self._pulse_dot()
-        self.after_idle(self._auto_scrollbar)
 
-    def add_recording_step(self, entry: ClickEntry):
-        """Add a live step row during recording, grouping consecutive moves."""
-        self._rec_step_count += 1
-
-        if entry.click_type == "move":
-            if self._rec_move_group is not None:
-                # extend existing move group
-                self._rec_move_entries.append(entry)
-                self._rec_move_group.update_group(self._rec_move_entries)
-            else:
-                # start a new move group
-                self._rec_move_entries = [entry]
-                row = MoveGroupRow(
-                    self, self._rec_step_count - 1, self._rec_move_entries,
-                )
-                row.pack(fill="x", padx=8, pady=(3, 0))
-                self._rows.append(row)
-                self._rec_move_group = row
-        else:
-            # end any active move group
-            self._rec_move_group = None
-            self._rec_move_entries = []
-            row = ClickListRow(
-                self, self._rec_step_count - 1, entry,
-                selected=False, active=False,
-            )
-            row.pack(fill="x", padx=8, pady=(3, 0))
-            self._rows.append(row)
+    def add_recording_steps(self, entries: list[ClickEntry]):
+        """Add a batch of live steps and redraw once."""
+        for entry in entries:
+            self._append_recording_entry(entry)
 
         # update count in banner
         n = self._rec_step_count
@@ -485,18 +515,25 @@ class ClickList(ctk.CTkScrollableFrame):
         )
 
         # auto-scroll to bottom
-        self._parent_canvas.yview_moveto(1.0)
-        self.after_idle(self._auto_scrollbar)
+        self._top = len(self._group_starts)
+        self._render()
+
+    def _append_recording_entry(self, entry: ClickEntry):
+        self._rec_step_count += 1
+        steps = self._current_steps
+        index = len(steps)
+        if not (entry.click_type == "move" and index and steps[-1].click_type == "move"):
+            self._group_starts.append(index)
+        steps.append(entry)
+        self._times.append(step_cost_ns(entry))
 
     def hide_recording(self):
         """Remove the recording banner."""
         if self._recording_frame:
             self._recording_frame.destroy()
             self._recording_frame = None
-        self._rec_move_group = None
-        self._rec_move_entries = []
-        self._clear_rows()
-        self.after_idle(self._auto_scrollbar)
+        self._set_steps([])
+        self._render()
 
     def _pulse_dot(self):
         """Blink the recording dot."""
@@ -511,8 +548,7 @@ class ClickList(ctk.CTkScrollableFrame):
 
     def _handle_row_select(self, index: int, edit: bool = False):
         self._selected_index = index
-        self.load_steps(self._current_steps, preserve_selection=True)
-        self._selected_index = index
+        self._render()
 
         if self.on_selection_change:
             self.on_selection_change(index)
@@ -1,6 +1,6 @@
 import customtkinter as ctk
 from ui.theme import (
-    BG_BASE, BG_SURFACE, BG_ELEVATED, BORDER,
+    BG_BASE, BG_SURFACE, BG_ELEVATED, BG_INPUT, BORDER,
     ACCENT, ACCENT_HOVER, RED, RED_HOVER, AMBER,
     NEUTRAL, NEUTRAL_HOVER,
     TEXT, TEXT_SEC, TEXT_DIM, FAMILY,
@@ -8,6 +8,15 @@ from ui.theme import (
 )
 
 
+def _center_on_parent(window, parent, w, h):
+    try:
+        px = parent.winfo_rootx() + parent.winfo_width() // 2 - w // 2
+        py = parent.winfo_rooty() + parent.winfo_height() // 2 - h // 2
+        window.geometry(f"{w}x{h}+{px}+{py}")
+    except Exception:
+        pass
+
+
 class _ThemedDialog(ctk.CTkToplevel):
     """Base class for themed modal dialogs."""
 
@@ -27,7 +36,7 @@ class _ThemedDialog(ctk.CTkToplevel):
         self.update_idletasks()
         w, h = 400, 200
         self.geometry(f"{w}x{h}")
-        self._center_on_parent(parent, w, h)
+        _center_on_parent(self, parent, w, h)
 
         # outer padding frame
         outer = ctk.CTkFrame(self, fg_color=BG_SURFACE, corner_radius=RADIUS_LG)
@@ -99,14 +108,6 @@ class _ThemedDialog(ctk.CTkToplevel):
         self.focus_force()
         self.wait_window()
 
-    def _center_on_parent(self, parent, w, h):
-        try:
-            px = parent.winfo_rootx() + parent.winfo_width() // 2 - w // 2
-            py = parent.winfo_rooty() + parent.winfo_height() // 2 - h // 2
-            self.geometry(f"{w}x{h}+{px}+{py}")
-        except Exception:
-            pass
-
     def _on_button(self, value):
         self.result = value
         self.grab_release()
@@ -162,3 +163,154 @@ def ask_yes_no(parent, title: str, message: str) -> bool:
         ],
     )
     return dlg.result is True
+
+
+def ask_restore(parent, title: str, message: str) -> bool | None:
+    """Restore/Discard dialog. True = restore, False = discard, None = closed (decide later)."""
+    dlg = _ThemedDialog(
+        parent, title, message,
+        icon_char="?", icon_color=ACCENT,
+        buttons=[
+            {"text": "Discard", "fg": RED, "hover": RED_HOVER,
+             "text_color": "#ffffff", "value": False},
+            {"text": "Restore", "fg": ACCENT, "hover": ACCENT_HOVER,
+             "text_color": "#0f1117", "primary": True, "value": True, "width": 80},
+        ],
+    )
+    return dlg.result
+
+
+class ScheduleDialog(ctk.CTkToplevel):
+    """
+    Lists the stored scheduled jobs and adds new ones for the open script.
+    on_add(name, when) returns (error message or None, jobs) and
+    on_remove(name) returns the jobs left; the list is redrawn from those.
+    """
+
+    def __init__(self, parent, jobs, default_name: str, can_add: bool, on_add, on_remove):
+        super().__init__(parent)
+
+        self.title("Schedule")
+        self.configure(fg_color=BG_BASE)
+        self.resizable(False, False)
+        self.transient(parent)
+        self.grab_set()
+
+        self._on_add = on_add
+        self._on_remove = on_remove
+
+        w, h = 520, 420
+        self.geometry(f"{w}x{h}")
+        _center_on_parent(self, parent, w, h)
+
+        outer = ctk.CTkFrame(self, fg_color=BG_SURFACE, corner_radius=RADIUS_LG)
+        outer.pack(fill="both", expand=True, padx=12, pady=12)
+
+        ctk.CTkLabel(
+            outer, text="Scheduled Jobs",
+            font=ctk.CTkFont(family=FAMILY, size=14, weight="bold"),
+            text_color=TEXT, anchor="w",
+        ).pack(fill="x", padx=20, pady=(16, 6))
+
+        self._list = ctk.CTkScrollableFrame(outer, fg_color=BG_ELEVATED, corner_radius=RADIUS_MD,
+                                            height=170)
+        self._list.pack(fill="both", expand=True, padx=20)
+        self._show_jobs(jobs)
+
+        # add form
+        form = ctk.CTkFrame(outer, fg_color="transparent")
+        form.pack(fill="x", padx=20, pady=(12, 0))
+        self.name_entry = self._entry(form, "Job name", 130)
+        self.when_entry = self._entry(form, "every 15m / cron */5 * * * * / 2026-05-01 09:30", 250)
+        if default_name:
+            self.name_entry.insert(0, default_name)
+        self.add_btn = ctk.CTkButton(
+            form, text="Add", width=64, height=34,
+            fg_color=ACCENT, hover_color=ACCENT_HOVER, text_color="#0f1117",
+            font=ctk.CTkFont(family=FAMILY, size=12, weight="bold"),
+            corner_radius=RADIUS_MD, command=self._add,
+            state="normal" if can_add else "disabled",
+        )
+        self.add_btn.pack(side="left")
+
+        hint = ("Runs the saved file with the current speed and loop settings."
+                if can_add else "Save the script first \u2014 jobs run the saved file.")
+        self._message = ctk.CTkLabel(
+            outer, text=hint,
+            font=ctk.CTkFont(family=FAMILY, size=11),
+            text_color=TEXT_DIM, anchor="w",
+        )
+        self._message.pack(fill="x", padx=20, pady=(6, 0))
+
+        btn_row = ctk.CTkFrame(outer, fg_color="transparent")
+        btn_row.pack(fill="x", padx=20, pady=(8, 16))
+        ctk.CTkButton(
+            btn_row, text="Close", width=80, height=34,
+            fg_color=NEUTRAL, hover_color=NEUTRAL_HOVER, text_color=TEXT_SEC,
+            font=ctk.CTkFont(family=FAMILY, size=12), corner_radius=RADIUS_MD,
+            command=self._close,
+        ).pack(side="right")
+
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        self.focus_force()
+        self.wait_window()
+
+    def _entry(self, parent, placeholder: str, width: int):
+        entry = ctk.CTkEntry(
+            parent, width=width, height=34,
+            placeholder_text=placeholder,
+            fg_color=BG_INPUT, border_color=BORDER, border_width=1,
+            text_color=TEXT,
+            font=ctk.CTkFont(family=FAMILY, size=12),
+            corner_radius=RADIUS_SM,
+        )
+        entry.pack(side="left", padx=(0, 6))
+        return entry
+
+    def _show_jobs(self, jobs):
+        from datetime import datetime
+
+        for child in self._list.winfo_children():
+            child.destroy()
+        if not jobs:
+            ctk.CTkLabel(
+                self._list, text="Nothing scheduled yet.",
+                font=ctk.CTkFont(family=FAMILY, size=12), text_color=TEXT_DIM, anchor="w",
+            ).pack(fill="x", padx=8, pady=6)
+        for job in jobs:
+            row = ctk.CTkFrame(self._list, fg_color="transparent")
+            row.pack(fill="x", pady=2)
+            next_run = (datetime.fromtimestamp(job.next_run).strftime("%m-%d %H:%M:%S")
+                        if job.next_run else "\u2014")
+            ctk.CTkLabel(
+                row, text=f"{job.name}  \u00b7  {job.when}  \u00b7  next {next_run}",
+                font=ctk.CTkFont(family=FAMILY, size=12), text_color=TEXT_SEC, anchor="w",
+            ).pack(side="left", fill="x", expand=True, padx=(8, 0))
+            ctk.CTkButton(
+                row, text="Remove", width=64, height=26,
+                fg_color="transparent", hover_color=RED_HOVER, text_color=RED,
+                border_color=BORDER, border_width=1,
+                font=ctk.CTkFont(family=FAMILY, size=11), corner_radius=RADIUS_SM,
+                command=lambda name=job.name: self._remove(name),
+            ).pack(side="right", padx=(6, 4))
+
+    def _add(self):
+        name = self.name_entry.get().strip()
+        when = self.when_entry.get().strip()
+        if not name or not when:
+            self._message.configure(text="Enter a job name and when to run it.", text_color=AMBER)
+            return
+        error, jobs = self._on_add(name, when)
+        if error:
+            self._message.configure(text=error, text_color=AMBER)
+            return
+        self.when_entry.delete(0, "end")
+        self._message.configure(text=f"Scheduled \u201c{name}\u201d.", text_color=TEXT_DIM)
+        self._show_jobs(jobs)
+
+    def _remove(self, name: str):
+        self._show_jobs(self._on_remove(name))
+
+    def _close(self):
+        self.grab_release()
+        self.destroy()
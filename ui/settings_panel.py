@@ -1,6 +1,4 @@
 import customtkinter as ctk
-import keyboard
-import pyautogui
 from ui.theme import (
     BG_BASE, BG_SURFACE, BG_INPUT, BG_ELEVATED, BORDER, ACCENT, ACCENT_HOVER,
     NEUTRAL, NEUTRAL_HOVER, AMBER,
@@ -74,6 +72,7 @@ class _HotkeyPicker(ctk.CTkFrame):
         self._listening = True
         self._key_label.configure(text="...", fg_color=AMBER, text_color="#1a1a1a")
         self._change_btn.configure(text="Press key", state="disabled")
+        import keyboard
         self._hook = keyboard.on_press(self._on_key_press, suppress=False)
 
     def _on_key_press(self, event):
@@ -88,6 +87,7 @@ class _HotkeyPicker(ctk.CTkFrame):
         self._listening = False
 
         if self._hook is not None:
+            import keyboard
             try:
                 keyboard.unhook(self._hook)
             except Exception:
@@ -115,7 +115,7 @@ class _HotkeyDialog(ctk.CTkToplevel):
 
         self._on_save = on_save
 
-        w, h = 340, 430
+        w, h = 340, 500
         self.geometry(f"{w}x{h}")
         try:
             px = parent.winfo_rootx() + parent.winfo_width() // 2 - w // 2
@@ -156,7 +156,13 @@ class _HotkeyDialog(ctk.CTkToplevel):
             outer, label="Start / Stop Playback", hint="Toggles script playback",
             default=current_values.get("play_stop", "F8"),
         )
-        self._play_stop.pack(fill="x", padx=20, pady=(0, 14))
+        self._play_stop.pack(fill="x", padx=20, pady=(0, 10))
+
+        self._pause = _HotkeyPicker(
+            outer, label="Pause / Resume", hint="Holds playback and picks it up again",
+            default=current_values.get("pause", "F9"),
+        )
+        self._pause.pack(fill="x", padx=20, pady=(0, 14))
 
         ctk.CTkButton(
             outer, text="Done", width=80, height=32,
@@ -175,6 +181,7 @@ class _HotkeyDialog(ctk.CTkToplevel):
             "capture": self._capture.value,
             "quick_add": self._quick_add.value,
             "play_stop": self._play_stop.value,
+            "pause": self._pause.value,
         }
         self.grab_release()
         self.destroy()
@@ -187,6 +194,8 @@ class SettingsPanel(ctk.CTkFrame):
         super().__init__(master, fg_color=BG_SURFACE, corner_radius=RADIUS_LG, **kwargs)
 
         self.on_hotkey_change = None
+        self.on_export_timing = None    # called with no args from the Export button
+        self.on_isolated_change = None  # called with no args when "separate process" is toggled
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -344,7 +353,49 @@ class SettingsPanel(ctk.CTkFrame):
             border_color=BORDER, border_width=2,
             checkbox_height=18, checkbox_width=18,
         )
-        self.dry_run_check.grid(row=row, column=0, padx=16, pady=(0, 10), sticky="w")
+        self.dry_run_check.grid(row=row, column=0, padx=16, pady=(0, 6), sticky="w")
+        row += 1
+
+        self.isolated_var = ctk.BooleanVar(value=False)
+        self.isolated_check = ctk.CTkCheckBox(
+            inner, text="Play in separate process",
+            variable=self.isolated_var,
+            command=lambda: self.on_isolated_change and self.on_isolated_change(),
+            font=ctk.CTkFont(family=FAMILY, size=12), text_color=TEXT_SEC,
+            fg_color=ACCENT, hover_color=ACCENT,
+            border_color=BORDER, border_width=2,
+            checkbox_height=18, checkbox_width=18,
+        )
+        self.isolated_check.grid(row=row, column=0, padx=16, pady=(0, 10), sticky="w")
+        row += 1
+
+        # divider
+        ctk.CTkFrame(inner, fg_color=BORDER, height=1).grid(
+            row=row, column=0, padx=16, pady=(0, 8), sticky="ew"
+        )
+        row += 1
+
+        # ── last run timing ──
+        _SectionLabel(inner, text="Last Run").grid(
+            row=row, column=0, padx=16, pady=(0, 4), sticky="w"
+        )
+        row += 1
+
+        self._timing_label = ctk.CTkLabel(
+            inner, text="No run yet", justify="left", anchor="w",
+            font=ctk.CTkFont(family=FAMILY, size=11), text_color=TEXT_DIM,
+        )
+        self._timing_label.grid(row=row, column=0, padx=16, pady=(0, 6), sticky="w")
+        row += 1
+
+        self.export_timing_btn = ctk.CTkButton(
+            inner, text="Export Timing\u2026", width=130, height=28, state="disabled",
+            fg_color=NEUTRAL, hover_color=NEUTRAL_HOVER, text_color=TEXT_SEC,
+            font=ctk.CTkFont(family=FAMILY, size=11),
+            corner_radius=RADIUS_SM,
+            command=lambda: self.on_export_timing and self.on_export_timing(),
+        )
+        self.export_timing_btn.grid(row=row, column=0, padx=16, pady=(0, 10), sticky="w")
         row += 1
 
         # divider
@@ -426,9 +477,25 @@ class SettingsPanel(ctk.CTkFrame):
         self._hotkey_capture = "F6"
         self._hotkey_quick_add = "F7"
         self._hotkey_play_stop = "F8"
+        self._hotkey_pause = "F9"
 
         self._update_hotkey_summary()
 
+    def show_timing(self, summary: dict):
+        """Show a PlaybackTelemetry summary: how late steps landed and where the time went."""
+        if not summary["steps"]:
+            return
+        late, backend = summary["late"], summary["backend"]
+        lines = [
+            f"{summary['steps']} steps, late (ms)",
+            f"p50 {late['p50_ms']:.2f}  p95 {late['p95_ms']:.2f}",
+            f"p99 {late['p99_ms']:.2f}  max {late['max_ms']:.2f}",
+        ]
+        if backend["count"]:
+            lines.append(f"input call p95 {backend['p95_ms']:.2f} ms")
+        self._timing_label.configure(text="\n".join(lines), text_color=TEXT_SEC)
+        self.export_timing_btn.configure(state="normal")
+
     def _open_hotkey_dialog(self):
         _HotkeyDialog(
             self.winfo_toplevel(),
@@ -436,6 +503,7 @@ class SettingsPanel(ctk.CTkFrame):
                 "capture": self._hotkey_capture,
                 "quick_add": self._hotkey_quick_add,
                 "play_stop": self._hotkey_play_stop,
+                "pause": self._hotkey_pause,
             },
             on_save=self._on_hotkeys_saved,
         )
@@ -444,12 +512,14 @@ class SettingsPanel(ctk.CTkFrame):
         self._hotkey_capture = values["capture"]
         self._hotkey_quick_add = values["quick_add"]
         self._hotkey_play_stop = values["play_stop"]
+        self._hotkey_pause = values["pause"]
         self._update_hotkey_summary()
         self._notify_hotkey_change()
 
     def _update_hotkey_summary(self):
         self._hotkey_summary.configure(
-            text=f"{self._hotkey_capture} / {self._hotkey_quick_add} / {self._hotkey_play_stop}"
+            text=(f"{self._hotkey_capture} / {self._hotkey_quick_add} / "
+                  f"{self._hotkey_play_stop} / {self._hotkey_pause}")
         )
 
     def _auto_scrollbar(self):
@@ -472,7 +542,8 @@ class SettingsPanel(ctk.CTkFrame):
 
     def _poll_cursor(self):
         try:
-            x, y = pyautogui.position()
+            # Tk's pointer query is cheap and avoids importing pyautogui at startup
+            x, y = self.winfo_pointerxy()
             self._cursor_label.configure(text=f"X: {x}   Y: {y}")
         except Exception:
             pass
@@ -518,6 +589,10 @@ class SettingsPanel(ctk.CTkFrame):
     def dry_run(self) -> bool:
         return self.dry_run_var.get()
 
+    @property
+    def isolated_playback(self) -> bool:
+        return self.isolated_var.get()
+
     @property
     def quick_add_hotkey(self) -> str:
         return self._hotkey_quick_add
@@ -525,3 +600,7 @@ class SettingsPanel(ctk.CTkFrame):
     @property
     def play_stop_hotkey(self) -> str:
         return self._hotkey_play_stop
+
+    @property
+    def pause_hotkey(self) -> str:
+        return self._hotkey_pause
@@ -0,0 +1,218 @@
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+from utils.file_io import GHOSTCLICK_EXT, save_script
+
+AUTOSAVE_DEBOUNCE = 2.0     # seconds of quiet after the last edit before a journal write
+AUTOSAVE_DIR = os.path.join(os.path.expanduser("~"), ".ghostclick", "autosave")
+JOURNAL_PREFIX = "journal-"
+
+
+def _journal_pid(name: str) -> int | None:
+    """PID of the session that owns a journal-<pid>-<time> file name."""
+    try:
+        return int(name[len(JOURNAL_PREFIX):].split("-", 1)[0])
+    except ValueError:
+        return None
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    if sys.platform == "win32":
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)   # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return kernel32.GetLastError() == 5   # access denied: it exists
+        try:
+            code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+            return code.value == 259              # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True    # exists, owned by someone else
+    return True
+
+
+def find_journals(directory: str = AUTOSAVE_DIR) -> list[tuple[str, dict]]:
+    """
+    Autosave journals left in directory by sessions that are no longer
+    running, as (path, meta), newest first. Another open GhostClick's
+    journal is its live crash protection, so it is never listed.
+    """
+    from utils.binary_format import BinaryScriptReader
+
+    found = []
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return found
+    for name in names:
+        if not (name.startswith(JOURNAL_PREFIX) and name.endswith(GHOSTCLICK_EXT)):
+            continue
+        pid = _journal_pid(name)
+        if pid is not None and _pid_alive(pid):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            with BinaryScriptReader(path) as reader:
+                found.append((path, reader.meta))
+        except (OSError, ValueError):
+            continue   # half-written or foreign file; nothing to recover from it
+    found.sort(key=lambda item: item[1].get("autosaved_at", 0), reverse=True)
+    return found
+
+
+def discard_journal(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class AutosaveService:
+    """
+    Writes script snapshots on one background thread so saving never blocks
+    the Tk loop. Explicit saves run in order; autosaves to this session's
+    journal are debounced so a burst of edits produces a single write.
+    All files are written to a temp file and renamed into place.
+    """
+
+    def __init__(self, directory: str = AUTOSAVE_DIR, debounce: float = AUTOSAVE_DEBOUNCE):
+        self.directory = directory
+        self.debounce = debounce
+        self.journal_path = os.path.join(
+            directory, f"{JOURNAL_PREFIX}{os.getpid()}-{int(time.time())}{GHOSTCLICK_EXT}"
+        )
+        self._cond = threading.Condition()
+        self._saves = deque()          # (snapshot, path, binary, on_done)
+        self._pending = None           # (snapshot, source_path) waiting out the debounce
+        self._due = 0.0
+        self._journal_revision = None  # revision currently in the journal file
+        self._active = 0               # jobs taken off the queue but not finished
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+        self.on_error = None           # called with (message,) from the worker thread
+
+    @property
+    def busy(self) -> bool:
+        """True while any save or autosave is queued or being written."""
+        with self._cond:
+            return bool(self._saves or self._pending or self._active)
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True, name="autosave")
+            self._thread.start()
+
+    def autosave(self, script, source_path: str | None = None):
+        """Snapshot script now; write it to the journal once edits settle."""
+        snapshot = script.snapshot()
+        with self._cond:
+            if self._closed:
+                return
+            self._pending = (snapshot, source_path)
+            self._due = time.monotonic() + self.debounce
+            self._ensure_thread()
+            self._cond.notify()
+
+    def save(self, script, path: str, binary: bool = False, on_done=None):
+        """
+        Queue an explicit save of a snapshot of script. on_done is called from
+        the worker thread with (saved_path, error_message_or_None).
+        """
+        snapshot = script.snapshot()
+        with self._cond:
+            self._saves.append((snapshot, path, binary, on_done))
+            self._ensure_thread()
+            self._cond.notify()
+
+    def close(self, timeout: float | None = 5.0):
+        """Finish queued saves, drop any pending autosave and remove the journal."""
+        with self._cond:
+            self._closed = True
+            self._pending = None
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        discard_journal(self.journal_path)
+
+    def _next_job(self):
+        with self._cond:
+            while True:
+                if self._saves:
+                    self._active += 1
+                    return "save", self._saves.popleft()
+                if self._closed:
+                    return None
+                if self._pending is None:
+                    self._cond.wait()
+                    continue
+                remaining = self._due - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                job, self._pending = self._pending, None
+                self._active += 1
+                return "autosave", job
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            kind, args = job
+            try:
+                if kind == "save":
+                    self._write_save(*args)
+                else:
+                    self._write_journal(*args)
+            finally:
+                with self._cond:
+                    self._active -= 1
+
+    def _write_save(self, snapshot, path, binary, on_done):
+        error = None
+        try:
+            path = save_script(snapshot, path, binary=binary)
+        except Exception as e:
+            error = str(e)
+        else:
+            # the saved file now holds everything the journal did (or more)
+            with self._cond:
+                stale = self._journal_revision is not None and self._journal_revision <= snapshot.revision
+                if stale:
+                    self._journal_revision = None
+                if self._pending is not None and self._pending[0].revision <= snapshot.revision:
+                    self._pending = None
+            if stale:
+                discard_journal(self.journal_path)
+        if on_done:
+            on_done(path, error)
+
+    def _write_journal(self, snapshot, source_path):
+        meta = {
+            "autosave_source": source_path or "",
+            "autosaved_at": time.time(),
+            "autosave_revision": snapshot.revision,
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            save_script(snapshot, self.journal_path, binary=True, meta=meta)
+        except Exception as e:
+            if self.on_error:
+                self.on_error(f"Autosave failed: {e}")
+            return
+        with self._cond:
+            self._journal_revision = snapshot.revision
@@ -0,0 +1,307 @@
+import json
+import struct
+import sys
+import zlib
+from array import array
+
+from core.script import ClickEntry
+
+# Binary .ghostclick container (little-endian):
+#
+#   header     magic, format version, flags, step count, then (offset, length)
+#              for each section below — patched in when the writer closes
+#   records    one fixed-width RECORD per step, in order
+#   paths      every path step's (x, y, dt) doubles, back to back
+#   strings    JSON list; labels, click types and easings are indices into it
+#   meta       JSON object with script-level fields (name, version, repeat_count)
+#   timeline   (version 2+) optional int64 recorded start of each step in ns,
+#              empty when the script has none
+#
+# With FLAG_ZLIB each section is compressed independently, so records can
+# still be streamed with an incremental decompressor.
+
+MAGIC = b"GHCK"
+FORMAT_VERSION = 2
+FLAG_ZLIB = 1
+
+SECTIONS = ("records", "paths", "strings", "meta", "timeline")
+# sections present in each format version; older files are still readable
+VERSION_SECTIONS = {1: SECTIONS[:4], 2: SECTIONS}
+PREFIX = struct.Struct("<4sHHQ")
+HEADER = struct.Struct(PREFIX.format + "QQ" * len(SECTIONS))
+
+# x, y, delay_before, path start (in doubles), path length (in doubles),
+# label, click_type, easing (string indices), step flags, 3 pad bytes
+RECORD = struct.Struct("<iidQIIHHBxxx")
+MAX_STRINGS = 1 << 16   # string indices are uint16
+
+STEP_RETURN = 1
+STEP_MOVE_TO = 2
+STEP_HAS_PATH = 4
+
+READ_CHUNK_RECORDS = 4096
+
+
+class FormatError(ValueError):
+    pass
+
+
+def is_binary_file(filepath: str) -> bool:
+    with open(filepath, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def parse_header(raw) -> dict:
+    """
+    Decode the header at the start of raw. Sections a file's version doesn't
+    have come back as (0, 0), i.e. empty.
+    """
+    if len(raw) < PREFIX.size:
+        raise FormatError("file is too short to be a binary GhostClick script")
+    magic, version, flags, count = PREFIX.unpack_from(raw)
+    if magic != MAGIC:
+        raise FormatError("not a binary GhostClick script")
+    if version > FORMAT_VERSION:
+        raise FormatError(f"binary format version {version} is newer than this build supports")
+    names = VERSION_SECTIONS.get(version, SECTIONS[:4])
+    layout = struct.Struct("<" + "QQ" * len(names))
+    if len(raw) < PREFIX.size + layout.size:
+        raise FormatError("file is too short to be a binary GhostClick script")
+    flat = layout.unpack_from(raw, PREFIX.size)
+    sections = dict.fromkeys(SECTIONS, (0, 0))
+    sections.update((name, (flat[2 * i], flat[2 * i + 1])) for i, name in enumerate(names))
+    return {
+        "version": version,
+        "compressed": bool(flags & FLAG_ZLIB),
+        "step_count": count,
+        "header_size": PREFIX.size + layout.size,
+        "sections": sections,
+    }
+
+
+def _doubles_to_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array("d", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _bytes_to_doubles(data: bytes) -> array:
+    values = array("d")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _ints_to_bytes(values) -> bytes:
+    values = array("q", values)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _bytes_to_ints(data: bytes) -> array:
+    values = array("q")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def decode_record(fields, strings: list[str], paths) -> ClickEntry:
+    """Build a ClickEntry from unpacked RECORD fields."""
+    x, y, delay, path_start, path_len, label, click_type, easing, flags = fields
+    path = None
+    if flags & STEP_HAS_PATH:
+        path = array("d", paths[path_start:path_start + path_len])
+    try:
+        return ClickEntry(
+            x=x, y=y,
+            click_type=strings[click_type],
+            delay_before=delay,
+            return_cursor=bool(flags & STEP_RETURN),
+            label=strings[label],
+            move_to=bool(flags & STEP_MOVE_TO),
+            path=path,
+            easing=strings[easing],
+        )
+    except ValueError as e:
+        raise FormatError(str(e)) from None
+
+
+class BinaryScriptWriter:
+    """Streams steps to disk; only the string table and path data stay in memory."""
+
+    def __init__(self, filepath: str, meta: dict, compress: bool = True):
+        self._f = open(filepath, "wb")
+        self._meta = dict(meta)
+        self._compress = compress
+        self._strings: list[str] = [""]
+        self._string_ids: dict[str, int] = {"": 0}
+        self._paths = array("d")
+        self._count = 0
+        self._zip = zlib.compressobj() if compress else None
+        self._records_len = 0
+        self.timeline = None    # recorded step starts (ns); written on close if set
+
+        self._f.write(b"\0" * HEADER.size)   # placeholder until close()
+
+    def _string_id(self, text: str) -> int:
+        sid = self._string_ids.get(text)
+        if sid is None:
+            sid = len(self._strings)
+            if sid >= MAX_STRINGS:
+                # fail here with a clear message rather than a struct.error from RECORD.pack
+                raise ValueError(
+                    f"binary scripts hold at most {MAX_STRINGS} distinct labels, click types "
+                    "and easings; save this one as JSON"
+                )
+            self._strings.append(text)
+            self._string_ids[text] = sid
+        return sid
+
+    def _write_raw(self, data: bytes):
+        if self._zip is not None:
+            data = self._zip.compress(data)
+        self._f.write(data)
+        self._records_len += len(data)
+
+    def write_step(self, entry: ClickEntry):
+        flags = (STEP_RETURN if entry.return_cursor else 0) | (STEP_MOVE_TO if entry.move_to else 0)
+        path_start = len(self._paths)
+        path_len = 0
+        if entry.path is not None:
+            flags |= STEP_HAS_PATH
+            self._paths.extend(entry.path)
+            path_len = len(entry.path)
+
+        self._write_raw(RECORD.pack(
+            int(entry.x), int(entry.y), float(entry.delay_before),
+            path_start, path_len,
+            self._string_id(entry.label),
+            self._string_id(entry.click_type),
+            self._string_id(entry.easing),
+            flags,
+        ))
+        self._count += 1
+
+    def write_steps(self, entries):
+        for entry in entries:
+            self.write_step(entry)
+
+    def _write_section(self, data: bytes) -> tuple[int, int]:
+        if self._compress:
+            data = zlib.compress(data)
+        offset = self._f.tell()
+        self._f.write(data)
+        return offset, len(data)
+
+    def close(self):
+        if self._f.closed:
+            return
+        if self._zip is not None:
+            tail = self._zip.flush()
+            self._f.write(tail)
+            self._records_len += len(tail)
+
+        sections = [(HEADER.size, self._records_len)]
+        sections.append(self._write_section(_doubles_to_bytes(self._paths)))
+        sections.append(self._write_section(json.dumps(self._strings).encode("utf-8")))
+        sections.append(self._write_section(json.dumps(self._meta).encode("utf-8")))
+        timeline = self.timeline
+        if timeline is not None and len(timeline) != self._count:
+            timeline = None   # doesn't describe these steps
+        sections.append(self._write_section(_ints_to_bytes(() if timeline is None else timeline)))
+
+        flat = [v for pair in sections for v in pair]
+        self._f.seek(0)
+        self._f.write(HEADER.pack(
+            MAGIC, FORMAT_VERSION, FLAG_ZLIB if self._compress else 0, self._count, *flat,
+        ))
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BinaryScriptReader:
+    """
+    Reads the header, string table, meta and path data up front, then yields
+    steps from the records section in chunks without building the full list.
+    """
+
+    def __init__(self, filepath: str):
+        self._f = open(filepath, "rb")
+        try:
+            self._read_header()
+        except Exception:
+            self._f.close()
+            raise
+
+    def _read_header(self):
+        header = parse_header(self._f.read(HEADER.size))
+        self.format_version = header["version"]
+        self.compressed = header["compressed"]
+        self.step_count = header["step_count"]
+        self._sections = header["sections"]
+        self.strings: list[str] = json.loads(self._read_section("strings"))
+        self.meta: dict = json.loads(self._read_section("meta"))
+        self.paths = _bytes_to_doubles(self._read_section("paths"))
+        timeline = _bytes_to_ints(self._read_section("timeline"))
+        self.timeline = timeline if len(timeline) == self.step_count and self.step_count else None
+
+    def _read_section(self, name: str) -> bytes:
+        offset, length = self._sections[name]
+        if not length:
+            return b""
+        self._f.seek(offset)
+        data = self._f.read(length)
+        return zlib.decompress(data) if self.compressed else data
+
+    def _decode(self, fields) -> ClickEntry:
+        return decode_record(fields, self.strings, self.paths)
+
+    def _record_chunks(self):
+        offset, length = self._sections["records"]
+        self._f.seek(offset)
+        chunk_size = RECORD.size * READ_CHUNK_RECORDS
+        unzip = zlib.decompressobj() if self.compressed else None
+        remaining = length
+        pending = b""
+        while remaining > 0:
+            data = self._f.read(min(chunk_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            if unzip is not None:
+                data = unzip.decompress(data)
+            pending += data
+            usable = len(pending) - len(pending) % RECORD.size
+            if usable:
+                yield pending[:usable]
+                pending = pending[usable:]
+        if unzip is not None:
+            pending += unzip.flush()
+        if len(pending) >= RECORD.size:
+            yield pending[:len(pending) - len(pending) % RECORD.size]
+
+    def __iter__(self):
+        for chunk in self._record_chunks():
+            for fields in RECORD.iter_unpack(chunk):
+                yield self._decode(fields)
+
+    def __len__(self):
+        return self.step_count
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
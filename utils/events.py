@@ -0,0 +1,88 @@
+import threading
+from collections import deque
+
+DEFAULT_MAX_DEPTH = 4096
+
+
+class EventChannel:
+    """
+    Bounded multi-producer / single-consumer queue between worker threads and
+    the Tk main loop. Producers call post() from any thread; the UI drains it
+    from one periodic after() pump.
+
+    Coalesced kinds keep only their latest payload while still pending (e.g.
+    the current step index). Batched kinds come out of drain() as one event
+    whose payload is the list of consecutive payloads (e.g. recorded entries).
+    """
+
+    def __init__(self, coalesce=(), batch=(), max_depth: int = DEFAULT_MAX_DEPTH):
+        self._queue = deque()               # of [kind, payload] holders
+        self._pending: dict[str, list] = {} # coalesced kind -> holder still in the queue
+        self._lock = threading.Lock()       # only taken for coalesced kinds
+        self._coalesce = frozenset(coalesce)
+        self._batch = frozenset(batch)
+        self.max_depth = max_depth
+
+        self.posted = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.peak_depth = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def post(self, kind: str, payload=None):
+        self.posted += 1
+        if kind in self._coalesce:
+            with self._lock:
+                holder = self._pending.get(kind)
+                if holder is not None:
+                    holder[1] = payload
+                    self.coalesced += 1
+                    return
+                holder = [kind, payload]
+                self._pending[kind] = holder
+            self._queue.append(holder)
+        else:
+            if len(self._queue) >= self.max_depth:
+                self.dropped += 1
+                return
+            # deque.append is atomic, so plain events need no lock
+            self._queue.append([kind, payload])
+
+        depth = len(self._queue)
+        if depth > self.peak_depth:
+            self.peak_depth = depth
+
+    def drain(self, limit: int | None = None) -> list[tuple[str, object]]:
+        """Pop pending events in order, merging consecutive batched kinds."""
+        out: list[tuple[str, object]] = []
+        taken = 0
+        queue = self._queue
+        while queue and (limit is None or taken < limit):
+            holder = queue.popleft()
+            taken += 1
+            kind = holder[0]
+            if kind in self._coalesce:
+                with self._lock:
+                    self._pending.pop(kind, None)
+                    payload = holder[1]
+                out.append((kind, payload))
+            elif kind in self._batch:
+                if out and out[-1][0] == kind:
+                    out[-1][1].append(holder[1])
+                else:
+                    out.append((kind, [holder[1]]))
+            else:
+                out.append((kind, holder[1]))
+        return out
+
+    def stats(self) -> dict:
+        return {
+            "depth": self.depth,
+            "peak_depth": self.peak_depth,
+            "posted": self.posted,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
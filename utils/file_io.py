@@ -1,27 +1,155 @@
 import json
 import os
+import tempfile
+from contextlib import contextmanager
 from core.script import Script
+from utils.binary_format import (
+    HEADER, BinaryScriptReader, BinaryScriptWriter, is_binary_file, parse_header,
+)
 
 GHOSTCLICK_EXT = ".ghostclick"
+MAP_THRESHOLD_BYTES = 64 * 1024 * 1024   # open uncompressed binaries this big read-only
 
 
-def save_script(script: Script, filepath: str) -> str:
+@contextmanager
+def atomic_path(filepath: str):
+    """
+    Yield a temp path in the same directory. If the block finishes, the temp
+    file is flushed to disk and renamed over filepath in one step, so readers
+    (and a crash) only ever see the old file or the complete new one.
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp = tempfile.mkstemp(prefix=".~", suffix=".tmp", dir=directory)
+    os.close(fd)
+    try:
+        yield tmp
+        with open(tmp, "r+b") as f:
+            os.fsync(f.fileno())
+        # mkstemp files are owner-only; keep the permissions a plain open() would give
+        mode = os.stat(filepath).st_mode if os.path.exists(filepath) else 0o644
+        os.chmod(tmp, mode & 0o777)
+        os.replace(tmp, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def save_script(script: Script, filepath: str, binary: bool = False, compress: bool = True,
+                meta: dict | None = None) -> str:
+    """
+    Save as JSON (the default, hand-editable) or as the compact binary
+    container. Both use the .ghostclick extension; load_script tells them apart.
+    Extra meta keys are stored alongside name/version and ignored on load.
+    """
     if not filepath.endswith(GHOSTCLICK_EXT):
         filepath += GHOSTCLICK_EXT
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(script.to_dict(), f, indent=2)
+    with atomic_path(filepath) as tmp:
+        if binary:
+            with BinaryScriptWriter(tmp, _script_meta(script, meta), compress=compress) as writer:
+                writer.timeline = script.timeline
+                writer.write_steps(script.steps)
+        else:
+            data = script.to_dict()
+            if meta:
+                data.update((k, v) for k, v in meta.items() if k not in data)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
 
     return filepath
 
 
-def load_script(filepath: str) -> Script:
+def _script_meta(script: Script, extra: dict | None = None) -> dict:
+    meta = dict(extra) if extra else {}
+    meta.update({
+        "version": script.version,
+        "name": script.name,
+        "repeat_count": script.repeat_count,
+    })
+    return meta
+
+
+def _script_from_meta(meta: dict) -> Script:
+    script = Script(name=meta.get("name", "Untitled"))
+    script.version = meta.get("version", "1.0")
+    script.repeat_count = meta.get("repeat_count", 1)
+    return script
+
+
+def is_mappable(filepath: str) -> bool:
+    """True for uncompressed binary files, which can be opened as a MappedScript."""
+    with open(filepath, "rb") as f:
+        raw = f.read(HEADER.size)
+    try:
+        return not parse_header(raw)["compressed"]
+    except ValueError:
+        return False
+
+
+def load_script(filepath: str, mapped: bool | None = None) -> Script:
+    """
+    mapped=True opens an uncompressed binary file as a read-only, memory-mapped
+    MappedScript; None does so only for files over MAP_THRESHOLD_BYTES.
+    """
+    if mapped is None:
+        mapped = os.path.getsize(filepath) >= MAP_THRESHOLD_BYTES and is_mappable(filepath)
+    if mapped:
+        from utils.mapped_script import MappedScript
+
+        return MappedScript(filepath)
+
+    if is_binary_file(filepath):
+        with BinaryScriptReader(filepath) as reader:
+            script = _script_from_meta(reader.meta)
+            script.steps = list(reader)
+            if reader.timeline is not None:
+                script.attach_timeline(reader.timeline)
+        return script
+
     with open(filepath, "r", encoding="utf-8") as f:
         data = json.load(f)
 
     return Script.from_dict(data)
 
 
+def iter_steps(filepath: str):
+    """
+    Yield a script's steps one at a time. Binary files are streamed from disk;
+    JSON has to be parsed whole first, so it only saves the ClickEntry list.
+    """
+    if is_binary_file(filepath):
+        with BinaryScriptReader(filepath) as reader:
+            yield from reader
+        return
+
+    from core.script import ClickEntry
+
+    with open(filepath, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    for step in data.get("steps", []):
+        yield ClickEntry.from_dict(step)
+
+
+def convert_script(src: str, dst: str, binary: bool = True, compress: bool = True) -> str:
+    """Convert between JSON and binary .ghostclick. Binary sources are streamed."""
+    if not dst.endswith(GHOSTCLICK_EXT):
+        dst += GHOSTCLICK_EXT
+    if os.path.abspath(src) == os.path.abspath(dst):
+        raise ValueError("source and destination must be different files")
+
+    if binary and is_binary_file(src):
+        with BinaryScriptReader(src) as reader, atomic_path(dst) as tmp:
+            with BinaryScriptWriter(tmp, reader.meta, compress=compress) as writer:
+                writer.timeline = reader.timeline
+                writer.write_steps(reader)
+        return dst
+
+    return save_script(load_script(src), dst, binary=binary, compress=compress)
+
+
 def get_recent_dir():
     """Return the last directory used, or fall back to Desktop."""
     return os.path.join(os.path.expanduser("~"), "Desktop")
@@ -0,0 +1,120 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+DEFAULT_STORE = os.path.join(os.path.expanduser("~"), ".ghostclick", "schedules.db")
+SQLITE_TIMEOUT = 5.0    # seconds to wait on a store another process is writing
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    name          TEXT PRIMARY KEY,
+    script_path   TEXT NOT NULL,
+    trigger       TEXT NOT NULL,
+    speed         REAL NOT NULL DEFAULT 1.0,
+    repeat        INTEGER,
+    misfire_grace INTEGER NOT NULL,
+    coalesce      INTEGER NOT NULL DEFAULT 1,
+    last_run      REAL,
+    next_run      REAL
+);
+CREATE TABLE IF NOT EXISTS lease (
+    id        INTEGER PRIMARY KEY CHECK (id = 1),
+    owner     TEXT NOT NULL,
+    heartbeat REAL NOT NULL
+);
+"""
+
+_COLUMNS = ("name", "script_path", "trigger", "speed", "repeat",
+            "misfire_grace", "coalesce", "last_run", "next_run")
+
+
+class JobStore:
+    """
+    SQLite table of scheduled jobs, one row per named job, so schedules
+    survive restarts. Rows are plain dicts (trigger decoded from JSON, times
+    as unix seconds). Also holds a single lease row so only one process —
+    the app or the daemon — fires the stored jobs at a time.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE):
+        self.path = path
+        self._lock = threading.Lock()
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with self._db() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _db(self):
+        # a short-lived connection per call: jobs fire on worker threads and
+        # sqlite3 connections can't be shared between threads
+        with self._lock:
+            db = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT)
+            try:
+                with db:
+                    yield db
+            finally:
+                db.close()
+
+    @staticmethod
+    def _row(values) -> dict:
+        row = dict(zip(_COLUMNS, values))
+        row["trigger"] = json.loads(row["trigger"])
+        row["coalesce"] = bool(row["coalesce"])
+        return row
+
+    def rows(self) -> list[dict]:
+        with self._db() as db:
+            cur = db.execute(f"SELECT {', '.join(_COLUMNS)} FROM jobs ORDER BY name")
+            return [self._row(values) for values in cur.fetchall()]
+
+    def get(self, name: str) -> dict | None:
+        with self._db() as db:
+            cur = db.execute(f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE name = ?", (name,))
+            values = cur.fetchone()
+        return self._row(values) if values else None
+
+    def put(self, row: dict):
+        """Insert or redefine a job. last_run is kept; next_run is cleared until it is re-armed."""
+        with self._db() as db:
+            db.execute(
+                "INSERT INTO jobs (name, script_path, trigger, speed, repeat, misfire_grace, coalesce)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(name) DO UPDATE SET script_path = excluded.script_path,"
+                " trigger = excluded.trigger, speed = excluded.speed, repeat = excluded.repeat,"
+                " misfire_grace = excluded.misfire_grace, coalesce = excluded.coalesce,"
+                " next_run = NULL",
+                (row["name"], row["script_path"], json.dumps(row["trigger"]), row["speed"],
+                 row["repeat"], row["misfire_grace"], int(row["coalesce"])),
+            )
+
+    def delete(self, name: str) -> bool:
+        with self._db() as db:
+            return db.execute("DELETE FROM jobs WHERE name = ?", (name,)).rowcount > 0
+
+    def set_run_times(self, name: str, next_run: float | None, last_run: float | None = None):
+        """Record when a job is next due (None = not scheduled) and, if given, when it last fired."""
+        with self._db() as db:
+            if last_run is not None:
+                db.execute("UPDATE jobs SET last_run = ? WHERE name = ?", (last_run, name))
+            db.execute("UPDATE jobs SET next_run = ? WHERE name = ?", (next_run, name))
+
+    def claim(self, owner: str, now: float, stale_after: float) -> bool:
+        """Take or renew the lease. False while another owner's heartbeat is fresh."""
+        with self._db() as db:
+            db.execute("BEGIN IMMEDIATE")
+            values = db.execute("SELECT owner, heartbeat FROM lease WHERE id = 1").fetchone()
+            if values and values[0] != owner and now - values[1] < stale_after:
+                return False
+            db.execute(
+                "INSERT OR REPLACE INTO lease (id, owner, heartbeat) VALUES (1, ?, ?)",
+                (owner, now),
+            )
+            return True
+
+    def release(self, owner: str):
+        with self._db() as db:
+            db.execute("DELETE FROM lease WHERE id = 1 AND owner = ?", (owner,))
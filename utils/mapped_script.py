@@ -0,0 +1,254 @@
+import json
+import mmap
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+
+from core.script import (
+    Script, OPCODES, OP_NONE, OP_PATH, FLAG_MOVE_TO, FLAG_RETURN, compile_path,
+)
+from utils.binary_format import (
+    RECORD, STEP_HAS_PATH, STEP_MOVE_TO, STEP_RETURN,
+    FormatError, decode_record, parse_header, _bytes_to_doubles, _bytes_to_ints,
+)
+
+# A mapped script reads an *uncompressed* binary .ghostclick in place: every
+# step is one fixed-width RECORD at a known offset, so steps[i] is decoded
+# straight out of the page cache. The only thing kept per step is a compiled
+# plan's offsets, 8 bytes each, so seeking can bisect them.
+
+
+class _MappedFile:
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._f = open(filepath, "rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._f.close()
+            raise
+        try:
+            self._open()
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self):
+        header = parse_header(self._mm)
+        if header["compressed"]:
+            raise FormatError(
+                "compressed scripts can't be memory-mapped; "
+                "convert them with 'ghostclick convert --no-compress'"
+            )
+        self.step_count = header["step_count"]
+        sections = header["sections"]
+        self._records_at, records_len = sections["records"]
+        if records_len != self.step_count * RECORD.size:
+            raise FormatError("records section doesn't match the step count")
+
+        self._view = memoryview(self._mm)
+        self.strings: list[str] = json.loads(self._section(sections["strings"]))
+        self.meta: dict = json.loads(self._section(sections["meta"]))
+        offset, length = sections["paths"]
+        if sys.byteorder == "little":
+            self.paths = self._view[offset:offset + length].cast("d")
+        else:
+            self.paths = _bytes_to_doubles(self._section(sections["paths"]))
+        offset, length = sections["timeline"]
+        self.timeline = None
+        if length and length == self.step_count * 8:
+            if sys.byteorder == "little":
+                self.timeline = self._view[offset:offset + length].cast("q")
+            else:
+                self.timeline = _bytes_to_ints(self._section(sections["timeline"]))
+
+    def _section(self, section) -> bytes:
+        offset, length = section
+        return self._mm[offset:offset + length]
+
+    def record(self, index: int) -> tuple:
+        return RECORD.unpack_from(self._mm, self._records_at + index * RECORD.size)
+
+    def records(self, start: int, stop: int):
+        """Unpack records start..stop directly from the mapping."""
+        at = self._records_at
+        return RECORD.iter_unpack(self._view[at + start * RECORD.size:at + stop * RECORD.size])
+
+    def decode(self, fields):
+        return decode_record(fields, self.strings, self.paths)
+
+    def close(self):
+        self.paths = None
+        self.timeline = None
+        self._view = None
+        try:
+            self._mm.close()
+        except BufferError:
+            # an unfinished iterator still holds a slice; the map goes with it
+            pass
+        self._f.close()
+
+
+class MappedSteps(Sequence):
+    """
+    Read-only, lazily decoded view over a mapped file's steps. Slicing returns
+    another view over the same mapping, so nothing is copied until indexed.
+    """
+
+    __slots__ = ("_file", "_range")
+
+    def __init__(self, source: _MappedFile, indices: range | None = None):
+        self._file = source
+        self._range = range(source.step_count) if indices is None else indices
+
+    def __len__(self):
+        return len(self._range)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return MappedSteps(self._file, self._range[index])
+        return self._file.decode(self._file.record(self._range[index]))
+
+    def _fields(self):
+        r = self._range
+        if r.step == 1:
+            return self._file.records(r.start, r.stop)
+        return (self._file.record(i) for i in r)
+
+    def __iter__(self):
+        decode = self._file.decode
+        for fields in self._fields():
+            yield decode(fields)
+
+    def click_types(self):
+        """Click type of each step, without building entries."""
+        strings = self._file.strings
+        for fields in self._fields():
+            yield strings[fields[6]]
+
+
+class _MappedPaths:
+    """step index -> compiled path, decoded when the player reaches it."""
+
+    def __init__(self, source: _MappedFile, speed: float):
+        self._file = source
+        self._speed = speed
+
+    def __getitem__(self, index: int):
+        _, _, _, path_start, path_len, _, _, easing, _ = self._file.record(index)
+        raw = self._file.paths[path_start:path_start + path_len]
+        pxs, pys, pts, _ = compile_path(raw, self._speed)
+        return pxs, pys, pts, self._file.strings[easing]
+
+
+class MappedPlan:
+    """
+    Execution plan streamed from the mapping instead of held in arrays.
+    Yields the same columns as CompiledScript. One pass over the file up
+    front works out duration_ns and each step's offset; the offsets (8 bytes
+    a step) are kept so seeks can bisect them, everything else is read from
+    the mapping as it plays.
+    """
+
+    def __init__(self, source: _MappedFile, speed_multiplier: float = 1.0,
+                 use_timeline: bool = True):
+        self._file = source
+        self.use_timeline = use_timeline
+        self.speed_multiplier = speed_multiplier
+        self._speed = speed_multiplier if speed_multiplier > 0 else 1.0
+        self._ops = [OPCODES.get(s, OP_NONE) for s in source.strings]
+        self.paths = _MappedPaths(source, self._speed)
+        self.offsets, self.duration_ns = self._scan(source.timeline if use_timeline else None)
+
+    def __len__(self):
+        return self._file.step_count
+
+    def __reduce__(self):
+        # pickled as the file it streams from (e.g. for a playback worker), which maps it again
+        return (_open_plan, (self._file.filepath, self.speed_multiplier, self.use_timeline))
+
+    def _scan(self, timeline) -> tuple[array, int]:
+        speed = self._speed
+        ops = self._ops
+        paths = self._file.paths
+        offsets = array("q")
+        total = 0.0
+        for i, (_, _, delay, path_start, path_len, _, click_type, _, step_flags) in \
+                enumerate(self._file.records(0, self._file.step_count)):
+            if timeline is not None:
+                offsets.append(round(timeline[i] / speed))
+                total = timeline[i] / speed / 1e9
+            else:
+                total += max(0.0, delay) / speed
+                offsets.append(round(total * 1e9))
+            op = ops[click_type]
+            if op == OP_NONE:
+                raise FormatError(f"unknown click type {self._file.strings[click_type]!r}")
+            if op == OP_PATH and step_flags & STEP_HAS_PATH and path_len:
+                # summed separately, exactly as compile_path does
+                elapsed = 0.0
+                raw = paths[path_start:path_start + path_len]
+                for j in range(2, len(raw), 3):
+                    elapsed += max(0.0, raw[j]) / speed
+                total += elapsed
+        return offsets, round(total * 1e9)
+
+    def columns(self, start: int = 0):
+        ops = self._ops
+        offsets = self.offsets
+        for i, (x, y, _, _, _, _, click_type, _, step_flags) in \
+                enumerate(self._file.records(start, self._file.step_count), start):
+            yield (
+                offsets[i], x, y, ops[click_type],
+                (FLAG_MOVE_TO if step_flags & STEP_MOVE_TO else 0)
+                | (FLAG_RETURN if step_flags & STEP_RETURN else 0),
+            )
+
+    def offset_at(self, index: int) -> int:
+        return self.offsets[index]
+
+    def step_at(self, position_ns: int) -> int:
+        """First step not yet due position_ns into a loop; len(self) if every step is."""
+        return bisect_left(self.offsets, position_ns)
+
+
+def _open_plan(filepath: str, speed_multiplier: float, use_timeline: bool) -> MappedPlan:
+    return MappedPlan(_MappedFile(filepath), speed_multiplier, use_timeline)
+
+
+class MappedScript(Script):
+    """
+    Read-only Script backed by a memory-mapped binary file. Player and
+    ClickList use it like any other script; edits raise ReadOnlyScriptError.
+    """
+
+    read_only = True
+
+    def __init__(self, filepath: str):
+        self._source = _MappedFile(filepath)
+        meta = self._source.meta
+        super().__init__(name=meta.get("name", "Untitled"))
+        self.version = meta.get("version", "1.0")
+        self.repeat_count = meta.get("repeat_count", 1)
+        self.filepath = filepath
+        self.steps = MappedSteps(self._source)
+        if self._source.timeline is not None:
+            self.attach_timeline(self._source.timeline)
+
+    def compile(self, speed_multiplier: float = 1.0, use_timeline: bool = True) -> MappedPlan:
+        key = (speed_multiplier, use_timeline)
+        if self._compiled is None or self._compiled[0] != key:
+            self._compiled = (key, MappedPlan(self._source, speed_multiplier, use_timeline))
+        return self._compiled[1]
+
+    def close(self):
+        self._compiled = None
+        self._timeline = None
+        self._source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,57 @@
+from array import array
+
+DEFAULT_CAPACITY = 1 << 16
+
+
+class EventRing:
+    """
+    Preallocated single-producer / single-consumer ring of raw input events
+    (t_ns, x, y, kind). push() only stores into typed arrays and bumps a
+    counter, so it is safe to call from an OS hook without locks: under the
+    GIL each store is atomic, and the consumer never reads past `head`,
+    which is only advanced after the slot is written.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._ts = array("q", bytes(8 * capacity))
+        self._xs = array("i", bytes(4 * capacity))
+        self._ys = array("i", bytes(4 * capacity))
+        self._kinds = array("b", bytes(capacity))
+        self.head = 0       # total events written (producer only)
+        self.tail = 0       # total events consumed (consumer only)
+        self.dropped = 0    # events refused because the ring was full
+        self.peak = 0       # most events ever waiting at once
+
+    def __len__(self):
+        return self.head - self.tail
+
+    def push(self, t_ns: int, x: int, y: int, kind: int) -> bool:
+        head = self.head
+        pending = head - self.tail
+        if pending >= self.capacity:
+            self.dropped += 1
+            return False
+        slot = head % self.capacity
+        self._ts[slot] = t_ns
+        self._xs[slot] = x
+        self._ys[slot] = y
+        self._kinds[slot] = kind
+        self.head = head + 1
+        if pending >= self.peak:
+            self.peak = pending + 1
+        return True
+
+    def drain(self):
+        """Yield every event written so far, oldest first, then mark them consumed."""
+        head = self.head
+        cap = self.capacity
+        for n in range(self.tail, head):
+            slot = n % cap
+            yield self._ts[slot], self._xs[slot], self._ys[slot], self._kinds[slot]
+        self.tail = head
+
+    def reset(self):
+        self.head = self.tail = 0
+        self.dropped = 0
+        self.peak = 0